@@ -0,0 +1,7 @@
+"""Benchmarks package - Performance measurements for the todo application.
+
+``python -m benchmarks`` runs the suite of TaskManager operations (see
+``benchmarks.suite``), writes JSON results and compares them to a saved
+baseline. The other modules each measure one feature and can be run on
+their own, e.g. ``python -m benchmarks.bench_journal``.
+"""
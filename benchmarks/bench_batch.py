@@ -0,0 +1,60 @@
+"""Benchmark batched delete_tasks/toggle_tasks against one call per ID.
+
+Each run works on a fresh SQLite database file, where every single-ID
+write is its own transaction and the batch is one.
+Run with: uv run python -m benchmarks.bench_batch --tasks 10000 --batch 500
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from collections.abc import Callable
+
+from src.services.sqlite_storage import SQLiteStorage
+from src.services.task_manager import TaskManager
+
+
+def timed(
+    tasks: int, run: Callable[[TaskManager, list[int]], object], batch: int
+) -> float:
+    """Fill a new database, then time ``run`` on IDs 1..batch."""
+    with tempfile.TemporaryDirectory() as directory:
+        with SQLiteStorage(os.path.join(directory, "tasks.db")) as storage:
+            manager = TaskManager(storage)
+            manager.add_tasks({"title": f"Task {n}"} for n in range(tasks))
+            ids = list(range(1, batch + 1))
+            start = time.perf_counter()
+            run(manager, ids)
+            return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print the time per operation for single-ID and batched calls."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    
+    workloads = {
+        "delete": (
+            lambda manager, ids: [manager.delete_task(i) for i in ids],
+            lambda manager, ids: manager.delete_tasks(ids),
+        ),
+        "toggle": (
+            lambda manager, ids: [manager.toggle_complete(i) for i in ids],
+            lambda manager, ids: manager.toggle_tasks(ids),
+        ),
+    }
+    for name, (single, batched) in workloads.items():
+        one = min(timed(args.tasks, single, args.batch) for _ in range(args.repeat))
+        many = min(timed(args.tasks, batched, args.batch) for _ in range(args.repeat))
+        print(
+            f"{name:<6} {args.batch} IDs: one by one {one * 1e3:8.1f} ms, "
+            f"batched {many * 1e3:7.1f} ms ({one / many:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark bulk TaskManager.add_tasks against a loop over add_task.
+
+Run with: uv run python -m benchmarks.bench_bulk --tasks 100000
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from src.services.journal_storage import JournalStorage
+from src.services.sqlite_storage import SQLiteStorage
+from src.services.task_manager import TaskManager
+
+Backend = Callable[[Path], object]
+
+BACKENDS: dict[str, Backend] = {
+    "memory": lambda directory: None,
+    "journal": lambda directory: JournalStorage(directory / "bench.journal"),
+    "sqlite": lambda directory: SQLiteStorage(directory / "bench.db"),
+}
+
+
+def _records(count: int) -> list[dict[str, str]]:
+    return [
+        {"title": f"Task {n}", "description": "imported"} for n in range(count)
+    ]
+
+
+def _time(backend: Backend, count: int, bulk: bool) -> float:
+    """Create ``count`` tasks on a fresh backend and return elapsed seconds."""
+    records = _records(count)
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = backend(Path(tmp))
+        manager = TaskManager(storage)
+        start = time.perf_counter()
+        if bulk:
+            manager.add_tasks(records)
+        else:
+            for record in records:
+                manager.add_task(record["title"], record["description"])
+        close = getattr(storage, "close", None)
+        if close is not None:
+            close()
+        return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark for every backend and print the speedups."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--backend", choices=sorted(BACKENDS), action="append")
+    args = parser.parse_args(argv)
+    
+    print(f"{'backend':<8} {'add_task loop':>14} {'add_tasks':>10} {'speedup':>8}")
+    for name in args.backend or BACKENDS:
+        loop = _time(BACKENDS[name], args.tasks, bulk=False)
+        bulk = _time(BACKENDS[name], args.tasks, bulk=True)
+        print(f"{name:<8} {loop:>13.3f}s {bulk:>9.3f}s {loop / bulk:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Count backend calls for menu workflows with and without CachedStorage.
+
+Each workflow repeats the TaskManager calls the interactive menu makes:
+add, update (show, update, show), toggle (show, toggle, show) and delete
+(show, delete). IDs are drawn mostly from the most recent tasks, the way
+a user works through the first page of the list. The backend is an SQLite
+file wrapped in a proxy that counts every call reaching it.
+Run with: uv run python -m benchmarks.bench_cache --tasks 100000 --ops 20000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from src.services.cached_storage import CachedStorage
+from src.services.sqlite_storage import SQLiteStorage
+from src.services.task_manager import TaskManager
+
+
+class CountingProxy:
+    """Forward attribute access to a backend, counting method calls."""
+    
+    def __init__(self, backend: Any) -> None:
+        self.backend = backend
+        self.calls: Counter[str] = Counter()
+    
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.backend, name)
+        if not callable(attr):
+            return attr
+        
+        def counted(*args: Any, **kwargs: Any) -> Any:
+            self.calls[name] += 1
+            return attr(*args, **kwargs)
+        
+        return counted
+
+
+def add(manager: TaskManager, task_id: int) -> None:
+    manager.add_task(f"New task after {task_id}")
+
+
+def update(manager: TaskManager, task_id: int) -> None:
+    if manager.get_task(task_id) is not None:
+        manager.update_task(task_id, title=f"Renamed {task_id}")
+        manager.get_task(task_id)
+
+
+def toggle(manager: TaskManager, task_id: int) -> None:
+    if manager.get_task(task_id) is not None:
+        manager.toggle_complete(task_id)
+        manager.get_task(task_id)
+
+
+def delete(manager: TaskManager, task_id: int) -> None:
+    if manager.get_task(task_id) is not None:
+        manager.delete_task(task_id)
+
+
+WORKFLOWS: dict[str, Callable[[TaskManager, int], None]] = {
+    "add": add,
+    "update": update,
+    "toggle": toggle,
+    "delete": delete,
+}
+
+
+def run(
+    path: str, ops: int, hot: int, cache: int | None, seed: int
+) -> tuple[Counter[str], float]:
+    """Run ``ops`` random workflows; return backend calls and seconds."""
+    backend = SQLiteStorage(path)
+    proxy = CountingProxy(backend)
+    storage: Any = proxy if cache is None else CachedStorage(proxy, capacity=cache)
+    manager = TaskManager(storage)
+    top = manager.get_task_count()
+    rng = random.Random(seed)
+    names = list(WORKFLOWS)
+    proxy.calls.clear()
+    start = time.perf_counter()
+    for _ in range(ops):
+        # 90% of the work happens on the most recent ``hot`` tasks.
+        if rng.random() < 0.9:
+            task_id = rng.randint(max(1, top - hot), top)
+        else:
+            task_id = rng.randint(1, top)
+        # Adds balance deletes, so the recent tasks stay populated.
+        name = rng.choices(names, weights=(1, 4, 4, 1))[0]
+        WORKFLOWS[name](manager, task_id)
+        if name == "add":
+            top += 1
+    elapsed = time.perf_counter() - start
+    backend.close()
+    return proxy.calls, elapsed
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print backend calls per workflow without and with the cache."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--ops", type=int, default=20_000)
+    parser.add_argument("--hot", type=int, default=200, help="size of the recent set")
+    parser.add_argument("--capacity", type=int, default=1024)
+    args = parser.parse_args(argv)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for label, cache in (("uncached", None), ("cached", args.capacity)):
+            path = os.path.join(tmp, f"{label}.db")
+            setup = SQLiteStorage(path)
+            TaskManager(setup).add_tasks(
+                {"title": f"Task {n}", "description": "benchmark"}
+                for n in range(args.tasks)
+            )
+            setup.close()
+            calls, elapsed = run(path, args.ops, args.hot, cache, seed=1)
+            results[label] = calls
+            per_op = sum(calls.values()) / args.ops
+            print(
+                f"{label:<9} get_by_id {calls['get_by_id']:>7,}  "
+                f"all calls {sum(calls.values()):>7,} ({per_op:.2f}/workflow)  "
+                f"{elapsed / args.ops * 1e6:7.1f} us/workflow"
+            )
+    before = results["uncached"]["get_by_id"]
+    after = results["cached"]["get_by_id"]
+    print(f"backend get_by_id calls cut by {1 - after / before:.0%}")
+
+
+if __name__ == "__main__":
+    main()
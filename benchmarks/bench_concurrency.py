@@ -0,0 +1,60 @@
+"""Benchmark TaskManager throughput on ConcurrentStorage across thread counts.
+
+Each thread runs a mixed workload (add, read, toggle) against one shared
+manager. CPython's GIL serialises pure-Python work, so expect flat or
+modestly falling throughput as threads are added; the point is that the
+numbers stay correct and lock contention does not collapse throughput.
+Run with: uv run python -m benchmarks.bench_concurrency --ops 200000
+"""
+
+import argparse
+import threading
+import time
+
+from src.services.concurrent_storage import ConcurrentStorage
+from src.services.task_manager import TaskManager
+
+
+def run(threads: int, ops: int, shards: int) -> float:
+    """Run ``ops`` operations split over ``threads`` and return ops/second."""
+    manager = TaskManager(ConcurrentStorage(shards=shards))
+    per_thread = ops // threads
+    barrier = threading.Barrier(threads + 1)
+    
+    def worker() -> None:
+        barrier.wait()
+        for n in range(per_thread // 3):
+            task = manager.add_task(f"Task {n}")
+            manager.get_task(task.id)
+            manager.toggle_complete(task.id)
+    
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    
+    expected = threads * (per_thread // 3)
+    stats = manager.get_stats()
+    assert stats.total == stats.completed == expected, stats
+    return expected * 3 / elapsed
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print throughput for each thread count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args(argv)
+    
+    for threads in args.threads:
+        rate = run(threads, args.ops, args.shards)
+        print(f"{threads:>2} threads: {rate:>12,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark undo/redo of a bulk delete and the memory the history holds.
+
+Deletes a batch of tasks with history enabled, then times undo (one
+save_many of the deleted tasks) and redo. The history's memory is measured
+with tracemalloc as the growth while logging the delete, beyond the tasks
+themselves, which the log keeps alive for the undo.
+Run with: uv run python -m benchmarks.bench_history --tasks 1000000 --delete 100000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.services.task_manager import InMemoryStorage, TaskManager
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print delete, undo and redo times and the logged bytes per task."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--delete", type=int, default=100_000)
+    args = parser.parse_args(argv)
+    
+    manager = TaskManager(InMemoryStorage())
+    manager.add_tasks({"title": f"Task {n}"} for n in range(args.tasks))
+    manager.enable_history()
+    ids = range(1, args.delete + 1)
+    
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    manager.delete_tasks(ids)
+    deleted = time.perf_counter() - start
+    gc.collect()
+    logged = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    
+    start = time.perf_counter()
+    manager.undo()
+    undone = time.perf_counter() - start
+    assert manager.get_task_count() == args.tasks
+    start = time.perf_counter()
+    manager.redo()
+    redone = time.perf_counter() - start
+    
+    print(f"delete {args.delete} tasks: {deleted * 1e3:8.1f} ms")
+    print(f"undo (one save_many): {undone * 1e3:8.1f} ms")
+    print(f"redo:                 {redone * 1e3:8.1f} ms")
+    print(f"history overhead:     {logged / args.delete:8.1f} bytes/deleted task")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare bytes per task of InMemoryStorage and ColumnarStorage.
+
+Memory is measured with tracemalloc as the growth in traced allocations
+while a storage is filled through TaskManager.add_tasks.
+Run with: uv run python -m benchmarks.bench_memory --tasks 1000000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.services.columnar_storage import ColumnarStorage
+from src.services.task_manager import InMemoryStorage, TaskManager
+
+
+def measure(storage: object, count: int) -> tuple[float, float]:
+    """Fill ``storage`` with ``count`` tasks; return (bytes per task, seconds)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    manager = TaskManager(storage)  # type: ignore[arg-type]
+    manager.add_tasks(
+        {
+            "title": f"Task number {n}",
+            "description": "x" * (n % 40),
+            "is_complete": n % 3 == 0,
+        }
+        for n in range(count)
+    )
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / count, elapsed
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print bytes per task for each backend."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    
+    results = {}
+    for factory in (InMemoryStorage, ColumnarStorage):
+        name = factory.__name__
+        per_task, elapsed = measure(factory(), args.tasks)
+        results[name] = per_task
+        print(f"{name:<16} {per_task:8.1f} bytes/task  (filled in {elapsed:.2f} s)")
+    ratio = results["InMemoryStorage"] / results["ColumnarStorage"]
+    print(f"columnar uses {ratio:.1f}x less memory per task")
+
+
+if __name__ == "__main__":
+    main()
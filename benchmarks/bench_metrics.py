@@ -0,0 +1,83 @@
+"""Measure the overhead of TaskManager metrics on menu-style workflows.
+
+One workflow is what a menu round trip costs the manager: the stats line,
+the first page of tasks, then show/toggle/show of one task. It is timed
+with metrics disabled and enabled on each backend (best of --repeat).
+The cost per instrumented call is also shown: it is a fixed fraction of
+a microsecond, small next to SQLite calls but comparable to the in-memory
+backend's sub-microsecond operations.
+Run with: uv run python -m benchmarks.bench_metrics --tasks 100000
+"""
+
+import argparse
+import gc
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.services.sqlite_storage import SQLiteStorage
+from src.services.task_manager import TaskManager
+
+
+def workflow(manager: TaskManager, ids: list[int]) -> None:
+    """Run one menu round trip per ID."""
+    for task_id in ids:
+        manager.get_stats()
+        manager.get_page(limit=20)
+        manager.get_task(task_id)
+        manager.toggle_complete(task_id)
+        manager.get_task(task_id)
+
+
+def best_time(manager: TaskManager, ids: list[int], repeat: int) -> float:
+    """Best wall time in seconds over ``repeat`` runs of the workflow."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        workflow(manager, ids)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print per-workflow time with metrics off and on, and the overhead."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--workflows", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    
+    rng = random.Random(0)
+    ids = [rng.randint(1, args.tasks) for _ in range(args.workflows)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, storage in (
+            ("memory", None),
+            ("sqlite", SQLiteStorage(Path(tmp) / "bench.db")),
+        ):
+            manager = TaskManager(storage)
+            manager.add_tasks(
+                {"title": f"Task {n}", "description": "benchmark"}
+                for n in range(args.tasks)
+            )
+            # Alternate so that drift (caches, CPU clocks) hits both sides.
+            off = on = float("inf")
+            for _ in range(args.repeat):
+                off = min(off, best_time(manager, ids, 1))
+                manager.enable_metrics()
+                on = min(on, best_time(manager, ids, 1))
+                calls = sum(stats.calls for stats in manager.metrics().values())
+                manager.disable_metrics()
+            per = 1e6 / args.workflows
+            print(
+                f"{name:<7} off {off * per:8.1f} us/workflow  "
+                f"on {on * per:8.1f} us/workflow  overhead {on / off - 1:+6.1%}  "
+                f"({(on - off) * 1e6 / calls:.2f} us per instrumented call)"
+            )
+            if storage is not None:
+                storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Measure open time and random lookups on a memory-mapped task file.
+
+A task file of the requested size is written once (reused on later runs),
+then opened repeatedly and queried with random get_by_id calls. The
+journal backend's open time, which replays every record, is shown for
+comparison on smaller sizes.
+Run with: uv run python -m benchmarks.bench_mmap --tasks 10000000
+"""
+
+import argparse
+import os
+import random
+import resource
+import tempfile
+import time
+from collections.abc import Iterator
+
+from src.models.task import Task
+from src.services.journal_storage import JournalStorage
+from src.services.mmap_storage import MmapStorage, write_task_file
+
+
+def generate(count: int) -> Iterator[Task]:
+    """Yield ``count`` tasks with IDs 1..count."""
+    for n in range(1, count + 1):
+        yield Task(
+            id=n,
+            title=f"Task number {n}",
+            description="x" * (n % 40),
+            is_complete=n % 3 == 0,
+        )
+
+
+def max_rss_mb() -> float:
+    """Peak resident set size of this process in MiB (Linux units)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def bench_open(path: str, repeat: int) -> float:
+    """Best time in ms to open (map) and close the file."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        MmapStorage(path).close()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def bench_lookups(path: str, count: int, lookups: int) -> float:
+    """Mean microseconds per random get_by_id."""
+    keys = [random.randint(1, count) for _ in range(lookups)]
+    with MmapStorage(path) as storage:
+        start = time.perf_counter()
+        for key in keys:
+            storage.get_by_id(key)
+        elapsed = time.perf_counter() - start
+    return elapsed / lookups * 1e6
+
+
+def bench_journal_open(count: int) -> float:
+    """Time in ms for JournalStorage to replay ``count`` tasks."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tasks.journal")
+        storage = JournalStorage(path)
+        storage.save_many(generate(count))
+        storage.close()
+        start = time.perf_counter()
+        JournalStorage(path).close()
+        return (time.perf_counter() - start) * 1000
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Write (or reuse) a task file and report open and lookup costs."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument(
+        "--file", help="task file to use (default: a cached file in the temp dir)"
+    )
+    parser.add_argument(
+        "--journal-max", type=int, default=1_000_000,
+        help="skip the journal comparison above this many tasks",
+    )
+    args = parser.parse_args(argv)
+    
+    path = args.file or os.path.join(
+        tempfile.gettempdir(), f"bench_mmap_{args.tasks}.tasks"
+    )
+    if not os.path.exists(path):
+        start = time.perf_counter()
+        write_task_file(path, generate(args.tasks))
+        print(f"wrote {path} in {time.perf_counter() - start:.1f} s")
+    size_mb = os.path.getsize(path) / 2**20
+    
+    rss_before = max_rss_mb()
+    open_ms = bench_open(path, repeat=20)
+    lookup_us = bench_lookups(path, args.tasks, args.lookups)
+    print(f"file:        {args.tasks:,} tasks, {size_mb:,.1f} MiB")
+    print(f"open:        {open_ms:.3f} ms (best of 20)")
+    print(f"get_by_id:   {lookup_us:.2f} us per random lookup")
+    print(f"peak RSS:    {max_rss_mb() - rss_before:+.1f} MiB during the run")
+    if args.tasks <= args.journal_max:
+        print(f"journal open: {bench_journal_open(args.tasks):.1f} ms for comparison")
+
+
+if __name__ == "__main__":
+    main()
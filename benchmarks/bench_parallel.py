@@ -0,0 +1,89 @@
+"""Time ParallelQuery scans with 1, 2, 4, ... worker processes.
+
+A memory-mapped task file is written once (reused on later runs) and
+scanned with a substring count over descriptions and per-keyword
+completion counts. Speedup is relative to the single-process scan; it
+can only approach the worker count on a machine with that many idle cores.
+Run with: uv run python -m benchmarks.bench_parallel --tasks 5000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+
+from src.models.task import Task
+from src.services.mmap_storage import MmapStorage, write_task_file
+from src.services.parallel_query import ParallelQuery
+
+WORDS = ("invoice", "review", "deploy", "call", "write", "plan", "fix", "read")
+KEYWORDS = ("invoice", "deploy", "fix")
+
+
+def generate(count: int) -> Iterator[Task]:
+    """Yield ``count`` tasks whose descriptions mix a few common words."""
+    for n in range(1, count + 1):
+        yield Task(
+            id=n,
+            title=f"Task number {n}",
+            description=f"{WORDS[n % 8]} {WORDS[n * 7 % 8]} item {n % 1000}",
+            is_complete=n % 3 == 0,
+        )
+
+
+def best_time(run: Callable[[], object], repeat: int) -> float:
+    """Best wall time in seconds over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print scan times and speedups for increasing worker counts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=2_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--file", help="task file to use (default: a cached file in the temp dir)"
+    )
+    args = parser.parse_args(argv)
+    
+    path = args.file or os.path.join(
+        tempfile.gettempdir(), f"bench_parallel_{args.tasks}.tasks"
+    )
+    if not os.path.exists(path):
+        write_task_file(path, generate(args.tasks))
+    print(f"{args.tasks:,} tasks, {os.cpu_count()} CPUs")
+    
+    workers = 1
+    baseline: dict[str, float] = {}
+    with MmapStorage(path) as storage:
+        while workers <= args.max_workers:
+            with ParallelQuery(storage, workers=workers) as query:
+                query.count_containing("warm-up")  # start the pool untimed
+                times = {
+                    "count_containing": best_time(
+                        lambda: query.count_containing("invoice"), args.repeat
+                    ),
+                    "keyword_stats": best_time(
+                        lambda: query.keyword_stats(KEYWORDS), args.repeat
+                    ),
+                }
+            baseline = baseline or times
+            print(
+                f"{workers:>3} workers  "
+                + "  ".join(
+                    f"{name} {seconds:6.2f} s ({baseline[name] / seconds:4.1f}x)"
+                    for name, seconds in times.items()
+                )
+            )
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark indexed task search against a linear scan of titles/descriptions.
+
+Run with: uv run python -m benchmarks.bench_search --tasks 1000000
+"""
+
+import argparse
+import random
+import time
+
+from src.services.task_manager import TaskManager
+
+WORDS = (
+    "buy call email write review fix deploy plan book clean pay renew "
+    "order send update test refactor meeting report invoice groceries "
+    "dentist garden budget travel backup server release draft"
+).split()
+
+QUERIES = ("invoice", "rev", "deploy server", "garden budget", "12345", "zzz")
+
+
+def build_manager(count: int, seed: int = 0) -> TaskManager:
+    """Create a manager holding ``count`` tasks with random word titles."""
+    rng = random.Random(seed)
+    manager = TaskManager()
+    manager.add_tasks(
+        {
+            "title": " ".join(rng.choices(WORDS, k=3)) + f" #{n}",
+            "description": " ".join(rng.choices(WORDS, k=4)),
+        }
+        for n in range(count)
+    )
+    return manager
+
+
+def linear_search(manager: TaskManager, query: str) -> list[int]:
+    """Match every query word as a substring, scanning every task."""
+    words = query.casefold().split()
+    return [
+        task.id
+        for task in manager.iter_tasks()
+        if all(
+            word in task.title.casefold() or word in task.description.casefold()
+            for word in words
+        )
+    ]
+
+
+def _best_of(repeat: int, func, *args) -> float:  # type: ignore[no-untyped-def]
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Build an index over synthetic tasks and time queries both ways."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    
+    manager = build_manager(args.tasks)
+    start = time.perf_counter()
+    manager.search("warmup")
+    print(f"index build: {time.perf_counter() - start:.2f} s for {args.tasks:,} tasks")
+    
+    print(
+        f"{'query':<16} {'matches':>9} {'index ids':>11} "
+        f"{'index+fetch':>12} {'scan':>9}"
+    )
+    index = manager._search_index
+    for query in QUERIES:
+        matches = len(index.search(query))
+        ids_only = _best_of(args.repeat, index.search, query)
+        fetched = _best_of(args.repeat, manager.search, query, 20)
+        scan = _best_of(1, linear_search, manager, query)
+        print(
+            f"{query:<16} {matches:>9,} {ids_only * 1e3:>9.3f}ms "
+            f"{fetched * 1e3:>10.3f}ms {scan * 1e3:>7.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Measure `todo` startup: import time of the entry point and cold-start latency.
+
+Runs ``python -X importtime -c "import src.__main__"`` and a full
+``todo list`` against a temporary SQLite file in fresh interpreters, and
+exits with status 1 if either median exceeds its budget or if a module
+that only some commands need (the menu, http.server, asyncio, dataclasses)
+is imported at startup.
+Run with: uv run python -m benchmarks.bench_startup --runs 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Modules the entry point must not import before a command needs them.
+LAZY_MODULES = (
+    "asyncio",
+    "dataclasses",
+    "http.server",
+    "src.cli.menu",
+    "src.cli.profiling",
+    "tracemalloc",
+)
+
+
+def import_time_us(env: dict[str, str]) -> tuple[int, list[tuple[int, str]]]:
+    """Import src.__main__ once; return its cumulative and per-module self µs."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.__main__"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    total = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        modules.append((int(self_us), name.strip()))
+        if name.strip() == "src.__main__":
+            total = int(cumulative_us)
+    return total, modules
+
+
+def wall_ms(python_args: list[str], env: dict[str, str]) -> float:
+    """Run a fresh interpreter with arguments and return wall-clock ms."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *python_args],
+        stdout=subprocess.DEVNULL,
+        env=env,
+        check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def eagerly_imported(env: dict[str, str]) -> list[str]:
+    """List the LAZY_MODULES that importing the entry point loads."""
+    code = (
+        "import sys, src.__main__; "
+        f"print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print startup measurements and return 1 if a budget is exceeded."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--import-budget-ms",
+        type=float,
+        default=80.0,
+        help="maximum median import time of src.__main__",
+    )
+    parser.add_argument(
+        "--start-budget-ms",
+        type=float,
+        default=250.0,
+        help="maximum median wall-clock time of `todo list`",
+    )
+    args = parser.parse_args(argv)
+    
+    env = dict(os.environ)
+    env.pop("TODO_DATA", None)
+    
+    imports = [import_time_us(env) for _ in range(args.runs)]
+    import_ms = statistics.median(total for total, _ in imports) / 1000
+    slowest = sorted(imports[-1][1], reverse=True)[:8]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        data = os.path.join(tmp, "tasks.db")
+        todo = ["-m", "src", "--data", data]
+        wall_ms([*todo, "add", "Warm up the database"], env)
+        baseline = statistics.median(
+            wall_ms(["-c", "pass"], env) for _ in range(args.runs)
+        )
+        start_ms = statistics.median(
+            wall_ms([*todo, "list", "--limit", "1"], env) for _ in range(args.runs)
+        )
+    eager = eagerly_imported(env)
+    
+    import_budget = args.import_budget_ms
+    print(f"import src.__main__: {import_ms:7.1f} ms (budget {import_budget:g})")
+    print(f"todo list:           {start_ms:7.1f} ms (budget {args.start_budget_ms:g})")
+    print(f"bare interpreter:    {baseline:7.1f} ms")
+    print("slowest imports (self time):")
+    for self_us, name in slowest:
+        print(f"  {self_us / 1000:6.1f} ms  {name}")
+    
+    failures = []
+    if import_ms > args.import_budget_ms:
+        failures.append("import time over budget")
+    if start_ms > args.start_budget_ms:
+        failures.append("cold start over budget")
+    if eager:
+        failures.append(f"imported at startup: {', '.join(eager)}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
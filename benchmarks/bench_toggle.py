@@ -0,0 +1,51 @@
+"""Benchmark toggle_complete with in-place updates versus rebuilding Tasks.
+
+Run with: uv run python -m benchmarks.bench_toggle --tasks 1000000
+"""
+
+import argparse
+import gc
+import time
+
+from src.services.task_manager import InMemoryStorage, TaskManager
+
+
+class RebuildOnlyStorage(InMemoryStorage):
+    """InMemoryStorage without update_fields, forcing the rebuild-and-save path."""
+    
+    update_fields = None  # type: ignore[assignment]
+
+
+def time_toggles(storage: InMemoryStorage, count: int) -> float:
+    """Add ``count`` tasks, toggle each once and return elapsed seconds."""
+    manager = TaskManager(storage)
+    manager.add_tasks(
+        {"title": f"Task {n}", "description": "benchmark"} for n in range(count)
+    )
+    toggle = manager.toggle_complete
+    gc.collect()
+    start = time.perf_counter()
+    for task_id in range(1, count + 1):
+        toggle(task_id)
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run both toggle paths and print the per-toggle cost."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    
+    rebuild = in_place = float("inf")
+    for _ in range(args.repeat):
+        rebuild = min(rebuild, time_toggles(RebuildOnlyStorage(), args.tasks))
+        in_place = min(in_place, time_toggles(InMemoryStorage(), args.tasks))
+    per_task = 1e9 / args.tasks
+    print(f"rebuild + save:  {rebuild:.3f} s ({rebuild * per_task:.0f} ns/toggle)")
+    print(f"update_fields:   {in_place:.3f} s ({in_place * per_task:.0f} ns/toggle)")
+    print(f"speedup:         {rebuild / in_place:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Load-test the HTTP API and report requests/sec and latency percentiles.
+
+By default a server is started in-process on a free loopback port; pass
+--url to target a separately running ``todo serve`` instead (recommended
+for realistic numbers, since in-process clients share the server's GIL).
+Each client thread keeps one HTTP/1.1 connection open and issues a mix of
+reads, creates and toggles.
+Run with: uv run python -m benchmarks.load_test_server --clients 8 --requests 20000
+"""
+
+import argparse
+import json
+import random
+import statistics
+import threading
+import time
+from http.client import HTTPConnection
+from urllib.parse import urlsplit
+
+from src.api.server import make_server
+from src.services.concurrent_storage import ConcurrentStorage
+from src.services.task_manager import TaskManager
+
+
+def seed(host: str, port: int, tasks: int) -> None:
+    """Create ``tasks`` tasks through the batch endpoint."""
+    connection = HTTPConnection(host, port)
+    for start in range(0, tasks, 10_000):
+        stop = min(start + 10_000, tasks)
+        records = [{"title": f"Seed {n}"} for n in range(start, stop)]
+        connection.request("POST", "/tasks/batch", body=json.dumps({"tasks": records}))
+        connection.getresponse().read()
+    connection.close()
+
+
+def client(
+    host: str, port: int, requests: int, max_id: int, latencies: list[float]
+) -> None:
+    """Issue ``requests`` mixed requests over one keep-alive connection."""
+    connection = HTTPConnection(host, port)
+    rng = random.Random()
+    create_body = json.dumps({"title": "Load test", "description": "created"})
+    for n in range(requests):
+        kind = n % 10
+        start = time.perf_counter()
+        if kind < 6:
+            connection.request("GET", f"/tasks/{rng.randint(1, max_id)}")
+        elif kind < 8:
+            start_id = rng.randint(1, max_id)
+            connection.request("GET", f"/tasks?limit=20&start_id={start_id}")
+        elif kind == 8:
+            connection.request("POST", "/tasks", body=create_body)
+        else:
+            connection.request("POST", f"/tasks/{rng.randint(1, max_id)}/toggle")
+        connection.getresponse().read()
+        latencies.append(time.perf_counter() - start)
+    connection.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the load test and print throughput and latency."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--url", help="base URL of a running server (default: in-process)"
+    )
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=20_000, help="total requests")
+    parser.add_argument("--tasks", type=int, default=10_000, help="tasks to seed")
+    args = parser.parse_args(argv)
+    
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname or "127.0.0.1", url.port or 80
+    else:
+        server = make_server(TaskManager(ConcurrentStorage()), port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = "127.0.0.1", server.server_port
+    
+    seed(host, port, args.tasks)
+    per_client = args.requests // args.clients
+    latencies: list[list[float]] = [[] for _ in range(args.clients)]
+    threads = [
+        threading.Thread(target=client, args=(host, port, per_client, args.tasks, lat))
+        for lat in latencies
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+    
+    samples = sorted(sample for chunk in latencies for sample in chunk)
+    cuts = statistics.quantiles(samples, n=100)
+    print(f"requests:  {len(samples):,} over {args.clients} connections")
+    print(f"rps:       {len(samples) / elapsed:,.0f}")
+    print(f"p50:       {cuts[49] * 1000:.2f} ms")
+    print(f"p99:       {cuts[98] * 1000:.2f} ms")
+    print(f"max:       {samples[-1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
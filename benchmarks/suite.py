@@ -0,0 +1,340 @@
+"""Benchmark suite: TaskManager operations at several task counts.
+
+For each task count a TaskManager is filled once, then every case is
+timed on it (best of ``--repeat`` runs, with the garbage collector paused
+like ``timeit`` does). Results are written as JSON keyed by
+``backend/case/size``, so two runs can be compared with ``--baseline``;
+any case slower than the baseline by more than ``--threshold`` makes the
+run exit with status 1.
+Run with: uv run python -m benchmarks --sizes 1000,100000 --output after.json \\
+    --baseline before.json
+"""
+
+import argparse
+import gc
+import io
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from src.cli import menu
+from src.services.columnar_storage import ColumnarStorage
+from src.services.concurrent_storage import ConcurrentStorage
+from src.services.sqlite_storage import SQLiteStorage
+from src.services.task_manager import TaskManager
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+DEFAULT_THRESHOLD = 0.20
+
+# Point operations per timed run; fewer on small sets so that repeats do
+# not change the set size much.
+POINT_OPS = 10_000
+
+BACKENDS: dict[str, Callable[[Path], Any]] = {
+    "memory": lambda directory: None,
+    "columnar": lambda directory: ColumnarStorage(),
+    "concurrent": lambda directory: ConcurrentStorage(),
+    "sqlite": lambda directory: SQLiteStorage(directory / "bench.db"),
+}
+
+
+# =============================================================================
+# Cases: (manager, ids) -> None, where len(ids) is the operation count
+# =============================================================================
+
+def _get_task(manager: TaskManager, ids: list[int]) -> None:
+    get_task = manager.get_task
+    for task_id in ids:
+        get_task(task_id)
+
+
+def _update_task(manager: TaskManager, ids: list[int]) -> None:
+    for task_id in ids:
+        manager.update_task(task_id, title=f"Updated {task_id}")
+
+
+def _toggle_complete(manager: TaskManager, ids: list[int]) -> None:
+    toggle = manager.toggle_complete
+    for task_id in ids:
+        toggle(task_id)
+
+
+def _delete_task(manager: TaskManager, ids: list[int]) -> None:
+    delete = manager.delete_task
+    for task_id in ids:
+        delete(task_id)
+
+
+def _add_task(manager: TaskManager, ids: list[int]) -> None:
+    add = manager.add_task
+    for _ in ids:
+        add("Benchmark task", "added one at a time")
+
+
+def _get_all_tasks(manager: TaskManager, ids: list[int]) -> None:
+    for _ in ids:
+        manager.get_all_tasks()
+
+
+def _get_task_count(manager: TaskManager, ids: list[int]) -> None:
+    for _ in ids:
+        manager.get_task_count()
+
+
+def _get_completed_count(manager: TaskManager, ids: list[int]) -> None:
+    for _ in ids:
+        manager.get_completed_count()
+
+
+def _get_stats(manager: TaskManager, ids: list[int]) -> None:
+    for _ in ids:
+        manager.get_stats()
+
+
+def _render(count: int) -> Callable[[TaskManager, list[int]], None]:
+    """Case drawing a ``display_task_list`` screen of ``count`` tasks."""
+    def render(manager: TaskManager, ids: list[int]) -> None:
+        for _ in ids:
+            menu.clear_screen()
+            menu.display_task_list(manager.iter_tasks(limit=count))
+            menu.screen.flush()
+    
+    return render
+
+
+class Case(NamedTuple):
+    """A timed operation and how many times one run performs it."""
+    
+    name: str
+    run: Callable[[TaskManager, list[int]], None]
+    ops: Callable[[int], int]
+    # Destructive cases get IDs that no earlier repeat has used.
+    distinct_ids: bool = False
+
+
+def _point_ops(size: int) -> int:
+    return min(size, POINT_OPS)
+
+
+# Cases run in this order on one manager; the ones changing the set size
+# come last and are kept to a small fraction of it.
+CASES = (
+    Case("get_task", _get_task, _point_ops),
+    Case("update_task", _update_task, _point_ops),
+    Case("toggle_complete", _toggle_complete, _point_ops),
+    Case("get_task_count", _get_task_count, lambda size: POINT_OPS),
+    Case("get_completed_count", _get_completed_count, lambda size: POINT_OPS),
+    Case("get_stats", _get_stats, lambda size: POINT_OPS),
+    Case("get_all_tasks", _get_all_tasks, lambda size: max(1, 100_000 // size)),
+    Case("display_task_list_page", _render(menu.TodoMenu.PAGE_SIZE), lambda size: 200),
+    Case("display_task_list_1000", _render(1000), lambda size: 10),
+    Case("delete_task", _delete_task, lambda size: max(1, size // 100), True),
+    Case("add_task", _add_task, lambda size: max(1, size // 100)),
+)
+
+
+# =============================================================================
+# Running
+# =============================================================================
+
+@contextmanager
+def _quiet_screen() -> Iterator[None]:
+    """Send the menu's screen output to a discarded buffer."""
+    saved = menu.screen.stream, menu.screen.ansi
+    menu.screen.stream, menu.screen.ansi = io.StringIO(), False
+    try:
+        yield
+    finally:
+        menu.screen.stream, menu.screen.ansi = saved
+
+
+def _timed(run: Callable[[], None]) -> float:
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        run()
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def fill(manager: TaskManager, size: int) -> None:
+    """Add ``size`` tasks, a third of them complete."""
+    manager.add_tasks(
+        {
+            "title": f"Task number {n}",
+            "description": "benchmark task " * (n % 4),
+            "is_complete": n % 3 == 0,
+        }
+        for n in range(size)
+    )
+
+
+def run_suite(
+    backend: str,
+    sizes: tuple[int, ...],
+    repeat: int = 3,
+    cases: tuple[Case, ...] = CASES,
+    log: Callable[[str], None] = print,
+) -> dict[str, dict[str, float]]:
+    """Time every case at every size on one backend.
+    
+    Returns:
+        ``{"backend/case/size": {"ops", "seconds", "us_per_op"}}``, where
+        ``seconds`` is the best run's total time
+    """
+    results: dict[str, dict[str, float]] = {}
+    rng = random.Random(0)
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = BACKENDS[backend](Path(tmp))
+            manager = TaskManager(storage)
+            fill(manager, size)
+            with _quiet_screen():
+                for case in cases:
+                    ops = case.ops(size)
+                    if case.distinct_ids:
+                        pool = rng.sample(range(1, size + 1), min(size, ops * repeat))
+                        batches = [pool[i::repeat] for i in range(repeat)]
+                    else:
+                        batches = [
+                            [rng.randint(1, size) for _ in range(ops)]
+                            for _ in range(repeat)
+                        ]
+                    best = min(
+                        _timed(lambda: case.run(manager, batch)) for batch in batches
+                    )
+                    done = len(batches[0])
+                    key = f"{backend}/{case.name}/{size}"
+                    results[key] = {
+                        "ops": done,
+                        "seconds": best,
+                        "us_per_op": best / done * 1e6,
+                    }
+                    log(f"{key:<48} {best / done * 1e6:12.2f} us/op  ({done} ops)")
+            close = getattr(storage, "close", None)
+            if close is not None:
+                close()
+    return results
+
+
+# =============================================================================
+# Comparing
+# =============================================================================
+
+class Comparison(NamedTuple):
+    """One case present in both the baseline and the current results."""
+    
+    key: str
+    baseline_us: float
+    current_us: float
+    
+    @property
+    def ratio(self) -> float:
+        """Current time over baseline time (above 1 means slower)."""
+        return self.current_us / self.baseline_us if self.baseline_us else 1.0
+
+
+def compare(
+    baseline: dict[str, dict[str, float]], current: dict[str, dict[str, float]]
+) -> list[Comparison]:
+    """Pair up the cases found in both result sets, in current order."""
+    return [
+        Comparison(key, baseline[key]["us_per_op"], result["us_per_op"])
+        for key, result in current.items()
+        if key in baseline
+    ]
+
+
+def regressions(
+    comparisons: list[Comparison], threshold: float = DEFAULT_THRESHOLD
+) -> list[Comparison]:
+    """The comparisons slower than the baseline by more than ``threshold``."""
+    return [c for c in comparisons if c.ratio > 1 + threshold]
+
+
+def _parse_sizes(value: str) -> tuple[int, ...]:
+    try:
+        sizes = tuple(int(part) for part in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid sizes: {value!r}") from None
+    if not sizes or min(sizes) < 1:
+        raise argparse.ArgumentTypeError(f"invalid sizes: {value!r}")
+    return sizes
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite, write JSON results and compare them to a baseline."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        default=DEFAULT_SIZES,
+        help="comma-separated task counts (default: 1000,100000,1000000)",
+    )
+    parser.add_argument(
+        "--backend", choices=sorted(BACKENDS), action="append",
+        help="storage backend; repeat for several (default: memory)",
+    )
+    parser.add_argument("--case", action="append", help="run only these cases")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown before failing, as a fraction (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    
+    cases = CASES
+    if args.case:
+        unknown = set(args.case) - {case.name for case in CASES}
+        if unknown:
+            parser.error(f"unknown case(s): {', '.join(sorted(unknown))}")
+        cases = tuple(case for case in CASES if case.name in args.case)
+    
+    results: dict[str, dict[str, float]] = {}
+    for backend in args.backend or ["memory"]:
+        results.update(run_suite(backend, args.sizes, args.repeat, cases))
+    
+    if args.output:
+        document = {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            },
+            "results": results,
+        }
+        args.output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    
+    if not args.baseline:
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+    comparisons = compare(baseline, results)
+    slower = regressions(comparisons, args.threshold)
+    print(f"\nCompared with {args.baseline} (threshold +{args.threshold:.0%}):")
+    for c in comparisons:
+        flag = "  REGRESSION" if c in slower else ""
+        print(
+            f"{c.key:<48} {c.baseline_us:10.2f} -> {c.current_us:10.2f} us/op"
+            f"  {c.ratio - 1:+7.1%}{flag}"
+        )
+    if slower:
+        print(f"\n{len(slower)} case(s) regressed", file=sys.stderr)
+        return 1
+    return 0
@@ -2,23 +2,192 @@
 
 Run with: uv run python -m src
 Or after installation: todo
+
+Only argparse and the command definitions are imported up front. Storage
+backends, the menu and the HTTP server are imported inside the functions
+that use them, so a scripted command such as ``todo list`` loads just the
+backend it opens and never the interactive UI or ``http.server``.
 """
 
+import argparse
+import os
 import sys
+from collections.abc import Callable
+from functools import partial
+from typing import TYPE_CHECKING
+
+from src.cli.commands import CommandHandler, add_command_parsers
+
+if TYPE_CHECKING:
+    from src.services.journal_storage import JournalStorage
+    from src.services.mmap_storage import MmapStorage
+    from src.services.sqlite_storage import SQLiteStorage
+    from src.services.task_manager import TaskManager
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+MMAP_SUFFIXES = (".tasks",)
+DEFAULT_PROFILE_PATH = "todo.prof"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="todo",
+        description="A command-line todo application.",
+    )
+    parser.add_argument(
+        "--data",
+        metavar="PATH",
+        default=os.environ.get("TODO_DATA"),
+        help="file to keep tasks in between runs: an SQLite database for "
+        ".db/.sqlite/.sqlite3 paths, a memory-mapped task file for .tasks "
+        "paths, a journal otherwise "
+        "(default: $TODO_DATA, or in-memory only)",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="count and time manager and storage calls, shown on the menu's "
+        "hidden Diagnostics screen (enter d)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="run under a profiler (pyinstrument if installed, else cProfile), "
+        "print the hottest functions on exit and save the stats file",
+    )
+    parser.add_argument(
+        "--profile-file",
+        metavar="FILE",
+        default=DEFAULT_PROFILE_PATH,
+        help="where --profile saves its stats (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--trace-alloc",
+        action="store_true",
+        help="trace allocations with tracemalloc and print the biggest "
+        "allocation sites on exit",
+    )
+    
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    serve = commands.add_parser(
+        "serve",
+        help="serve the tasks as an HTTP/JSON API instead of the menu",
+        description="Serve the tasks as an HTTP/JSON API.",
+    )
+    serve.add_argument(
+        "--host", default="127.0.0.1", help="interface to bind (default: %(default)s)"
+    )
+    serve.add_argument(
+        "--port", type=int, default=8000, help="TCP port (default: %(default)s)"
+    )
+    add_command_parsers(commands)
+    return parser
+
+
+def open_storage(
+    path: str | None,
+) -> "JournalStorage | MmapStorage | SQLiteStorage | None":
+    """Open the storage backend for a data path (None means in-memory)."""
+    if not path:
+        return None
+    if path.endswith(SQLITE_SUFFIXES):
+        from src.services.sqlite_storage import SQLiteStorage
+        
+        return SQLiteStorage(path)
+    if path.endswith(MMAP_SUFFIXES):
+        from src.services.mmap_storage import MmapStorage
+        
+        return MmapStorage(path)
+    from src.services.journal_storage import JournalStorage
+    
+    return JournalStorage(path)
+
+
+def serve(
+    storage: "JournalStorage | MmapStorage | SQLiteStorage | None",
+    host: str,
+    port: int,
+) -> int:
+    """Run the HTTP API until interrupted.
+    
+    Without a data file the tasks live in a ConcurrentStorage, so requests
+    run in parallel; file backends are not thread-safe and are serialized.
+    """
+    from src.api.server import make_server
+    from src.services.concurrent_storage import ConcurrentStorage
+    from src.services.task_manager import TaskManager
+    
+    if storage is None:
+        server = make_server(TaskManager(ConcurrentStorage()), host, port)
+    else:
+        server = make_server(TaskManager(storage), host, port, serialize=True)
+    with server:
+        print(f"Serving tasks on http://{host}:{server.server_port} (Ctrl+C to stop)")
+        server.serve_forever()
+    return 0
+
 
-from src.cli.menu import TodoMenu
+def run_command(
+    handler: CommandHandler, manager: "TaskManager", args: argparse.Namespace
+) -> int:
+    """Run a scripted subcommand, reporting bad input as ``todo: error``."""
+    try:
+        return handler(manager, args, sys.stdout)
+    except (OSError, ValueError) as e:
+        print(f"todo {args.command}: error: {e}", file=sys.stderr)
+        return 1
+
+
+def run_session(args: argparse.Namespace, handler: CommandHandler | None) -> int:
+    """Open the storage, run the menu, server or subcommand, and close it."""
+    storage = open_storage(args.data)
+    try:
+        if args.command == "serve":
+            return serve(storage, args.host, args.port)
+        from src.services.task_manager import TaskManager
+        
+        if handler is not None:
+            return run_command(handler, TaskManager(storage), args)
+        from src.cli.menu import TodoMenu
+        
+        manager = TaskManager(storage)
+        if args.metrics:
+            manager.enable_metrics()
+        menu = TodoMenu(manager)
+        menu.run()
+        return 0
+    finally:
+        if storage is not None:
+            storage.close()
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main entry point for the todo console application.
     
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    handler = getattr(args, "handler", None)
+    if handler is not None and not args.data:
+        parser.error(f"{args.command} needs a data file: pass --data or set TODO_DATA")
+    
+    session: Callable[[], int] = partial(run_session, args, handler)
+    if args.trace_alloc or args.profile:
+        from src.cli import profiling
+        
+        if args.trace_alloc:
+            session = partial(profiling.trace_allocations, session)
+        if args.profile:
+            session = partial(profiling.profile_call, session, args.profile_file)
+    
     try:
-        menu = TodoMenu()
-        menu.run()
-        return 0
+        return session()
     
     except KeyboardInterrupt:
         print("\n\n  👋 Interrupted. Goodbye!\n")
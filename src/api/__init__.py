@@ -0,0 +1,15 @@
+"""API package - HTTP/JSON interface to the todo application.
+
+``TaskServer`` and ``make_server`` are imported from ``src.api.server`` on
+first access, since ``http.server`` is costly to import.
+"""
+
+from importlib import import_module
+
+__all__ = ["TaskServer", "make_server"]
+
+
+def __getattr__(name: str) -> object:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module("src.api.server"), name)
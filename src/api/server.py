@@ -0,0 +1,344 @@
+"""HTTP API server - JSON endpoints over a TaskManager, on the stdlib only.
+
+Built on ``http.server.ThreadingHTTPServer`` speaking HTTP/1.1, so clients
+keep their connection open across requests and each connection is served
+by its own thread. Endpoints:
+
+    GET    /stats                    total/completed/pending counts
+    GET    /tasks?status=&start_id=&limit=
+                                     one keyset page of tasks
+    POST   /tasks                    create {"title", "description"}
+    POST   /tasks/batch              create {"tasks": [records...]}
+    POST   /tasks/delete             delete {"ids": [...]}
+    GET    /tasks/<id>               one task
+    PATCH  /tasks/<id>               change title/description/is_complete
+    POST   /tasks/<id>/toggle        flip completion
+    DELETE /tasks/<id>               delete one task
+
+Errors are returned as ``{"error": message}`` with a 400 or 404 status,
+or 500 if a handler fails unexpectedly.
+"""
+
+import json
+import threading
+from collections.abc import Callable
+from contextlib import nullcontext
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from src.models.task import Task
+from src.services.task_manager import TaskManager, TaskStats
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 1000
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_decode = json.JSONDecoder().decode
+
+
+class APIError(Exception):
+    """A request error reported to the client with an HTTP status."""
+    
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def task_to_json(task: Task) -> dict[str, Any]:
+    """Convert a task to its JSON object form."""
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "is_complete": task.is_complete,
+    }
+
+
+def stats_to_json(stats: TaskStats) -> dict[str, int]:
+    """Convert task counts to their JSON object form."""
+    return {
+        "total": stats.total,
+        "completed": stats.completed,
+        "pending": stats.pending,
+    }
+
+
+class TaskServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the TaskManager its handlers use.
+    
+    Attributes:
+        manager: The TaskManager behind every endpoint
+        lock: Held around each manager call when the storage is not
+            thread-safe (None to let requests run concurrently)
+    """
+    
+    daemon_threads = True
+    
+    def __init__(
+        self,
+        address: tuple[str, int],
+        manager: TaskManager,
+        serialize: bool = False,
+    ) -> None:
+        super().__init__(address, TaskRequestHandler)
+        self.manager = manager
+        self.lock: threading.Lock | None = threading.Lock() if serialize else None
+
+
+class TaskRequestHandler(BaseHTTPRequestHandler):
+    """Route JSON requests to TaskManager methods."""
+    
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # body can sit behind the client's delayed ACK on a kept-alive socket.
+    disable_nagle_algorithm = True
+    server: TaskServer
+    
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+    
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+    
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+    
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep request logging off stderr; the server is meant for scripts."""
+    
+    # -------------------------------------------------------------------------
+    # Routing
+    # -------------------------------------------------------------------------
+    
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        try:
+            body = self._read_body()
+            handler, args = self._route(method, parts)
+            query = parse_qs(url.query)
+            lock = self.server.lock
+            with lock if lock is not None else nullcontext():
+                status, payload = handler(self.server.manager, query, body, *args)
+        except APIError as e:
+            status, payload = e.status, {"error": str(e)}
+        except ValueError as e:
+            status, payload = HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        except Exception:
+            # Always answer: a dropped connection tells the client nothing.
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+            payload = {"error": "Internal server error"}
+        self._send(status, payload)
+    
+    def _route(
+        self, method: str, parts: list[str]
+    ) -> tuple[Callable[..., tuple[HTTPStatus, Any]], tuple[int, ...]]:
+        if parts == ["stats"] and method == "GET":
+            return _get_stats, ()
+        if parts[:1] == ["tasks"]:
+            if len(parts) == 1:
+                if method == "GET":
+                    return _list_tasks, ()
+                if method == "POST":
+                    return _create_task, ()
+            elif len(parts) == 2 and method == "POST" and parts[1] in _BATCH_ROUTES:
+                return _BATCH_ROUTES[parts[1]], ()
+            elif parts[1].isdigit():
+                task_id = int(parts[1])
+                if len(parts) == 2 and method in _TASK_ROUTES:
+                    return _TASK_ROUTES[method], (task_id,)
+                if parts[2:] == ["toggle"] and method == "POST":
+                    return _toggle_task, (task_id,)
+        raise APIError(HTTPStatus.NOT_FOUND, f"No route for {method} {self.path}")
+    
+    # -------------------------------------------------------------------------
+    # Wire format
+    # -------------------------------------------------------------------------
+    
+    def _read_body(self) -> Any:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The body cannot be skipped, so the connection cannot be reused.
+            self.close_connection = True
+            raise APIError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if not length:
+            return None
+        raw = self.rfile.read(length)
+        try:
+            return _decode(raw.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise APIError(HTTPStatus.BAD_REQUEST, f"Invalid JSON body: {e}") from e
+    
+    def _send(self, status: HTTPStatus, payload: Any) -> None:
+        body = b"" if payload is None else _encode(payload).encode("utf-8")
+        self.send_response(status)
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        if body:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+# =============================================================================
+# Endpoint handlers: (manager, query, body, *path_args) -> (status, payload)
+# =============================================================================
+
+def _object_body(body: Any) -> dict[str, Any]:
+    if not isinstance(body, dict):
+        raise APIError(HTTPStatus.BAD_REQUEST, "Expected a JSON object body")
+    return body
+
+
+def _optional_field(fields: dict[str, Any], name: str, kind: type) -> Any:
+    """Get a body field that may be absent or null, checking its JSON type."""
+    value = fields.get(name)
+    if value is not None and type(value) is not kind:
+        expected = "a boolean" if kind is bool else "a string"
+        raise APIError(HTTPStatus.BAD_REQUEST, f'"{name}" must be {expected}')
+    return value
+
+
+def _check_record(record: dict[str, Any]) -> dict[str, Any]:
+    """Validate the field types of a task record from a request body."""
+    _optional_field(record, "title", str)
+    _optional_field(record, "description", str)
+    _optional_field(record, "is_complete", bool)
+    return record
+
+
+def _query_int(query: dict[str, list[str]], name: str) -> int | None:
+    values = query.get(name)
+    if not values:
+        return None
+    try:
+        return int(values[-1])
+    except ValueError:
+        raise APIError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer") from None
+
+
+def _get_task_or_404(manager: TaskManager, task_id: int) -> Task:
+    task = manager.get_task(task_id)
+    if task is None:
+        raise APIError(HTTPStatus.NOT_FOUND, f"Task {task_id} not found")
+    return task
+
+
+def _get_stats(manager: TaskManager, query: Any, body: Any) -> tuple[HTTPStatus, Any]:
+    return HTTPStatus.OK, stats_to_json(manager.get_stats())
+
+
+def _list_tasks(
+    manager: TaskManager, query: dict[str, list[str]], body: Any
+) -> tuple[HTTPStatus, Any]:
+    limit = _query_int(query, "limit") or DEFAULT_PAGE_SIZE
+    status = query.get("status", ["all"])[-1]
+    page = manager.get_page(
+        start_id=_query_int(query, "start_id"),
+        limit=min(limit, MAX_PAGE_SIZE),
+        status=status,  # type: ignore[arg-type]
+    )
+    return HTTPStatus.OK, {
+        "tasks": [task_to_json(task) for task in page.tasks],
+        "has_previous": page.has_previous,
+        "has_next": page.has_next,
+        "next_start_id": page.last_id + 1 if page.has_next else None,
+    }
+
+
+def _create_task(manager: TaskManager, query: Any, body: Any) -> tuple[HTTPStatus, Any]:
+    fields = _check_record(_object_body(body))
+    task = manager.add_task(fields.get("title") or "", fields.get("description") or "")
+    return HTTPStatus.CREATED, task_to_json(task)
+
+
+def _create_batch(
+    manager: TaskManager, query: Any, body: Any
+) -> tuple[HTTPStatus, Any]:
+    records = _object_body(body).get("tasks")
+    if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+        raise APIError(HTTPStatus.BAD_REQUEST, '"tasks" must be a list of objects')
+    for record in records:
+        _check_record(record)
+    return HTTPStatus.CREATED, {"created": manager.add_tasks(records)}
+
+
+def _delete_batch(
+    manager: TaskManager, query: Any, body: Any
+) -> tuple[HTTPStatus, Any]:
+    ids = _object_body(body).get("ids")
+    if not isinstance(ids, list) or not all(type(i) is int for i in ids):
+        raise APIError(HTTPStatus.BAD_REQUEST, '"ids" must be a list of integers')
+    results = manager.delete_tasks(ids)
+    return HTTPStatus.OK, {"deleted": [i for i, ok in results.items() if ok]}
+
+
+def _get_task(
+    manager: TaskManager, query: Any, body: Any, task_id: int
+) -> tuple[HTTPStatus, Any]:
+    return HTTPStatus.OK, task_to_json(_get_task_or_404(manager, task_id))
+
+
+def _update_task(
+    manager: TaskManager, query: Any, body: Any, task_id: int
+) -> tuple[HTTPStatus, Any]:
+    fields = _check_record(_object_body(body))
+    _get_task_or_404(manager, task_id)
+    manager.update_task(task_id, fields.get("title"), fields.get("description"))
+    if fields.get("is_complete") is not None:
+        # Set, not toggle: repeating the request leaves the same state.
+        manager.toggle_tasks([task_id], complete=fields["is_complete"])
+    return HTTPStatus.OK, task_to_json(_get_task_or_404(manager, task_id))
+
+
+def _delete_task(
+    manager: TaskManager, query: Any, body: Any, task_id: int
+) -> tuple[HTTPStatus, Any]:
+    if not manager.delete_task(task_id):
+        raise APIError(HTTPStatus.NOT_FOUND, f"Task {task_id} not found")
+    return HTTPStatus.NO_CONTENT, None
+
+
+def _toggle_task(
+    manager: TaskManager, query: Any, body: Any, task_id: int
+) -> tuple[HTTPStatus, Any]:
+    if not manager.toggle_complete(task_id):
+        raise APIError(HTTPStatus.NOT_FOUND, f"Task {task_id} not found")
+    return HTTPStatus.OK, task_to_json(_get_task_or_404(manager, task_id))
+
+
+_BATCH_ROUTES = {"batch": _create_batch, "delete": _delete_batch}
+_TASK_ROUTES = {"GET": _get_task, "PATCH": _update_task, "DELETE": _delete_task}
+
+
+def make_server(
+    manager: TaskManager,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    serialize: bool = False,
+) -> TaskServer:
+    """Create (but do not start) an API server bound to ``host:port``.
+    
+    Args:
+        manager: TaskManager to expose
+        host: Interface to listen on (localhost by default)
+        port: TCP port; 0 picks a free one (see ``server.server_port``)
+        serialize: Run one manager call at a time, for storage backends
+            that are not thread-safe
+    
+    Returns:
+        The bound server; call ``serve_forever()`` to start it
+    """
+    return TaskServer((host, port), manager, serialize=serialize)
@@ -1,5 +1,15 @@
-"""CLI package - Command-line interface for the todo application."""
+"""CLI package - Command-line interface for the todo application.
 
-from src.cli.menu import TodoMenu
+``TodoMenu`` is imported from ``src.cli.menu`` on first access, so the
+scripted subcommands do not load the interactive menu.
+"""
+
+from importlib import import_module
 
 __all__ = ["TodoMenu"]
+
+
+def __getattr__(name: str) -> object:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module("src.cli.menu"), name)
@@ -0,0 +1,130 @@
+"""CLI commands - Non-interactive subcommands for scripts and automation.
+
+Each subcommand performs one operation on a TaskManager and prints its
+result to stdout as JSON lines (one object per task or per ID), so shell
+scripts can pipe the output into ``jq`` or read it line by line. Commands
+that take IDs accept any number of IDs and ranges (``1-200,305``) in one
+invocation, applied as one batch, and the exit status is 1 when any ID was
+not found.
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Callable, Iterable
+from typing import IO, Any
+
+from src.services.task_io import FORMATS, format_for_path, read_tasks, write_jsonl
+from src.services.task_manager import TaskManager, parse_id_ranges
+
+CommandHandler = Callable[[TaskManager, argparse.Namespace, IO[str]], int]
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _print_results(results: Iterable[tuple[int, bool]], out: IO[str]) -> int:
+    """Print one ``{"id", "ok"}`` line per ID; return 1 if any failed."""
+    status = 0
+    for task_id, ok in results:
+        out.write(_encode({"id": task_id, "ok": ok}) + "\n")
+        if not ok:
+            status = 1
+    return status
+
+
+def cmd_add(manager: TaskManager, args: argparse.Namespace, out: IO[str]) -> int:
+    """Add one task per title and print each created task."""
+    tasks = [manager.add_task(title, args.description) for title in args.titles]
+    write_jsonl(tasks, out)
+    return 0
+
+
+def cmd_list(manager: TaskManager, args: argparse.Namespace, out: IO[str]) -> int:
+    """Stream tasks as JSON lines, optionally filtered and limited."""
+    write_jsonl(
+        manager.iter_tasks(start_id=args.start, limit=args.limit, status=args.status),
+        out,
+    )
+    return 0
+
+
+def cmd_done(manager: TaskManager, args: argparse.Namespace, out: IO[str]) -> int:
+    """Mark tasks complete (already-complete tasks are left as they are)."""
+    return _print_results(manager.toggle_tasks(_flatten(args.ids)).items(), out)
+
+
+def cmd_rm(manager: TaskManager, args: argparse.Namespace, out: IO[str]) -> int:
+    """Delete tasks by ID."""
+    return _print_results(manager.delete_tasks(_flatten(args.ids)).items(), out)
+
+
+def cmd_import(manager: TaskManager, args: argparse.Namespace, out: IO[str]) -> int:
+    """Import tasks from a JSONL or CSV file (``-`` for stdin)."""
+    if args.file == "-":
+        created = manager.add_tasks(read_tasks(sys.stdin, args.format or "jsonl"))
+    else:
+        fmt = args.format or format_for_path(args.file)
+        with open(args.file, encoding="utf-8", newline="") as stream:
+            created = manager.add_tasks(read_tasks(stream, fmt))
+    out.write(_encode({"imported": created}) + "\n")
+    return 0
+
+
+def _task_id(value: str) -> int:
+    """argparse type for a positive task ID."""
+    try:
+        task_id = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid task ID: {value!r}") from None
+    if task_id < 1:
+        raise argparse.ArgumentTypeError(f"invalid task ID: {value!r}")
+    return task_id
+
+
+def _id_ranges(value: str) -> list[int]:
+    """argparse type for task IDs and ranges such as ``1-200,305``."""
+    try:
+        return parse_id_ranges(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from None
+
+
+def _flatten(groups: Iterable[list[int]]) -> list[int]:
+    """Join the ID lists of several arguments into one."""
+    return [task_id for group in groups for task_id in group]
+
+
+def add_command_parsers(commands: Any) -> None:
+    """Register the scripted subcommands on an argparse subparsers object.
+    
+    Each subcommand stores its handler as ``args.handler``.
+    """
+    add = commands.add_parser("add", help="add tasks, one per title")
+    add.add_argument("titles", nargs="+", metavar="TITLE")
+    add.add_argument(
+        "-d", "--description", default="", help="description for each task"
+    )
+    add.set_defaults(handler=cmd_add)
+    
+    list_ = commands.add_parser("list", help="print tasks as JSON lines")
+    list_.add_argument(
+        "--status", choices=("all", "pending", "completed"), default="all"
+    )
+    list_.add_argument("--limit", type=int, help="print at most N tasks")
+    list_.add_argument(
+        "--start", type=_task_id, metavar="ID", help="first ID to list"
+    )
+    list_.set_defaults(handler=cmd_list)
+    
+    done = commands.add_parser("done", help="mark tasks complete")
+    done.add_argument("ids", nargs="+", type=_id_ranges, metavar="ID")
+    done.set_defaults(handler=cmd_done)
+    
+    rm = commands.add_parser("rm", help="delete tasks")
+    rm.add_argument("ids", nargs="+", type=_id_ranges, metavar="ID")
+    rm.set_defaults(handler=cmd_rm)
+    
+    import_ = commands.add_parser("import", help="import tasks from JSONL or CSV")
+    import_.add_argument("file", metavar="FILE", help="file to read, or - for stdin")
+    import_.add_argument("--format", choices=FORMATS, help="default: from the suffix")
+    import_.set_defaults(handler=cmd_import)
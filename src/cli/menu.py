@@ -4,21 +4,50 @@ This module provides the user interface layer with reusable input helpers.
 Follows the separation of concerns principle - UI logic separate from business logic.
 """
 
-import os
 import sys
+from collections.abc import Iterable
 from typing import Callable
 
+from src.cli.screen import Screen
 from src.models.task import Task
-from src.services.task_manager import TaskManager
+from src.services.task_manager import (
+    TaskManager,
+    TaskPage,
+    TaskStatus,
+    parse_id_ranges,
+)
 
 
 # =============================================================================
 # Reusable Input Helpers
 # =============================================================================
 
+# Every screen is drawn into this buffer and sent in one write before the
+# next prompt, redrawing only the lines that changed since the last screen.
+screen = Screen()
+
+# Answers to the batch toggle question and the status each one sets.
+BATCH_STATUS_ANSWERS = {
+    "c": True,
+    "complete": True,
+    "i": False,
+    "incomplete": False,
+}
+
+
 def clear_screen() -> None:
-    """Clear the console screen (cross-platform)."""
-    os.system("cls" if os.name == "nt" else "clear")
+    """Start a new screen (cleared with ANSI escapes, no subprocess)."""
+    screen.clear()
+
+
+def echo(text: str = "") -> None:
+    """Add a line of text to the current screen."""
+    screen.write(text + "\n")
+
+
+def read_line(prompt: str) -> str:
+    """Show the current screen and read a line of input."""
+    return screen.input(prompt)
 
 
 def print_header(title: str, width: int = 50) -> None:
@@ -28,14 +57,14 @@ def print_header(title: str, width: int = 50) -> None:
         title: The header text
         width: Total width of the header box
     """
-    print("\n" + "=" * width)
-    print(f" {title.center(width - 2)} ")
-    print("=" * width)
+    echo("\n" + "=" * width)
+    echo(f" {title.center(width - 2)} ")
+    echo("=" * width)
 
 
 def print_divider(char: str = "-", width: int = 50) -> None:
     """Print a divider line."""
-    print(char * width)
+    echo(char * width)
 
 
 def get_input(prompt: str, required: bool = True, validator: Callable[[str], bool] | None = None) -> str:
@@ -50,14 +79,14 @@ def get_input(prompt: str, required: bool = True, validator: Callable[[str], boo
         The validated input string
     """
     while True:
-        value = input(prompt).strip()
+        value = read_line(prompt).strip()
         
         if required and not value:
-            print("  ⚠ This field is required. Please try again.")
+            echo("  ⚠ This field is required. Please try again.")
             continue
         
         if validator and value and not validator(value):
-            print("  ⚠ Invalid input. Please try again.")
+            echo("  ⚠ Invalid input. Please try again.")
             continue
         
         return value
@@ -75,23 +104,39 @@ def get_int_input(prompt: str, min_val: int | None = None, max_val: int | None =
         The validated integer
     """
     while True:
-        value = input(prompt).strip()
+        value = read_line(prompt).strip()
         
         try:
             num = int(value)
             
             if min_val is not None and num < min_val:
-                print(f"  ⚠ Value must be at least {min_val}.")
+                echo(f"  ⚠ Value must be at least {min_val}.")
                 continue
             
             if max_val is not None and num > max_val:
-                print(f"  ⚠ Value must be at most {max_val}.")
+                echo(f"  ⚠ Value must be at most {max_val}.")
                 continue
             
             return num
             
         except ValueError:
-            print("  ⚠ Please enter a valid number.")
+            echo("  ⚠ Please enter a valid number.")
+
+
+def get_ids_input(prompt: str) -> list[int]:
+    """Get one or more task IDs, accepting ranges such as ``1-200,305``.
+    
+    Args:
+        prompt: The prompt to display
+        
+    Returns:
+        The selected IDs in the order given, without duplicates
+    """
+    while True:
+        try:
+            return parse_id_ranges(read_line(prompt))
+        except ValueError as error:
+            echo(f"  ⚠ {error}. Enter IDs like 4 or 1-20,25.")
 
 
 def confirm(prompt: str, default: bool = False) -> bool:
@@ -105,7 +150,7 @@ def confirm(prompt: str, default: bool = False) -> bool:
         True for yes, False for no
     """
     suffix = " [Y/n]: " if default else " [y/N]: "
-    response = input(prompt + suffix).strip().lower()
+    response = read_line(prompt + suffix).strip().lower()
     
     if not response:
         return default
@@ -115,7 +160,7 @@ def confirm(prompt: str, default: bool = False) -> bool:
 
 def pause(message: str = "Press Enter to continue...") -> None:
     """Pause execution until user presses Enter."""
-    input(f"\n{message}")
+    read_line(f"\n{message}")
 
 
 # =============================================================================
@@ -128,37 +173,56 @@ def display_menu_options(options: list[tuple[str, str]]) -> None:
     Args:
         options: List of (number, description) tuples
     """
-    print()
+    echo()
     for num, desc in options:
-        print(f"  [{num}] {desc}")
-    print()
+        echo(f"  [{num}] {desc}")
+    echo()
 
 
-def display_task_list(tasks: list[Task], show_empty_message: bool = True) -> None:
+def display_task_list(tasks: Iterable[Task], show_empty_message: bool = True) -> None:
     """Display a formatted list of tasks.
     
+    Tasks are printed as they are consumed, so a lazy iterator is never
+    materialized.
+    
     Args:
-        tasks: List of tasks to display
+        tasks: Tasks to display (any iterable, e.g. TaskManager.iter_tasks())
         show_empty_message: Whether to show message when no tasks
     """
-    if not tasks:
-        if show_empty_message:
-            print("\n  📭 No tasks found.\n")
-        return
-    
-    print()
+    shown = 0
     for task in tasks:
-        print(f"  {task.to_display_string()}")
-    print()
+        if not shown:
+            echo()
+        echo(f"  {task.to_display_string()}")
+        shown += 1
+    
+    if shown:
+        echo()
+    elif show_empty_message:
+        echo("\n  📭 No tasks found.\n")
+
+
+def display_page_position(page: TaskPage) -> None:
+    """Display which ID range a page covers and which moves are possible."""
+    if page.tasks:
+        echo(f"  Showing IDs {page.first_id}–{page.last_id}")
+    moves = []
+    if page.has_next:
+        moves.append("[n]ext")
+    if page.has_previous:
+        moves.append("[p]rev")
+    moves.extend(["[j]ump to ID", "[q]uit (Enter: next page, or quit on the last)"])
+    echo("  " + "  ".join(moves))
 
 
 def display_task_stats(manager: TaskManager) -> None:
     """Display task statistics."""
-    total = manager.get_task_count()
-    completed = manager.get_completed_count()
-    pending = total - completed
+    stats = manager.get_stats()
     
-    print(f"\n  📊 Tasks: {total} total | ✓ {completed} done | ○ {pending} pending\n")
+    echo(
+        f"\n  📊 Tasks: {stats.total} total | ✓ {stats.completed} done"
+        f" | ○ {stats.pending} pending\n"
+    )
 
 
 # =============================================================================
@@ -185,9 +249,16 @@ class TodoMenu:
         ("3", "Update Task"),
         ("4", "Delete Task"),
         ("5", "Mark Complete/Incomplete"),
-        ("6", "Exit"),
+        ("6", "Search Tasks"),
+        ("7", "View Pending Tasks"),
+        ("8", "View Completed Tasks"),
+        ("u", "Undo"),
+        ("r", "Redo"),
+        ("0", "Exit"),
     ]
     
+    PAGE_SIZE = 20
+    
     def __init__(self, manager: TaskManager | None = None) -> None:
         """Initialize menu with optional TaskManager.
         
@@ -195,6 +266,7 @@ class TodoMenu:
             manager: TaskManager instance (creates new one if None)
         """
         self.manager = manager if manager is not None else TaskManager()
+        self.manager.enable_history()
         self._running = False
     
     def run(self) -> None:
@@ -203,11 +275,12 @@ class TodoMenu:
         
         clear_screen()
         print_header("📝 TODO CONSOLE APP")
-        print("\n  Welcome! Manage your tasks with ease.\n")
+        echo("\n  Welcome! Manage your tasks with ease.\n")
         pause()
         
         while self._running:
             self._show_main_menu()
+        screen.flush()
     
     def stop(self) -> None:
         """Stop the menu loop."""
@@ -229,14 +302,21 @@ class TodoMenu:
             "3": self._update_task,
             "4": self._delete_task,
             "5": self._toggle_complete,
-            "6": self._exit,
+            "6": self._search_tasks,
+            "7": self._view_pending,
+            "8": self._view_completed,
+            "u": self._undo,
+            "r": self._redo,
+            "0": self._exit,
+            # Not listed in MENU_OPTIONS: a screen for troubleshooting.
+            "d": self._show_diagnostics,
         }
         
-        action = actions.get(choice)
+        action = actions.get(choice.lower())
         if action:
             action()
         else:
-            print("  ⚠ Invalid choice. Please try again.")
+            echo("  ⚠ Invalid choice. Please try again.")
             pause()
     
     def _add_task(self) -> None:
@@ -249,51 +329,119 @@ class TodoMenu:
         
         try:
             task = self.manager.add_task(title, description)
-            print(f"\n  ✅ Task added successfully!")
-            print(f"     {task.to_display_string()}")
+            echo(f"\n  ✅ Task added successfully!")
+            echo(f"     {task.to_display_string()}")
         except ValueError as e:
-            print(f"\n  ❌ Error: {e}")
+            echo(f"\n  ❌ Error: {e}")
         
         pause()
     
     def _view_tasks(self) -> None:
-        """Handle viewing all tasks."""
-        clear_screen()
-        print_header("📋 ALL TASKS")
+        """Handle browsing all tasks."""
+        self._browse_tasks("📋 ALL TASKS")
+    
+    def _view_pending(self) -> None:
+        """Handle browsing only the tasks still to do."""
+        self._browse_tasks("○ PENDING TASKS", status="pending")
+    
+    def _view_completed(self) -> None:
+        """Handle browsing only the completed tasks."""
+        self._browse_tasks("✓ COMPLETED TASKS", status="completed")
+    
+    def _browse_tasks(self, title: str, status: TaskStatus = "all") -> None:
+        """Page through tasks with the given status.
         
-        tasks = self.manager.get_all_tasks()
-        display_task_list(tasks)
-        display_task_stats(self.manager)
+        Each page is fetched with a keyset query on the task ID (through the
+        storage's status index when filtering), so moving to page N costs
+        the same as showing page 1.
         
-        pause()
+        Args:
+            title: Screen header
+            status: "all", "pending" or "completed"
+        """
+        limit = self.PAGE_SIZE
+        page = self.manager.get_page(limit=limit, status=status)
+        notice = ""
+        
+        while True:
+            clear_screen()
+            print_header(title)
+            display_task_list(page.tasks)
+            display_task_stats(self.manager)
+            print_divider()
+            display_page_position(page)
+            if notice:
+                echo(f"  {notice}")
+                notice = ""
+            
+            choice = read_line("\n  Choice: ").strip().lower()
+            
+            if choice == "q" or (choice == "" and not page.has_next):
+                return
+            elif choice in ("n", ""):
+                if page.has_next:
+                    page = self.manager.get_page(
+                        page.last_id + 1, limit=limit, status=status
+                    )
+                else:
+                    notice = "ℹ️ This is the last page."
+            elif choice == "p":
+                if page.has_previous:
+                    page = self.manager.get_page_before(
+                        page.first_id, limit=limit, status=status
+                    )
+                else:
+                    notice = "ℹ️ This is the first page."
+            elif choice == "j":
+                task_id = get_int_input("  Jump to ID: ", min_val=1)
+                target = self.manager.get_page(task_id, limit=limit, status=status)
+                if target.tasks:
+                    page = target
+                else:
+                    notice = f"⚠ No tasks at or after ID {task_id}."
+            else:
+                notice = "⚠ Invalid choice. Please try again."
+    
+    def _display_first_page(self) -> None:
+        """Show the first page of tasks and hint at the pager if there is more."""
+        page = self.manager.get_page(limit=self.PAGE_SIZE)
+        display_task_list(page.tasks)
+        if page.has_next:
+            echo(
+                f"  … showing the first {len(page.tasks)} of "
+                f"{self.manager.get_task_count()} tasks "
+                "(browse them with View All Tasks)\n"
+            )
     
     def _update_task(self) -> None:
         """Handle updating an existing task."""
         clear_screen()
         print_header("✏️ UPDATE TASK")
         
-        tasks = self.manager.get_all_tasks()
-        if not tasks:
-            print("\n  📭 No tasks to update.\n")
+        if self.manager.get_task_count() == 0:
+            echo("\n  📭 No tasks to update.\n")
             pause()
             return
         
-        display_task_list(tasks)
+        self._display_first_page()
         print_divider()
         
         task_id = get_int_input("  Enter task ID to update: ", min_val=1)
         
         existing = self.manager.get_task(task_id)
         if not existing:
-            print(f"\n  ❌ Task with ID {task_id} not found.")
+            echo(f"\n  ❌ Task with ID {task_id} not found.")
             pause()
             return
         
-        print(f"\n  Current: {existing.to_display_string()}")
-        print("  (Press Enter to keep current value)\n")
+        echo(f"\n  Current: {existing.to_display_string()}")
+        echo("  (Press Enter to keep current value)\n")
         
-        new_title = input(f"  New title [{existing.title}]: ").strip()
-        new_description = input(f"  New description [{existing.description or '(none)'}]: ").strip()
+        new_title = read_line(f"  New title [{existing.title}]: ").strip()
+        current_description = existing.description or "(none)"
+        new_description = read_line(
+            f"  New description [{current_description}]: "
+        ).strip()
         
         # Use None for unchanged values
         title = new_title if new_title else None
@@ -302,10 +450,10 @@ class TodoMenu:
         if title or description:
             self.manager.update_task(task_id, title=title, description=description)
             updated = self.manager.get_task(task_id)
-            print(f"\n  ✅ Task updated!")
-            print(f"     {updated.to_display_string() if updated else ''}")
+            echo(f"\n  ✅ Task updated!")
+            echo(f"     {updated.to_display_string() if updated else ''}")
         else:
-            print("\n  ℹ️ No changes made.")
+            echo("\n  ℹ️ No changes made.")
         
         pause()
     
@@ -314,30 +462,33 @@ class TodoMenu:
         clear_screen()
         print_header("🗑️ DELETE TASK")
         
-        tasks = self.manager.get_all_tasks()
-        if not tasks:
-            print("\n  📭 No tasks to delete.\n")
+        if self.manager.get_task_count() == 0:
+            echo("\n  📭 No tasks to delete.\n")
             pause()
             return
         
-        display_task_list(tasks)
+        self._display_first_page()
         print_divider()
         
-        task_id = get_int_input("  Enter task ID to delete: ", min_val=1)
+        task_ids = get_ids_input("  Enter task ID(s) to delete (e.g. 4 or 1-20,25): ")
+        if len(task_ids) > 1:
+            self._delete_many(task_ids)
+            return
+        task_id = task_ids[0]
         
         existing = self.manager.get_task(task_id)
         if not existing:
-            print(f"\n  ❌ Task with ID {task_id} not found.")
+            echo(f"\n  ❌ Task with ID {task_id} not found.")
             pause()
             return
         
-        print(f"\n  Task: {existing.to_display_string()}")
+        echo(f"\n  Task: {existing.to_display_string()}")
         
         if confirm("  Are you sure you want to delete this task?"):
             self.manager.delete_task(task_id)
-            print("\n  ✅ Task deleted successfully!")
+            echo("\n  ✅ Task deleted successfully!")
         else:
-            print("\n  ℹ️ Deletion cancelled.")
+            echo("\n  ℹ️ Deletion cancelled.")
         
         pause()
     
@@ -346,20 +497,23 @@ class TodoMenu:
         clear_screen()
         print_header("✓ TOGGLE COMPLETE/INCOMPLETE")
         
-        tasks = self.manager.get_all_tasks()
-        if not tasks:
-            print("\n  📭 No tasks to toggle.\n")
+        if self.manager.get_task_count() == 0:
+            echo("\n  📭 No tasks to toggle.\n")
             pause()
             return
         
-        display_task_list(tasks)
+        self._display_first_page()
         print_divider()
         
-        task_id = get_int_input("  Enter task ID to toggle: ", min_val=1)
+        task_ids = get_ids_input("  Enter task ID(s) to toggle (e.g. 4 or 1-20,25): ")
+        if len(task_ids) > 1:
+            self._toggle_many(task_ids)
+            return
+        task_id = task_ids[0]
         
         existing = self.manager.get_task(task_id)
         if not existing:
-            print(f"\n  ❌ Task with ID {task_id} not found.")
+            echo(f"\n  ❌ Task with ID {task_id} not found.")
             pause()
             return
         
@@ -368,9 +522,112 @@ class TodoMenu:
         updated = self.manager.get_task(task_id)
         new_status = "complete" if updated and updated.is_complete else "incomplete"
         
-        print(f"\n  ✅ Task marked as {new_status}!")
+        echo(f"\n  ✅ Task marked as {new_status}!")
         if updated:
-            print(f"     {updated.to_display_string()}")
+            echo(f"     {updated.to_display_string()}")
+        
+        pause()
+    
+    def _delete_many(self, task_ids: list[int]) -> None:
+        """Delete a batch of tasks after one confirmation."""
+        if confirm(f"  Are you sure you want to delete {len(task_ids)} tasks?"):
+            results = self.manager.delete_tasks(task_ids)
+            self._report_batch(results, "deleted")
+        else:
+            echo("\n  ℹ️ Deletion cancelled.")
+        
+        pause()
+    
+    def _toggle_many(self, task_ids: list[int]) -> None:
+        """Mark a batch of tasks complete or incomplete, or cancel."""
+        answer = get_input(
+            f"  Mark {len(task_ids)} tasks (c)omplete or (i)ncomplete? "
+            "[Enter to cancel]: ",
+            required=False,
+            validator=lambda value: value.lower() in BATCH_STATUS_ANSWERS,
+        )
+        if not answer:
+            echo("\n  ℹ️ No tasks changed.")
+            pause()
+            return
+        complete = BATCH_STATUS_ANSWERS[answer.lower()]
+        results = self.manager.toggle_tasks(task_ids, complete=complete)
+        self._report_batch(
+            results, "marked complete" if complete else "marked incomplete"
+        )
+        pause()
+    
+    def _report_batch(self, results: dict[int, bool], done: str) -> None:
+        """Summarize a batch operation, listing a few IDs that were not found."""
+        missing = [task_id for task_id, ok in results.items() if not ok]
+        echo(f"\n  ✅ {len(results) - len(missing)} task(s) {done}.")
+        if missing:
+            shown = ", ".join(map(str, missing[:10]))
+            more = f" and {len(missing) - 10} more" if len(missing) > 10 else ""
+            echo(f"  ❌ Not found: {shown}{more}")
+    
+    def _search_tasks(self) -> None:
+        """Handle searching task titles and descriptions."""
+        clear_screen()
+        print_header("🔍 SEARCH TASKS")
+        
+        query = get_input("  Search for: ")
+        matches = self.manager.search(query, limit=self.PAGE_SIZE + 1)
+        
+        if not matches:
+            echo(f"\n  📭 No tasks match “{query}”.\n")
+        else:
+            display_task_list(matches[:self.PAGE_SIZE])
+            if len(matches) > self.PAGE_SIZE:
+                echo(
+                    f"  … showing the first {self.PAGE_SIZE} matches "
+                    "(add more words to narrow the search)\n"
+                )
+        
+        pause()
+    
+    def _undo(self) -> None:
+        """Revert the latest change made in this session."""
+        label = self.manager.undo()
+        if label is None:
+            echo("\n  ℹ️ Nothing to undo.")
+        else:
+            echo(f"\n  ↩️ Undone: {label}")
+        pause()
+    
+    def _redo(self) -> None:
+        """Re-apply the latest undone change."""
+        label = self.manager.redo()
+        if label is None:
+            echo("\n  ℹ️ Nothing to redo.")
+        else:
+            echo(f"\n  ↪️ Redone: {label}")
+        pause()
+    
+    def _show_diagnostics(self) -> None:
+        """Show call counts and latencies of manager and storage calls."""
+        clear_screen()
+        print_header("🩺 DIAGNOSTICS")
+        
+        if not self.manager.metrics_enabled:
+            echo("\n  Metrics are off (start with --metrics to collect from launch).")
+            if confirm("  Start collecting them now?"):
+                self.manager.enable_metrics()
+                echo("\n  ✅ Collecting metrics from now on.")
+            pause()
+            return
+        
+        snapshot = self.manager.metrics()
+        if not snapshot:
+            echo("\n  No calls recorded yet.\n")
+        else:
+            echo(f"\n  {'operation':<28}{'calls':>8}{'mean µs':>10}{'p99 µs':>10}")
+            for name, stats in snapshot.items():
+                echo(
+                    f"  {name:<28}{stats.calls:>8}"
+                    f"{stats.mean_us:>10.1f}{stats.p99_us:>10.1f}"
+                )
+            echo()
         
         pause()
     
@@ -380,9 +637,9 @@ class TodoMenu:
         print_header("👋 EXIT")
         
         if confirm("\n  Are you sure you want to exit?"):
-            print("\n  Thank you for using Todo Console App!")
-            print("  Goodbye! 👋\n")
+            echo("\n  Thank you for using Todo Console App!")
+            echo("  Goodbye! 👋\n")
             self.stop()
         else:
-            print("\n  ℹ️ Returning to main menu...")
+            echo("\n  ℹ️ Returning to main menu...")
             pause()
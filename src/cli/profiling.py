@@ -0,0 +1,199 @@
+"""Profiling - Run a todo session under a profiler or allocation tracer.
+
+Used by the ``--profile`` and ``--trace-alloc`` options of the entry
+point. Both wrap a whole session (the menu, ``serve`` or a subcommand)
+and report to stderr when it ends, including when it ends with Ctrl+C,
+so the report does not mix with the menu screens or JSON output.
+
+``--profile`` uses pyinstrument, a sampling profiler with low overhead,
+when it is installed, and the standard library's cProfile otherwise.
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections.abc import Callable
+from typing import IO
+
+TOP_FUNCTIONS = 20
+TOP_ALLOCATIONS = 10
+# Frames kept per allocation, so the report can show who called get_all.
+TRACE_FRAMES = 5
+# Seconds between checks of the traced size for a new high.
+SAMPLE_INTERVAL = 0.05
+
+
+def profile_call[T](
+    run: Callable[[], T],
+    path: str,
+    top: int = TOP_FUNCTIONS,
+    out: IO[str] | None = None,
+) -> T:
+    """Call ``run`` under a profiler, save the stats and print the hot spots.
+    
+    With pyinstrument the session is saved as a pyinstrument session file
+    (view it with ``pyinstrument --load FILE``); with cProfile the stats
+    are saved in pstats format (``python -m pstats FILE``).
+    
+    Args:
+        run: The session to profile
+        path: Where to write the stats file
+        top: Number of functions to print
+        out: Report stream (default: stderr)
+    
+    Returns:
+        Whatever ``run`` returns
+    """
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        return _cprofile_call(run, path, top, out or sys.stderr)
+    
+    profiler = Profiler()
+    profiler.start()
+    try:
+        return run()
+    finally:
+        profiler.stop()
+        report = out or sys.stderr
+        profiler.last_session.save(path)
+        report.write(profiler.output_text(unicode=True, color=False))
+        report.write(f"\nProfile saved to {path} (pyinstrument --load {path})\n")
+
+
+def _cprofile_call[T](run: Callable[[], T], path: str, top: int, out: IO[str]) -> T:
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(run)
+    finally:
+        profiler.dump_stats(path)
+        buffer = io.StringIO()
+        stats = pstats.Stats(profiler, stream=buffer)
+        stats.strip_dirs().sort_stats(pstats.SortKey.TIME).print_stats(top)
+        out.write(f"\nTop {top} functions by own time:\n{buffer.getvalue()}")
+        out.write(f"Profile saved to {path} (python -m pstats {path})\n")
+
+
+def trace_allocations[T](
+    run: Callable[[], T],
+    top: int = TOP_ALLOCATIONS,
+    out: IO[str] | None = None,
+    interval: float = SAMPLE_INTERVAL,
+) -> T:
+    """Call ``run`` with tracemalloc on and print the biggest allocation sites.
+    
+    A snapshot taken at the start is the baseline. While the session runs,
+    a background thread checks the traced size every ``interval`` seconds
+    and snapshots each new high, so temporary allocations (e.g. a task list
+    built by ``get_all`` and dropped after one screen) are still caught
+    once the session has freed them. The report lists the sites that grew
+    most between the baseline and the largest snapshot, each with the
+    calls that led there, and the exact peak traced size. Spikes shorter
+    than ``interval`` only show up in that peak.
+    
+    Args:
+        run: The session to trace
+        top: Number of allocation sites to print
+        out: Report stream (default: stderr)
+        interval: Seconds between checks for a new high
+    
+    Returns:
+        Whatever ``run`` returns
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(TRACE_FRAMES)
+    baseline = _take_snapshot()
+    sampler = _PeakSampler(interval)
+    sampler.start()
+    try:
+        return run()
+    finally:
+        sampler.stop()
+        final = _take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if not was_tracing:
+            tracemalloc.stop()
+        largest = sampler.snapshot
+        if largest is None or _traced_size(final) >= _traced_size(largest):
+            largest = final
+        _print_allocations(baseline, largest, current, peak, top, out or sys.stderr)
+
+
+class _PeakSampler(threading.Thread):
+    """Background thread that snapshots tracemalloc at each new high."""
+    
+    def __init__(self, interval: float) -> None:
+        super().__init__(name="trace-alloc-sampler", daemon=True)
+        self.interval = interval
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self._high = tracemalloc.get_traced_memory()[0]
+        self._stopped = threading.Event()
+    
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            current = tracemalloc.get_traced_memory()[0]
+            if current > self._high:
+                self._high = current
+                self.snapshot = _take_snapshot()
+    
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    # all_frames drops traces with a tracemalloc or import machinery frame
+    # anywhere in the traceback, not only as the allocating frame.
+    return tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__, all_frames=True),
+            tracemalloc.Filter(
+                False, "<frozen importlib._bootstrap>", all_frames=True
+            ),
+            tracemalloc.Filter(
+                False, "<frozen importlib._bootstrap_external>", all_frames=True
+            ),
+        )
+    )
+
+
+def _traced_size(snapshot: tracemalloc.Snapshot) -> int:
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def _print_allocations(
+    baseline: tracemalloc.Snapshot,
+    largest: tracemalloc.Snapshot,
+    current: int,
+    peak: int,
+    top: int,
+    out: IO[str],
+) -> None:
+    growth = [
+        stat
+        for stat in largest.compare_to(baseline, "traceback")
+        if stat.size_diff > 0
+    ]
+    growth.sort(key=lambda stat: stat.size_diff, reverse=True)
+    out.write(
+        f"\nTraced memory: {current / 2**20:.1f} MiB at exit, "
+        f"peak {peak / 2**20:.1f} MiB, "
+        f"largest sample {_traced_size(largest) / 2**20:.1f} MiB\n"
+        f"Top {top} allocation sites grown since the start, at the largest "
+        "sample:\n"
+    )
+    for rank, stat in enumerate(growth[:top], 1):
+        # Tracebacks run from the oldest frame to the allocating one.
+        frame, *callers = reversed(stat.traceback)
+        out.write(
+            f"{rank:>3}. {stat.size_diff / 1024:+10.1f} KiB "
+            f"in {stat.count_diff:>+8} blocks  "
+            f"{frame.filename}:{frame.lineno}\n"
+        )
+        # Callers, innermost first, for context such as get_all <- search.
+        for caller in callers:
+            out.write(f"{'':>35}from {caller.filename}:{caller.lineno}\n")
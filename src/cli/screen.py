@@ -0,0 +1,172 @@
+"""Screen - Buffered terminal rendering with ANSI escapes and diff redraws.
+
+The menu draws one "frame" per screen: ``clear()`` starts a frame, text is
+collected with ``write()``, and ``flush()`` (called before every prompt)
+sends everything in a single ``stream.write``. On a terminal, a new frame
+is compared line by line with what is already on screen and only the
+lines that differ are rewritten in place, so moving between similar
+screens (the main menu, pages of the task list) does not flash the whole
+display. When the output is not a terminal, no escape sequences are
+emitted and the buffered text is written as is.
+"""
+
+import shutil
+import sys
+import unicodedata
+from typing import IO
+
+HOME = "\x1b[H"
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_TO_LINE_END = "\x1b[K"
+CLEAR_TO_SCREEN_END = "\x1b[J"
+
+
+def move_to(row: int) -> str:
+    """Escape sequence moving the cursor to column 1 of a 1-based row."""
+    return f"\x1b[{row};1H"
+
+
+def display_width(text: str) -> int:
+    """Approximate how many terminal cells a line of text occupies.
+    
+    Wide (East Asian and most emoji) characters take two cells; combining
+    marks and variation selectors take none.
+    """
+    width = 0
+    for char in text:
+        if unicodedata.combining(char) or "\ufe00" <= char <= "\ufe0f":
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+    return width
+
+
+class Screen:
+    """Frame buffer for a line-oriented terminal UI.
+    
+    The screen keeps a model of the lines currently displayed (including
+    what the user typed at prompts) and diffs each new frame against it.
+    Any situation the model cannot follow (lines wrapping past the
+    terminal width, frames taller than the terminal, an interrupted
+    prompt) falls back to a full clear and redraw.
+    
+    Attributes:
+        stream: Output stream (None for whatever ``sys.stdout`` is at
+            write time)
+        ansi: Force escape sequences on or off (None to use them only
+            when the stream is a terminal)
+    """
+    
+    def __init__(
+        self, stream: IO[str] | None = None, ansi: bool | None = None
+    ) -> None:
+        self.stream = stream
+        self.ansi = ansi
+        self._buffer: list[str] = []
+        self._new_frame = False
+        # Lines currently on screen; None when unknown (forces a full redraw).
+        self._shown: list[str] | None = None
+    
+    def _stream(self) -> IO[str]:
+        return self.stream if self.stream is not None else sys.stdout
+    
+    def _use_ansi(self) -> bool:
+        if self.ansi is not None:
+            return self.ansi
+        isatty = getattr(self._stream(), "isatty", None)
+        return bool(isatty and isatty())
+    
+    def clear(self) -> None:
+        """Start a new frame, discarding anything not yet flushed."""
+        self._buffer.clear()
+        self._new_frame = True
+    
+    def write(self, text: str) -> None:
+        """Add text to the current frame."""
+        self._buffer.append(text)
+    
+    def flush(self) -> None:
+        """Send the buffered text to the terminal in one write."""
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        if not self._use_ansi():
+            self._new_frame = False
+            if text:
+                self._emit(text)
+            return
+        if self._new_frame:
+            self._new_frame = False
+            self._emit(self._render_frame(text.split("\n")))
+        elif text:
+            self._emit(text)
+            self._advance(text)
+    
+    def input(self, prompt: str = "") -> str:
+        """Flush the frame, then read a line with ``prompt`` shown after it.
+        
+        Everything up to the prompt's last newline becomes part of the
+        frame; the rest is passed to ``input()`` so line editing keeps the
+        prompt intact.
+        """
+        head, newline, tail = prompt.rpartition("\n")
+        self.write(head + newline)
+        self.flush()
+        try:
+            value = input(tail)
+        except BaseException:
+            self._shown = None
+            raise
+        if self._shown is not None:
+            self._advance(f"{tail}{value}\n")
+        return value
+    
+    def invalidate(self) -> None:
+        """Forget what is on screen, e.g. after output bypassed the buffer."""
+        self._shown = None
+    
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+    
+    def _emit(self, text: str) -> None:
+        stream = self._stream()
+        stream.write(text)
+        stream.flush()
+    
+    def _render_frame(self, lines: list[str]) -> str:
+        """Build the output that turns the current display into ``lines``."""
+        shown = self._shown
+        columns, rows = shutil.get_terminal_size()
+        fits = len(lines) <= rows and all(
+            display_width(line) < columns for line in lines
+        )
+        self._shown = lines if fits else None
+        if shown is None or not fits or len(shown) > rows:
+            return HOME + CLEAR_SCREEN + "\n".join(lines)
+        
+        out: list[str] = []
+        if len(shown) > len(lines):
+            out.append(move_to(len(lines) + 1) + CLEAR_TO_SCREEN_END)
+        last = len(lines) - 1
+        for row, line in enumerate(lines):
+            # The last line is always rewritten so the cursor ends after it.
+            if row == last or row >= len(shown) or shown[row] != line:
+                out.append(move_to(row + 1) + line + CLEAR_TO_LINE_END)
+        return "".join(out)
+    
+    def _advance(self, text: str) -> None:
+        """Update the screen model for text written at the cursor."""
+        shown = self._shown
+        if shown is None:
+            return
+        pieces = text.split("\n")
+        if shown:
+            shown[-1] += pieces[0]
+        else:
+            shown.append(pieces[0])
+        shown.extend(pieces[1:])
+        columns, rows = shutil.get_terminal_size()
+        touched = shown[-len(pieces):]
+        if len(shown) > rows or any(
+            display_width(line) >= columns for line in touched
+        ):
+            self._shown = None
@@ -1,13 +1,17 @@
 """Task model - Represents a todo item with id, title, description, and status.
 
 This module provides the core data structure for the todo application.
-Uses Python 3.10+ dataclass features for memory efficiency and type safety.
+Task is a hand-written slotted class rather than a dataclass: it keeps the
+same constructor, equality and repr, but importing it does not pull in the
+dataclasses machinery, which matters for short-lived CLI invocations.
 """
 
-from dataclasses import dataclass, field
+from collections.abc import Mapping
+from typing import Any
+
+UPDATABLE_FIELDS = frozenset({"title", "description", "is_complete"})
 
 
-@dataclass(slots=True, kw_only=True)
 class Task:
     """A todo task with unique ID, title, description, and completion status.
     
@@ -25,22 +29,105 @@ class Task:
         'Buy groceries'
     """
     
+    __slots__ = ("id", "title", "description", "is_complete")
+    
     id: int
     title: str
-    description: str = field(default="")
-    is_complete: bool = field(default=False)
+    description: str
+    is_complete: bool
     
-    def __post_init__(self) -> None:
-        """Validate task data after initialization."""
-        if not self.title or not self.title.strip():
-            raise ValueError("Task title cannot be empty")
+    def __init__(
+        self,
+        *,
+        id: int,
+        title: str,
+        description: str = "",
+        is_complete: bool = False,
+    ) -> None:
+        """Create a task, validating and normalizing its text fields.
         
+        Raises:
+            ValueError: If the title is empty or whitespace
+        """
+        self.id = id
         # Normalize title (strip whitespace)
-        object.__setattr__(self, "title", self.title.strip())
-        
+        self.title = self.clean_title(title)
         # Normalize description
-        if self.description:
-            object.__setattr__(self, "description", self.description.strip())
+        self.description = description.strip() if description else description
+        self.is_complete = is_complete
+    
+    def __repr__(self) -> str:
+        return (
+            f"Task(id={self.id!r}, title={self.title!r}, "
+            f"description={self.description!r}, is_complete={self.is_complete!r})"
+        )
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.id, self.title, self.description, self.is_complete) == (
+            other.id,  # type: ignore[attr-defined]
+            other.title,  # type: ignore[attr-defined]
+            other.description,  # type: ignore[attr-defined]
+            other.is_complete,  # type: ignore[attr-defined]
+        )
+    
+    # Mutable and compared by value, so (like a dataclass) not hashable.
+    __hash__ = None  # type: ignore[assignment]
+    
+    def copy(self) -> "Task":
+        """Return an independent Task with the same field values.
+        
+        The fields were validated when this task was built, so the copy
+        skips ``__init__``; storage layers use it to hand out snapshots.
+        """
+        task = Task.__new__(Task)
+        task.id = self.id
+        task.title = self.title
+        task.description = self.description
+        task.is_complete = self.is_complete
+        return task
+    
+    @staticmethod
+    def clean_title(title: str) -> str:
+        """Validate and normalize a title.
+        
+        Raises:
+            ValueError: If the title is empty or whitespace
+        """
+        if not title or not title.strip():
+            raise ValueError("Task title cannot be empty")
+        return title.strip()
+    
+    @staticmethod
+    def clean_changes(changes: Mapping[str, Any]) -> dict[str, Any]:
+        """Validate and normalize only the fields being changed.
+        
+        Used by storage backends that update tasks in place, so that
+        flipping ``is_complete`` does not re-check the title.
+        
+        Args:
+            changes: New values keyed by field name
+            
+        Returns:
+            The normalized changes
+            
+        Raises:
+            ValueError: If a field is unknown or not updatable, or the new
+                title is empty
+        """
+        if not UPDATABLE_FIELDS.issuperset(changes):
+            unknown = ", ".join(sorted(changes.keys() - UPDATABLE_FIELDS))
+            raise ValueError(f"Cannot update task field(s): {unknown}")
+        
+        cleaned = dict(changes)
+        if "title" in cleaned:
+            cleaned["title"] = Task.clean_title(cleaned["title"])
+        if "description" in cleaned:
+            cleaned["description"] = (cleaned["description"] or "").strip()
+        if "is_complete" in cleaned:
+            cleaned["is_complete"] = bool(cleaned["is_complete"])
+        return cleaned
     
     @property
     def status_icon(self) -> str:
@@ -1,5 +1,29 @@
-"""Services package - Business logic for the todo application."""
+"""Services package - Business logic for the todo application.
 
-from src.services.task_manager import TaskManager
+The exports are resolved on first access, so importing one service module
+(e.g. ``src.services.task_manager``) does not also import the async and
+concurrent modules and their dependencies.
+"""
 
-__all__ = ["TaskManager"]
+from importlib import import_module
+
+_EXPORTS = {
+    "AsyncTaskManager": "src.services.async_task_manager",
+    "CachedStorage": "src.services.cached_storage",
+    "ColumnarStorage": "src.services.columnar_storage",
+    "ConcurrentStorage": "src.services.concurrent_storage",
+    "InMemoryStorage": "src.services.task_manager",
+    "MmapStorage": "src.services.mmap_storage",
+    "ParallelQuery": "src.services.parallel_query",
+    "TaskManager": "src.services.task_manager",
+    "TaskStats": "src.services.task_manager",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
@@ -0,0 +1,445 @@
+"""Async task manager - Coroutine facade over the task storage backends.
+
+AsyncTaskManager offers the TaskManager operations as coroutines so it can
+be embedded in an asyncio application without blocking the event loop.
+Storage is reached through the AsyncTaskStorage protocol; existing sync
+backends are wrapped by AsyncStorageAdapter, which runs each call on a
+small, bounded thread pool. Any number of client coroutines can be waiting
+on the manager at once while only ``max_workers`` threads ever exist.
+"""
+
+import asyncio
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Protocol, TypeVar
+
+from src.models.task import Task
+from src.services.concurrent_storage import ConcurrentStorage
+from src.services.task_manager import (
+    TaskStats,
+    TaskStatus,
+    TaskStorage,
+    batch_ids,
+    status_filter,
+    task_from_record,
+)
+
+_T = TypeVar("_T")
+
+
+class AsyncTaskStorage(Protocol):
+    """Async counterpart of the TaskStorage protocol.
+    
+    Unlike TaskStorage, the aggregate and batch methods are required: an
+    async backend cannot cheaply be probed and fallen back on per call.
+    """
+    
+    async def save(self, task: Task) -> None:
+        """Save a task to storage."""
+        ...
+    
+    async def save_many(self, tasks: Iterable[Task]) -> None:
+        """Save a batch of tasks in one operation."""
+        ...
+    
+    async def update_fields(self, task_id: int, **changes: Any) -> bool:
+        """Change individual fields of a stored task."""
+        ...
+    
+    async def toggle(self, task_id: int) -> bool | None:
+        """Flip a task's status atomically; return the new one (None if not found)."""
+        ...
+    
+    async def delete(self, task_id: int) -> bool:
+        """Delete a task from storage."""
+        ...
+    
+    async def delete_many(self, task_ids: Iterable[int]) -> list[int]:
+        """Delete several tasks in one operation; return the IDs found."""
+        ...
+    
+    async def update_many(self, task_ids: Iterable[int], **changes: Any) -> list[int]:
+        """Apply the same changes to several tasks; return the IDs found."""
+        ...
+    
+    async def get_by_id(self, task_id: int) -> Task | None:
+        """Get a specific task by ID."""
+        ...
+    
+    async def list_tasks(
+        self,
+        start_id: int | None = None,
+        limit: int | None = None,
+        is_complete: bool | None = None,
+    ) -> list[Task]:
+        """Get up to ``limit`` tasks in ID order, starting at ``start_id``."""
+        ...
+    
+    async def stats(self) -> TaskStats:
+        """Get total and completed counts."""
+        ...
+    
+    async def max_id(self) -> int:
+        """Get the highest stored task ID, or 0 when empty."""
+        ...
+
+
+class AsyncStorageAdapter:
+    """Run a synchronous TaskStorage on a bounded thread pool.
+    
+    Every call is handed to one of ``max_workers`` threads, so the event
+    loop never blocks on storage I/O. With more than one worker, calls run
+    concurrently and the wrapped storage must be thread-safe (such as
+    ConcurrentStorage); use ``max_workers=1`` for the other backends.
+    Optional backend methods (``save_many``, ``update_fields``,
+    ``delete_many``, ``update_many``, ``stats``, ``max_id``, ``iter_tasks``)
+    fall back to the basic ones as in
+    TaskManager.
+    
+    Example:
+        >>> async with AsyncStorageAdapter(SQLiteStorage("tasks.db"), 1) as storage:
+        ...     manager = AsyncTaskManager(storage)
+        ...     await manager.add_task("Async")
+    """
+    
+    def __init__(self, storage: TaskStorage, max_workers: int = 4) -> None:
+        """Wrap a sync storage backend.
+        
+        Args:
+            storage: The backend to run in worker threads
+            max_workers: Upper bound on concurrently running storage calls
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.storage = storage
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="task-storage"
+        )
+    
+    async def _run(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Run ``func`` on the worker pool and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(func, *args, **kwargs)
+        )
+    
+    async def save(self, task: Task) -> None:
+        """Save a task to storage."""
+        await self._run(self.storage.save, task)
+    
+    async def save_many(self, tasks: Iterable[Task]) -> None:
+        """Save a batch of tasks in one worker call."""
+        tasks = list(tasks)
+        save_many = getattr(self.storage, "save_many", None)
+        if save_many is not None:
+            await self._run(save_many, tasks)
+        else:
+            await self._run(lambda: [self.storage.save(task) for task in tasks])
+    
+    async def update_fields(self, task_id: int, **changes: Any) -> bool:
+        """Change fields of a task, rebuilding it if the backend cannot."""
+        update_fields = getattr(self.storage, "update_fields", None)
+        if update_fields is not None:
+            return await self._run(update_fields, task_id, **changes)
+        return await self._run(self._rebuild, task_id, changes)
+    
+    async def toggle(self, task_id: int) -> bool | None:
+        """Flip a task's status in one worker call; return the new one.
+        
+        Backends with ``toggle`` flip it atomically; for the others the
+        read and the update run back to back in the same worker call.
+        """
+        toggle = getattr(self.storage, "toggle", None)
+        if toggle is not None:
+            return await self._run(toggle, task_id)
+        return await self._run(self._flip, task_id)
+    
+    async def delete(self, task_id: int) -> bool:
+        """Delete a task. Returns True if found and deleted."""
+        return await self._run(self.storage.delete, task_id)
+    
+    async def delete_many(self, task_ids: Iterable[int]) -> list[int]:
+        """Delete several tasks in one worker call; return the IDs found."""
+        task_ids = list(task_ids)
+        delete_many = getattr(self.storage, "delete_many", None)
+        if delete_many is not None:
+            return await self._run(delete_many, task_ids)
+        delete = self.storage.delete
+        return await self._run(lambda: [i for i in task_ids if delete(i)])
+    
+    async def update_many(self, task_ids: Iterable[int], **changes: Any) -> list[int]:
+        """Apply the same changes to several tasks in one worker call."""
+        task_ids = list(task_ids)
+        update_many = getattr(self.storage, "update_many", None)
+        if update_many is not None:
+            return await self._run(update_many, task_ids, **changes)
+        update_fields = getattr(self.storage, "update_fields", None)
+        if update_fields is None:
+            return await self._run(
+                lambda: [i for i in task_ids if self._rebuild(i, changes)]
+            )
+        return await self._run(
+            lambda: [i for i in task_ids if update_fields(i, **changes)]
+        )
+    
+    async def get_by_id(self, task_id: int) -> Task | None:
+        """Get a task by ID, or None if not found."""
+        return await self._run(self.storage.get_by_id, task_id)
+    
+    async def list_tasks(
+        self,
+        start_id: int | None = None,
+        limit: int | None = None,
+        is_complete: bool | None = None,
+    ) -> list[Task]:
+        """Read a run of tasks in one worker call."""
+        return await self._run(self._list, start_id, limit, is_complete)
+    
+    async def stats(self) -> TaskStats:
+        """Get total and completed counts."""
+        stats = getattr(self.storage, "stats", None)
+        if stats is not None:
+            return await self._run(stats)
+        tasks = await self._run(self.storage.get_all)
+        completed = sum(1 for task in tasks if task.is_complete)
+        return TaskStats(total=len(tasks), completed=completed)
+    
+    async def max_id(self) -> int:
+        """Get the highest stored task ID, or 0 when empty."""
+        max_id = getattr(self.storage, "max_id", None)
+        if max_id is not None:
+            return await self._run(max_id)
+        tasks = await self._run(self.storage.get_all)
+        return tasks[-1].id if tasks else 0
+    
+    def _list(
+        self, start_id: int | None, limit: int | None, is_complete: bool | None
+    ) -> list[Task]:
+        iter_tasks = getattr(self.storage, "iter_tasks", None)
+        if iter_tasks is not None:
+            return list(iter_tasks(start_id, limit, is_complete=is_complete))
+        tasks = [
+            task
+            for task in self.storage.get_all()
+            if (start_id is None or task.id >= start_id)
+            and (is_complete is None or task.is_complete == is_complete)
+        ]
+        return tasks[:limit] if limit is not None else tasks
+    
+    def _flip(self, task_id: int) -> bool | None:
+        existing = self.storage.get_by_id(task_id)
+        if existing is None:
+            return None
+        changes = {"is_complete": not existing.is_complete}
+        update_fields = getattr(self.storage, "update_fields", None)
+        if update_fields is not None:
+            found = update_fields(task_id, **changes)
+        else:
+            found = self._rebuild(task_id, changes)
+        return changes["is_complete"] if found else None
+    
+    def _rebuild(self, task_id: int, changes: dict[str, Any]) -> bool:
+        existing = self.storage.get_by_id(task_id)
+        if existing is None:
+            return False
+        fields = {
+            "title": existing.title,
+            "description": existing.description,
+            "is_complete": existing.is_complete,
+        }
+        fields.update(Task.clean_changes(changes))
+        self.storage.save(Task(id=task_id, **fields))
+        return True
+    
+    async def aclose(self) -> None:
+        """Wait for running calls to finish and stop the worker threads."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, partial(self._executor.shutdown, wait=True)
+        )
+    
+    async def __aenter__(self) -> "AsyncStorageAdapter":
+        return self
+    
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
+class AsyncTaskManager:
+    """TaskManager operations as coroutines over async storage.
+    
+    IDs are handed out on the event loop, where no other coroutine can run
+    between reading and bumping the counter, so concurrent ``add_task``
+    calls always get distinct IDs.
+    
+    Use it as an async context manager (or call ``aclose``) so the default
+    storage's worker threads are stopped when the manager is done.
+    
+    Example:
+        >>> async with AsyncTaskManager() as manager:
+        ...     tasks = await asyncio.gather(
+        ...         *(manager.add_task(f"Task {n}") for n in range(1000))
+        ...     )
+    """
+    
+    def __init__(self, storage: AsyncTaskStorage | None = None) -> None:
+        """Initialize with async storage.
+        
+        Args:
+            storage: Async backend; defaults to a ConcurrentStorage behind
+                an AsyncStorageAdapter with several workers, which the
+                manager then owns and closes in ``aclose``
+        """
+        self._owned_adapter: AsyncStorageAdapter | None = None
+        if storage is None:
+            storage = self._owned_adapter = AsyncStorageAdapter(
+                ConcurrentStorage(), max_workers=8
+            )
+        self._storage = storage
+        # Read from storage on the first add, since __init__ cannot await.
+        self._next_id: int | None = None
+        self._id_lock = asyncio.Lock()
+    
+    async def _allocate_ids(self, count: int) -> int:
+        """Reserve ``count`` consecutive IDs and return the first."""
+        if self._next_id is None:
+            async with self._id_lock:
+                if self._next_id is None:
+                    self._next_id = await self._storage.max_id() + 1
+        first_id = self._next_id
+        self._next_id = first_id + count
+        return first_id
+    
+    async def add_task(self, title: str, description: str = "") -> Task:
+        """Create a new task with auto-generated ID.
+        
+        Raises:
+            ValueError: If title is empty or whitespace
+        """
+        task = Task(id=0, title=title, description=description)
+        task.id = await self._allocate_ids(1)
+        await self._storage.save(task)
+        return task
+    
+    async def add_tasks(self, records: Iterable[dict[str, Any]]) -> int:
+        """Create tasks from records in one storage call.
+        
+        Returns:
+            Number of tasks created
+        
+        Raises:
+            ValueError: If a record has no title or an invalid one
+        """
+        try:
+            tasks = [task_from_record(record) for record in records]
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"Invalid task record: {e}") from e
+        if not tasks:
+            return 0
+        first_id = await self._allocate_ids(len(tasks))
+        for task_id, task in enumerate(tasks, start=first_id):
+            task.id = task_id
+        await self._storage.save_many(tasks)
+        return len(tasks)
+    
+    async def get_task(self, task_id: int) -> Task | None:
+        """Get a specific task by ID, or None if not found."""
+        return await self._storage.get_by_id(task_id)
+    
+    async def get_tasks(
+        self,
+        status: TaskStatus = "all",
+        start_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        """Get tasks with the given status in ID order.
+        
+        Raises:
+            ValueError: If ``status`` is not a known status
+        """
+        return await self._storage.list_tasks(start_id, limit, status_filter(status))
+    
+    async def update_task(
+        self,
+        task_id: int,
+        title: str | None = None,
+        description: str | None = None,
+    ) -> bool:
+        """Update a task's title and/or description.
+        
+        Returns:
+            True if task found and updated, False otherwise
+        
+        Raises:
+            ValueError: If the new title is empty or whitespace
+        """
+        changes: dict[str, Any] = {}
+        if title is not None:
+            changes["title"] = title
+        if description is not None:
+            changes["description"] = description
+        return await self._storage.update_fields(task_id, **changes)
+    
+    async def delete_task(self, task_id: int) -> bool:
+        """Delete a task. Returns True if found and deleted."""
+        return await self._storage.delete(task_id)
+    
+    async def delete_tasks(self, ids: str | Iterable[int]) -> dict[int, bool]:
+        """Delete several tasks in one storage operation.
+        
+        Args:
+            ids: Task IDs, or ID ranges as text (``"1-200,305"``)
+        
+        Returns:
+            Whether each ID was found and deleted, in the order given
+        """
+        task_ids = batch_ids(ids)
+        deleted = set(await self._storage.delete_many(task_ids))
+        return {task_id: task_id in deleted for task_id in task_ids}
+    
+    async def toggle_tasks(
+        self, ids: str | Iterable[int], complete: bool = True
+    ) -> dict[int, bool]:
+        """Mark several tasks complete (or pending) in one storage operation.
+        
+        Returns:
+            Whether each ID was found, in the order given
+        """
+        task_ids = batch_ids(ids)
+        found = set(await self._storage.update_many(task_ids, is_complete=complete))
+        return {task_id: task_id in found for task_id in task_ids}
+    
+    async def toggle_complete(self, task_id: int) -> bool:
+        """Toggle a task's completion status.
+        
+        Returns:
+            True if task found and toggled, False otherwise
+        """
+        return await self._storage.toggle(task_id) is not None
+    
+    async def get_task_count(self) -> int:
+        """Get the total number of tasks."""
+        return (await self._storage.stats()).total
+    
+    async def get_completed_count(self) -> int:
+        """Get the number of completed tasks."""
+        return (await self._storage.stats()).completed
+    
+    async def get_stats(self) -> TaskStats:
+        """Get total, completed and pending counts in one call."""
+        return await self._storage.stats()
+    
+    async def aclose(self) -> None:
+        """Stop the worker threads of the default storage, if it was used.
+        
+        Storage passed to the constructor belongs to the caller and is left
+        open.
+        """
+        if self._owned_adapter is not None:
+            await self._owned_adapter.aclose()
+    
+    async def __aenter__(self) -> "AsyncTaskManager":
+        return self
+    
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
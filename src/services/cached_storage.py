@@ -0,0 +1,258 @@
+"""Cached storage - A bounded LRU read cache in front of any backend.
+
+Interactive workflows read the same task several times in a row: the
+menu fetches a task to show it, TaskManager fetches it again to change
+it, and the menu fetches it once more to show the result. CachedStorage
+answers the repeated ``get_by_id`` calls from memory so that only the
+first one reaches a disk or SQL backend.
+
+Writes go straight to the backend (write-through). A saved task replaces
+its cache entry, ``update_fields`` applies the same changes to the cached
+copy, and a delete drops the entry, so the cache never serves a value the
+backend no longer holds. Reads that span many tasks (iteration, counts)
+are not cached and go to the backend.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple
+
+from src.models.task import Task
+from src.services.task_manager import TaskStorage
+
+
+class CacheInfo(NamedTuple):
+    """Counters for a CachedStorage, in the style of ``functools.lru_cache``."""
+    
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    capacity: int
+
+
+class CachedStorage:
+    """TaskStorage wrapper that caches ``get_by_id`` results.
+    
+    Any backend method the wrapper does not define (``stats``, ``max_id``,
+    ``close`` and so on) is looked up on the backend, so TaskManager sees
+    the same optional methods it would see on the backend itself.
+    
+    The cache is not synchronized: share it between threads only behind
+    one lock, and do not use it when another process writes to the same
+    data file, since those changes would not invalidate the cache.
+    
+    Attributes:
+        backend: The wrapped storage
+        capacity: Maximum number of cached tasks
+    
+    Example:
+        >>> storage = CachedStorage(SQLiteStorage("tasks.db"), capacity=256)
+        >>> manager = TaskManager(storage)
+        >>> storage.cache_info()
+        CacheInfo(hits=0, misses=0, evictions=0, size=0, capacity=256)
+    """
+    
+    def __init__(self, backend: TaskStorage, capacity: int = 1024) -> None:
+        """Wrap a backend.
+        
+        Args:
+            backend: Storage to read from and write through to
+            capacity: Maximum number of cached tasks
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.backend = backend
+        self.capacity = capacity
+        # Least recently used first; values are private copies.
+        self._cache: OrderedDict[int, Task] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the wrapper itself.
+        if name == "backend":
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+    
+    # -------------------------------------------------------------------------
+    # Cached reads
+    # -------------------------------------------------------------------------
+    
+    def get_by_id(self, task_id: int) -> Task | None:
+        """Get a task by ID, from the cache when possible."""
+        cache = self._cache
+        task = cache.get(task_id)
+        if task is not None:
+            cache.move_to_end(task_id)
+            self.hits += 1
+            return task.copy()
+        self.misses += 1
+        task = self.backend.get_by_id(task_id)
+        if task is not None:
+            self._put(task)
+        return task
+    
+    def cache_info(self) -> CacheInfo:
+        """Get the hit, miss and eviction counters and the current size."""
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, len(self._cache), self.capacity
+        )
+    
+    def cache_clear(self) -> None:
+        """Empty the cache and reset the counters."""
+        self._cache.clear()
+        self.hits = self.misses = self.evictions = 0
+    
+    # -------------------------------------------------------------------------
+    # Write-through
+    # -------------------------------------------------------------------------
+    
+    def save(self, task: Task) -> None:
+        """Save a task to the backend and cache it."""
+        self.backend.save(task)
+        self._put(task)
+    
+    def save_many(self, tasks: Iterable[Task]) -> None:
+        """Save a batch to the backend, refreshing tasks already cached.
+        
+        New tasks are not added, so a large import does not flush the
+        tasks currently in use out of the cache.
+        """
+        save_many = getattr(self.backend, "save_many", None)
+        if save_many is None:
+            for task in tasks:
+                self.backend.save(task)
+                self._refresh(task)
+            return
+        tasks = list(tasks)
+        save_many(tasks)
+        for task in tasks:
+            self._refresh(task)
+    
+    def update_fields(self, task_id: int, **changes: Any) -> bool:
+        """Change fields in the backend and in the cached copy.
+        
+        Backends without ``update_fields`` get a rebuilt Task saved.
+        
+        Raises:
+            ValueError: If a field is unknown or the new title is empty
+        """
+        changes = Task.clean_changes(changes)
+        update_fields = getattr(self.backend, "update_fields", None)
+        if update_fields is None:
+            task = self.get_by_id(task_id)
+            if task is None:
+                return False
+            for name, value in changes.items():
+                setattr(task, name, value)
+            self.save(task)
+            return True
+        if not update_fields(task_id, **changes):
+            self._cache.pop(task_id, None)
+            return False
+        cached = self._cache.get(task_id)
+        if cached is not None:
+            for name, value in changes.items():
+                setattr(cached, name, value)
+        return True
+    
+    def toggle(self, task_id: int) -> bool | None:
+        """Flip a task's status in the backend and in the cached copy.
+        
+        Backends without ``toggle`` get a read followed by an update.
+        """
+        toggle = getattr(self.backend, "toggle", None)
+        if toggle is not None:
+            is_complete = toggle(task_id)
+        else:
+            task = self.backend.get_by_id(task_id)
+            is_complete = None if task is None else not task.is_complete
+            if is_complete is not None:
+                self.update_fields(task_id, is_complete=is_complete)
+        if is_complete is None:
+            self._cache.pop(task_id, None)
+        elif task_id in self._cache:
+            self._cache[task_id].is_complete = is_complete
+        return is_complete
+    
+    def delete(self, task_id: int) -> bool:
+        """Delete a task from the backend and drop its cache entry."""
+        self._cache.pop(task_id, None)
+        return self.backend.delete(task_id)
+    
+    def delete_many(self, task_ids: Iterable[int]) -> list[int]:
+        """Delete several tasks and drop their cache entries.
+        
+        Backends without ``delete_many`` get one ``delete`` per ID.
+        
+        Returns:
+            The IDs that were found and deleted
+        """
+        task_ids = list(task_ids)
+        for task_id in task_ids:
+            self._cache.pop(task_id, None)
+        delete_many = getattr(self.backend, "delete_many", None)
+        if delete_many is None:
+            return [task_id for task_id in task_ids if self.backend.delete(task_id)]
+        return delete_many(task_ids)
+    
+    def update_many(self, task_ids: Iterable[int], **changes: Any) -> list[int]:
+        """Apply the same changes in the backend and to cached copies.
+        
+        Backends without ``update_many`` get one ``update_fields`` per ID.
+        
+        Returns:
+            The IDs that were found
+        
+        Raises:
+            ValueError: If a field is unknown or the new title is empty
+        """
+        changes = Task.clean_changes(changes)
+        update_many = getattr(self.backend, "update_many", None)
+        if update_many is None:
+            update = self.update_fields
+            return [task_id for task_id in task_ids if update(task_id, **changes)]
+        updated = update_many(task_ids, **changes)
+        cache = self._cache
+        for task_id in updated:
+            cached = cache.get(task_id)
+            if cached is not None:
+                for name, value in changes.items():
+                    setattr(cached, name, value)
+        return updated
+    
+    # -------------------------------------------------------------------------
+    # Uncached reads
+    # -------------------------------------------------------------------------
+    
+    def get_all(self) -> list[Task]:
+        """Get all tasks from the backend."""
+        return self.backend.get_all()
+    
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over the backend's tasks in ID order."""
+        return iter(self.backend)
+    
+    def __len__(self) -> int:
+        """Return the number of tasks in the backend."""
+        return len(self.backend)  # type: ignore[arg-type]
+    
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+    
+    def _put(self, task: Task) -> None:
+        """Cache a copy of ``task`` as the most recently used entry."""
+        cache = self._cache
+        cache[task.id] = task.copy()
+        cache.move_to_end(task.id)
+        if len(cache) > self.capacity:
+            cache.popitem(last=False)
+            self.evictions += 1
+    
+    def _refresh(self, task: Task) -> None:
+        """Replace the cached copy of ``task`` if there is one."""
+        if task.id in self._cache:
+            self._cache[task.id] = task.copy()
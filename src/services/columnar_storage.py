@@ -0,0 +1,389 @@
+"""Columnar storage - Memory-compact in-memory storage for very large task sets.
+
+InMemoryStorage keeps a Task object, two str objects, a dict entry and a
+set entry per task, which is a few hundred bytes before any actual text.
+ColumnarStorage instead keeps one row per task spread over flat columns:
+
+- ``array('q')`` of task IDs (kept sorted, so lookups are a bisect)
+- ``array('q')`` of text offsets and ``array('l')`` of title/description
+  lengths into one UTF-8 ``bytearray`` arena holding all text
+- two bit arrays (``bytearray``) for ``is_complete`` and deleted rows
+
+That is roughly 24 bytes per task plus its encoded text. Task objects are
+built only when a task is returned, and are snapshots: changing one does
+not change the store (use ``update_fields``).
+
+Deletes leave a tombstone and rewritten text leaves dead bytes in the
+arena; both are reclaimed by ``compact()``, which runs automatically once
+they make up half of the store. Tasks saved with an ID below the current
+maximum go to a small overflow map and are merged into ID order by the
+next ordered read or compaction.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from src.models.task import Task
+from src.services.task_manager import TaskPredicate, TaskStats, filter_tasks
+
+# Out-of-order rows are merged into ID order once there are this many.
+_OVERFLOW_LIMIT = 4096
+
+
+def _get_bit(bits: bytearray, row: int) -> bool:
+    return bool(bits[row >> 3] >> (row & 7) & 1)
+
+
+def _set_bit(bits: bytearray, row: int, value: bool) -> None:
+    if value:
+        bits[row >> 3] |= 1 << (row & 7)
+    else:
+        bits[row >> 3] &= ~(1 << (row & 7)) & 0xFF
+
+
+class ColumnarStorage:
+    """Storage backend that keeps tasks in packed columns.
+    
+    Reads cost a bisect over the ID column plus decoding the row's text;
+    ordered scans walk the columns and build Tasks lazily. Counts are kept
+    incrementally and are O(1).
+    
+    Example:
+        >>> manager = TaskManager(ColumnarStorage())
+        >>> manager.add_tasks({"title": f"Task {n}"} for n in range(10_000_000))
+    """
+    
+    def __init__(self) -> None:
+        """Initialize empty storage."""
+        self._ids = array("q")
+        self._offsets = array("q")
+        self._title_lengths = array("l")
+        self._description_lengths = array("l")
+        self._arena = bytearray()
+        self._complete = bytearray()
+        self._deleted = bytearray()
+        # Rows from _sorted_rows onwards were appended out of ID order.
+        self._sorted_rows = 0
+        self._overflow: dict[int, int] = {}
+        self._live = 0
+        self._completed = 0
+        self._dead_rows = 0
+        self._dead_bytes = 0
+    
+    # -------------------------------------------------------------------------
+    # TaskStorage protocol
+    # -------------------------------------------------------------------------
+    
+    def save(self, task: Task) -> None:
+        """Insert or replace a task."""
+        row = self._find_row(task.id)
+        if row is None:
+            self._append(task)
+            return
+        if _get_bit(self._deleted, row):
+            _set_bit(self._deleted, row, False)
+            self._dead_rows -= 1
+            self._dead_bytes -= (
+                self._title_lengths[row] + self._description_lengths[row]
+            )
+            self._live += 1
+        elif _get_bit(self._complete, row):
+            self._completed -= 1
+        self._write_text(row, task.title, task.description)
+        _set_bit(self._complete, row, task.is_complete)
+        if task.is_complete:
+            self._completed += 1
+        self._maybe_compact()
+    
+    def save_many(self, tasks: Iterable[Task]) -> None:
+        """Save a batch of tasks; new ascending IDs take the append fast path."""
+        ids = self._ids
+        append = self._append
+        save = self.save
+        for task in tasks:
+            if not self._overflow and (not ids or task.id > ids[-1]):
+                append(task)
+            else:
+                save(task)
+    
+    def update_fields(self, task_id: int, **changes: Any) -> bool:
+        """Change fields of a stored task.
+        
+        Returns:
+            True if the task was found and updated, False otherwise
+        
+        Raises:
+            ValueError: If a field is unknown or the new title is empty
+        """
+        row = self._live_row(task_id)
+        if row is None:
+            return False
+        changes = Task.clean_changes(changes)
+        if "title" in changes or "description" in changes:
+            title, description = self._text(row)
+            self._write_text(
+                row,
+                changes.get("title", title),
+                changes.get("description", description),
+            )
+        if "is_complete" in changes:
+            was_complete = _get_bit(self._complete, row)
+            if changes["is_complete"] != was_complete:
+                _set_bit(self._complete, row, changes["is_complete"])
+                self._completed += 1 if changes["is_complete"] else -1
+        self._maybe_compact()
+        return True
+    
+    def delete(self, task_id: int) -> bool:
+        """Delete a task. Returns True if found and deleted."""
+        row = self._live_row(task_id)
+        if row is None:
+            return False
+        _set_bit(self._deleted, row, True)
+        if _get_bit(self._complete, row):
+            _set_bit(self._complete, row, False)
+            self._completed -= 1
+        self._live -= 1
+        self._dead_rows += 1
+        self._dead_bytes += self._title_lengths[row] + self._description_lengths[row]
+        self._maybe_compact()
+        return True
+    
+    def get_all(self) -> list[Task]:
+        """Get all tasks, sorted by ID."""
+        return list(self.iter_tasks())
+    
+    def get_by_id(self, task_id: int) -> Task | None:
+        """Get a task by ID, or None if not found."""
+        row = self._live_row(task_id)
+        return self._task(row) if row is not None else None
+    
+    def iter_tasks(
+        self,
+        start_id: int | None = None,
+        limit: int | None = None,
+        predicate: TaskPredicate | None = None,
+        reverse: bool = False,
+        is_complete: bool | None = None,
+    ) -> Iterator[Task]:
+        """Lazily yield tasks in ID order from ``start_id`` (inclusive).
+        
+        The start row is found by bisecting the ID column; tombstoned rows
+        and rows with the wrong status are skipped by checking their bits
+        before any Task is built.
+        """
+        if self._overflow:
+            self.compact()
+        return filter_tasks(
+            self._scan(start_id, reverse, is_complete), limit, predicate
+        )
+    
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over tasks in ID order."""
+        return self.iter_tasks()
+    
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return self._live
+    
+    def count(self) -> int:
+        """Get the number of stored tasks in O(1)."""
+        return self._live
+    
+    def stats(self) -> TaskStats:
+        """Get total and completed counts in O(1)."""
+        return TaskStats(total=self._live, completed=self._completed)
+    
+    def max_id(self) -> int:
+        """Get the highest stored task ID, or 0 when empty."""
+        highest = max(self._overflow, default=0)
+        ids = self._ids
+        deleted = self._deleted
+        for row in range(self._sorted_rows - 1, -1, -1):
+            if not _get_bit(deleted, row):
+                return max(highest, ids[row])
+        return highest
+    
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+    
+    def compact(self) -> None:
+        """Drop tombstones and dead text and put every row in ID order.
+        
+        Builds new columns, so iterators started earlier keep reading the
+        old ones undisturbed.
+        """
+        ids = self._ids
+        deleted = self._deleted
+        live_rows = [row for row in range(len(ids)) if not _get_bit(deleted, row)]
+        if self._overflow:
+            live_rows.sort(key=ids.__getitem__)
+        
+        new_ids = array("q")
+        offsets = array("q")
+        title_lengths = array("l")
+        description_lengths = array("l")
+        arena = bytearray()
+        complete = bytearray((len(live_rows) + 7) >> 3)
+        for new_row, row in enumerate(live_rows):
+            start = self._offsets[row]
+            size = self._title_lengths[row] + self._description_lengths[row]
+            new_ids.append(ids[row])
+            offsets.append(len(arena))
+            title_lengths.append(self._title_lengths[row])
+            description_lengths.append(self._description_lengths[row])
+            arena += self._arena[start:start + size]
+            if _get_bit(self._complete, row):
+                _set_bit(complete, new_row, True)
+        
+        self._ids = new_ids
+        self._offsets = offsets
+        self._title_lengths = title_lengths
+        self._description_lengths = description_lengths
+        self._arena = arena
+        self._complete = complete
+        self._deleted = bytearray(len(complete))
+        self._sorted_rows = len(new_ids)
+        self._overflow = {}
+        self._dead_rows = 0
+        self._dead_bytes = 0
+    
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the columns (excluding object headers)."""
+        return (
+            self._ids.itemsize * len(self._ids)
+            + self._offsets.itemsize * len(self._offsets)
+            + self._title_lengths.itemsize * len(self._title_lengths)
+            + self._description_lengths.itemsize * len(self._description_lengths)
+            + len(self._arena)
+            + len(self._complete)
+            + len(self._deleted)
+        )
+    
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+    
+    def _find_row(self, task_id: int) -> int | None:
+        """Locate a task's row, including tombstoned ones."""
+        row = self._overflow.get(task_id)
+        if row is not None:
+            return row
+        ids = self._ids
+        row = bisect_left(ids, task_id, 0, self._sorted_rows)
+        if row < self._sorted_rows and ids[row] == task_id:
+            return row
+        return None
+    
+    def _live_row(self, task_id: int) -> int | None:
+        """Locate a task's row unless it is missing or deleted."""
+        row = self._find_row(task_id)
+        if row is None or _get_bit(self._deleted, row):
+            return None
+        return row
+    
+    def _append(self, task: Task) -> None:
+        """Add a row for a task whose ID is not stored yet."""
+        row = len(self._ids)
+        in_order = not self._overflow and (not self._ids or task.id > self._ids[-1])
+        self._ids.append(task.id)
+        title = task.title.encode()
+        description = task.description.encode()
+        self._offsets.append(len(self._arena))
+        self._title_lengths.append(len(title))
+        self._description_lengths.append(len(description))
+        self._arena += title
+        self._arena += description
+        if not row & 7:
+            self._complete.append(0)
+            self._deleted.append(0)
+        if task.is_complete:
+            _set_bit(self._complete, row, True)
+            self._completed += 1
+        self._live += 1
+        if in_order:
+            self._sorted_rows = row + 1
+        else:
+            self._overflow[task.id] = row
+            if len(self._overflow) >= _OVERFLOW_LIMIT:
+                self.compact()
+    
+    def _write_text(self, row: int, title: str, description: str) -> None:
+        """Point a row at new text, appending it to the arena if it changed."""
+        encoded_title = title.encode()
+        encoded_description = description.encode()
+        old_size = self._title_lengths[row] + self._description_lengths[row]
+        start = self._offsets[row]
+        new_text = encoded_title + encoded_description
+        if self._arena[start:start + old_size] == new_text and (
+            len(encoded_title) == self._title_lengths[row]
+        ):
+            return
+        self._dead_bytes += old_size
+        self._offsets[row] = len(self._arena)
+        self._title_lengths[row] = len(encoded_title)
+        self._description_lengths[row] = len(encoded_description)
+        self._arena += new_text
+    
+    def _text(self, row: int) -> tuple[str, str]:
+        start = self._offsets[row]
+        middle = start + self._title_lengths[row]
+        end = middle + self._description_lengths[row]
+        arena = self._arena
+        return arena[start:middle].decode(), arena[middle:end].decode()
+    
+    def _task(self, row: int) -> Task:
+        title, description = self._text(row)
+        return Task(
+            id=self._ids[row],
+            title=title,
+            description=description,
+            is_complete=_get_bit(self._complete, row),
+        )
+    
+    def _scan(
+        self, start_id: int | None, reverse: bool, is_complete: bool | None
+    ) -> Iterator[Task]:
+        """Yield Tasks for the live rows matching ``is_complete``.
+        
+        The columns are bound once when the scan starts: a compaction while
+        it is suspended swaps in new columns and leaves these ones intact.
+        """
+        ids = self._ids
+        rows: Iterable[int]
+        if reverse:
+            end = bisect_right(ids, start_id) if start_id is not None else len(ids)
+            rows = range(end - 1, -1, -1)
+        else:
+            start = bisect_left(ids, start_id) if start_id is not None else 0
+            rows = range(start, len(ids))
+        offsets = self._offsets
+        title_lengths = self._title_lengths
+        description_lengths = self._description_lengths
+        arena = self._arena
+        complete = self._complete
+        deleted = self._deleted
+        for row in rows:
+            byte = row >> 3
+            mask = 1 << (row & 7)
+            if deleted[byte] & mask:
+                continue
+            done = bool(complete[byte] & mask)
+            if is_complete is not None and done != is_complete:
+                continue
+            start = offsets[row]
+            middle = start + title_lengths[row]
+            yield Task(
+                id=ids[row],
+                title=arena[start:middle].decode(),
+                description=arena[middle:middle + description_lengths[row]].decode(),
+                is_complete=done,
+            )
+    
+    def _maybe_compact(self) -> None:
+        """Compact once dead rows or dead text make up half of the store."""
+        if self._dead_rows > self._live or self._dead_bytes > len(self._arena) // 2:
+            self.compact()
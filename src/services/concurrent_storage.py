@@ -0,0 +1,207 @@
+"""Concurrent storage - Thread-safe in-memory storage with lock striping.
+
+Tasks are spread over a fixed number of shards by ``task_id % shards``.
+Each shard is an InMemoryStorage guarded by its own lock, so threads
+working on tasks in different shards never wait for each other. Reads that
+span every shard (ordered iteration, counts) take each shard's lock in
+turn, copy what they need and merge the copies outside the locks.
+"""
+
+import heapq
+import threading
+from collections.abc import Iterable, Iterator
+from operator import attrgetter
+from typing import Any
+
+from src.models.task import Task
+from src.services.task_manager import (
+    InMemoryStorage,
+    TaskPredicate,
+    TaskStats,
+    filter_tasks,
+)
+
+_task_id = attrgetter("id")
+
+
+class _Shard:
+    """One stripe of a ConcurrentStorage: a storage plus the lock guarding it."""
+    
+    __slots__ = ("lock", "storage")
+    
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.storage = InMemoryStorage()
+
+
+class ConcurrentStorage:
+    """In-memory storage that is safe to share between threads.
+    
+    Single-task operations lock only the shard that owns the task. Ordered
+    reads take a snapshot of each shard under its lock and merge them, so
+    an iterator never sees a shard mid-update, although writes made while
+    it is being consumed may or may not be visible.
+    
+    Example:
+        >>> manager = TaskManager(ConcurrentStorage())
+        >>> with ThreadPoolExecutor() as pool:
+        ...     list(pool.map(manager.add_task, ["a", "b", "c"]))
+    """
+    
+    def __init__(self, shards: int = 16) -> None:
+        """Create empty storage.
+        
+        Args:
+            shards: Number of independently locked stripes
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self._shards = [_Shard() for _ in range(shards)]
+    
+    def _shard(self, task_id: int) -> _Shard:
+        return self._shards[task_id % len(self._shards)]
+    
+    def _group(self, task_ids: Iterable[int]) -> Iterator[tuple[_Shard, list[int]]]:
+        """Split IDs by owning shard, skipping shards with none."""
+        count = len(self._shards)
+        groups: list[list[int]] = [[] for _ in range(count)]
+        for task_id in task_ids:
+            groups[task_id % count].append(task_id)
+        return ((s, g) for s, g in zip(self._shards, groups) if g)
+    
+    def save(self, task: Task) -> None:
+        """Save a task, locking only its shard."""
+        shard = self._shard(task.id)
+        with shard.lock:
+            shard.storage.save(task)
+    
+    def save_many(self, tasks: Iterable[Task]) -> None:
+        """Save a batch of tasks, taking each shard's lock once."""
+        count = len(self._shards)
+        groups: list[list[Task]] = [[] for _ in range(count)]
+        for task in tasks:
+            groups[task.id % count].append(task)
+        for shard, group in zip(self._shards, groups):
+            if group:
+                with shard.lock:
+                    shard.storage.save_many(group)
+    
+    def update_fields(self, task_id: int, **changes: Any) -> bool:
+        """Change fields of a task in place under its shard's lock."""
+        shard = self._shard(task_id)
+        with shard.lock:
+            return shard.storage.update_fields(task_id, **changes)
+    
+    def toggle(self, task_id: int) -> bool | None:
+        """Flip a task's status under its shard's lock; return the new one."""
+        shard = self._shard(task_id)
+        with shard.lock:
+            return shard.storage.toggle(task_id)
+    
+    def delete(self, task_id: int) -> bool:
+        """Delete a task. Returns True if found and deleted."""
+        shard = self._shard(task_id)
+        with shard.lock:
+            return shard.storage.delete(task_id)
+    
+    def delete_many(self, task_ids: Iterable[int]) -> list[int]:
+        """Delete several tasks, taking each shard's lock once.
+        
+        Returns:
+            The IDs that were found and deleted, in the order given
+        """
+        task_ids = list(task_ids)
+        deleted: set[int] = set()
+        for shard, group in self._group(task_ids):
+            with shard.lock:
+                deleted.update(shard.storage.delete_many(group))
+        return [task_id for task_id in task_ids if task_id in deleted]
+    
+    def update_many(self, task_ids: Iterable[int], **changes: Any) -> list[int]:
+        """Apply the same changes to several tasks, locking each shard once.
+        
+        Returns:
+            The IDs that were found, in the order given
+        
+        Raises:
+            ValueError: If a field is unknown or the new title is empty
+        """
+        changes = Task.clean_changes(changes)
+        task_ids = list(task_ids)
+        updated: set[int] = set()
+        for shard, group in self._group(task_ids):
+            with shard.lock:
+                updated.update(shard.storage.update_many(group, **changes))
+        return [task_id for task_id in task_ids if task_id in updated]
+    
+    def get_all(self) -> list[Task]:
+        """Get all tasks, sorted by ID."""
+        return list(self.iter_tasks())
+    
+    def get_by_id(self, task_id: int) -> Task | None:
+        """Get a task by ID, or None if not found."""
+        shard = self._shard(task_id)
+        with shard.lock:
+            return shard.storage.get_by_id(task_id)
+    
+    def iter_tasks(
+        self,
+        start_id: int | None = None,
+        limit: int | None = None,
+        predicate: TaskPredicate | None = None,
+        reverse: bool = False,
+        is_complete: bool | None = None,
+    ) -> Iterator[Task]:
+        """Yield tasks in ID order from ``start_id`` (inclusive).
+        
+        Without a predicate no shard can contribute more than ``limit``
+        tasks, so each snapshot is capped at that; with one, whole shards
+        are copied because any number of tasks may be filtered out.
+        """
+        shard_limit = limit if predicate is None else None
+        snapshots = []
+        for shard in self._shards:
+            with shard.lock:
+                snapshots.append(
+                    list(
+                        shard.storage.iter_tasks(
+                            start_id, shard_limit, None, reverse, is_complete
+                        )
+                    )
+                )
+        merged = heapq.merge(*snapshots, key=_task_id, reverse=reverse)
+        return filter_tasks(merged, limit, predicate)
+    
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over tasks in ID order."""
+        return self.iter_tasks()
+    
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return self.count()
+    
+    def count(self) -> int:
+        """Sum the task counts of all shards."""
+        total = 0
+        for shard in self._shards:
+            with shard.lock:
+                total += shard.storage.count()
+        return total
+    
+    def stats(self) -> TaskStats:
+        """Sum the total and completed counts of all shards."""
+        total = completed = 0
+        for shard in self._shards:
+            with shard.lock:
+                shard_stats = shard.storage.stats()
+            total += shard_stats.total
+            completed += shard_stats.completed
+        return TaskStats(total=total, completed=completed)
+    
+    def max_id(self) -> int:
+        """Get the highest stored task ID, or 0 when empty."""
+        highest = 0
+        for shard in self._shards:
+            with shard.lock:
+                highest = max(highest, shard.storage.max_id())
+        return highest
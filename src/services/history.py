@@ -0,0 +1,141 @@
+"""History - Bounded undo/redo log of inverse task operations.
+
+Instead of snapshots of storage, each change is logged as the operation
+that reverts it: the IDs to remove after an add, the deleted tasks to put
+back after a delete, the old field values after an update, the IDs to flip
+back after a status change. An entry holds only what its change touched
+(ID lists are ``range`` or ``array`` objects), and the log keeps the last
+``depth`` entries in a ring buffer, so memory follows the history depth
+rather than the number of stored tasks.
+
+Applying an operation yields the operation that reverts it again, which
+moves to the other stack: undo fills the redo stack and redo the undo
+stack. Recording a new change clears the redo stack. TaskManager applies
+the operations (see ``TaskManager.enable_history``).
+"""
+
+import threading
+from collections import deque
+from collections.abc import Callable, Sequence
+from typing import Any, NamedTuple
+
+from src.models.task import Task
+
+
+class RemoveTasks(NamedTuple):
+    """Delete the tasks with these IDs (reverts adding them)."""
+    
+    ids: Sequence[int]
+
+
+class RestoreTasks(NamedTuple):
+    """Save these tasks back under their own IDs (reverts deleting them)."""
+    
+    tasks: Sequence[Task]
+
+
+class SetFields(NamedTuple):
+    """Set fields of one task to the given values (reverts an update)."""
+    
+    task_id: int
+    changes: dict[str, Any]
+
+
+class SetStatus(NamedTuple):
+    """Mark these tasks complete or pending (reverts a status change)."""
+    
+    ids: Sequence[int]
+    is_complete: bool
+
+
+Operation = RemoveTasks | RestoreTasks | SetFields | SetStatus
+
+
+class HistoryEntry(NamedTuple):
+    """A logged change: a short description and the operation to apply."""
+    
+    label: str
+    operation: Operation
+
+
+class History:
+    """Undo and redo stacks of inverse operations, bounded by ``depth``.
+    
+    The undo stack is a ring buffer: once full, recording a change drops
+    the oldest entry. The redo stack only ever holds undone entries, so it
+    is bounded by the same depth.
+    
+    Example:
+        >>> history = History(depth=50)
+        >>> history.record("add task 7", RemoveTasks(range(7, 8)))
+        >>> history.undo(apply)  # calls apply(RemoveTasks(...))
+        'add task 7'
+    """
+    
+    def __init__(self, depth: int = 100) -> None:
+        """Create an empty history.
+        
+        Args:
+            depth: Number of changes that can be undone
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self.depth = depth
+        self._undo: deque[HistoryEntry] = deque(maxlen=depth)
+        self._redo: list[HistoryEntry] = []
+        self._lock = threading.Lock()
+    
+    def record(self, label: str, operation: Operation) -> None:
+        """Log a new change by the operation that reverts it."""
+        with self._lock:
+            self._undo.append(HistoryEntry(label, operation))
+            self._redo.clear()
+    
+    def undo(self, apply: Callable[[Operation], Operation]) -> str | None:
+        """Revert the latest change.
+        
+        Args:
+            apply: Performs an operation and returns the one reverting it
+        
+        Returns:
+            The label of the reverted change, or None if there is none.
+            If ``apply`` raises, the entry stays on the undo stack.
+        """
+        with self._lock:
+            return self._move(self._undo, self._redo, apply)
+    
+    def redo(self, apply: Callable[[Operation], Operation]) -> str | None:
+        """Re-apply the latest undone change; see ``undo``."""
+        with self._lock:
+            return self._move(self._redo, self._undo, apply)
+    
+    @property
+    def can_undo(self) -> bool:
+        """Whether there is a change to undo."""
+        return bool(self._undo)
+    
+    @property
+    def can_redo(self) -> bool:
+        """Whether there is an undone change to redo."""
+        return bool(self._redo)
+    
+    def clear(self) -> None:
+        """Forget all logged changes."""
+        with self._lock:
+            self._undo.clear()
+            self._redo.clear()
+    
+    @staticmethod
+    def _move(
+        source: "deque[HistoryEntry] | list[HistoryEntry]",
+        target: "deque[HistoryEntry] | list[HistoryEntry]",
+        apply: Callable[[Operation], Operation],
+    ) -> str | None:
+        """Apply the top entry of ``source`` and push its inverse to ``target``."""
+        if not source:
+            return None
+        entry = source[-1]
+        inverse = apply(entry.operation)
+        source.pop()
+        target.append(HistoryEntry(entry.label, inverse))
+        return entry.label
@@ -0,0 +1,365 @@
+"""Journal storage - Persistent task storage backed by an append-only log.
+
+Every save and delete is appended to a write-ahead journal as one compact
+JSON line. Writes are group-committed: the journal is fsynced once every
+``sync_every`` records (and on flush/close) instead of after each record.
+On startup the journal is streamed line by line to rebuild the in-memory
+index. When the journal grows past ``snapshot_every`` records the full task
+set is written to a snapshot file and the journal is truncated, so replay
+time stays proportional to the snapshot size plus a bounded tail.
+"""
+
+import json
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from src.models.task import Task
+from src.services.task_manager import InMemoryStorage, TaskPredicate, TaskStats
+
+_SAVE = "s"
+_SAVE_MANY = "m"
+_UPDATE = "u"
+_DELETE = "d"
+_UPDATE_MANY = "U"
+_DELETE_MANY = "D"
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_decode = json.JSONDecoder().decode
+
+
+class JournalStorage:
+    """File-backed storage that journals writes and replays them on open.
+    
+    Reads are served from an InMemoryStorage rebuilt at startup, so they
+    cost the same as the in-memory backend. The journal lives at ``path``
+    and the snapshot next to it at ``path + ".snapshot"``.
+    
+    Attributes:
+        path: Location of the journal file
+    
+    Example:
+        >>> storage = JournalStorage("tasks.journal")
+        >>> manager = TaskManager(storage)
+        >>> manager.add_task("Survives restarts")
+        >>> storage.close()
+    """
+    
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        sync_every: int = 64,
+        snapshot_every: int = 100_000,
+    ) -> None:
+        """Open (or create) a journal and replay its contents.
+        
+        Args:
+            path: Journal file location
+            sync_every: Number of records per group commit (fsync)
+            snapshot_every: Journal length that triggers a snapshot
+        """
+        if sync_every < 1:
+            raise ValueError("sync_every must be at least 1")
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be at least 1")
+        
+        self.path = Path(path)
+        self._snapshot_path = self.path.with_name(self.path.name + ".snapshot")
+        self._sync_every = sync_every
+        self._snapshot_every = snapshot_every
+        self._memory = InMemoryStorage()
+        self._unsynced = 0
+        
+        self._load_snapshot()
+        self._records = self._replay_journal()
+        self._journal = open(self.path, "a", encoding="utf-8")
+        
+        if self._records >= self._snapshot_every:
+            self.compact()
+    
+    # -------------------------------------------------------------------------
+    # TaskStorage protocol
+    # -------------------------------------------------------------------------
+    
+    def save(self, task: Task) -> None:
+        """Save a task and append it to the journal."""
+        self._memory.save(task)
+        self._append(
+            [_SAVE, task.id, task.title, task.description, int(task.is_complete)]
+        )
+    
+    def save_many(self, tasks: Iterable[Task]) -> None:
+        """Save a batch of tasks as one journal record and commit it.
+        
+        The whole batch is encoded in a single line, so it is replayed
+        either completely or (if torn by a crash) not at all.
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return
+        self._memory.save_many(tasks)
+        self._append_batch(
+            [
+                _SAVE_MANY,
+                [
+                    [task.id, task.title, task.description, int(task.is_complete)]
+                    for task in tasks
+                ],
+            ],
+            len(tasks),
+        )
+    
+    def update_fields(self, task_id: int, **changes: Any) -> bool:
+        """Change fields of a task, journaling only the changed fields."""
+        task = self._memory.get_by_id(task_id)
+        if task is None:
+            return False
+        changes = Task.clean_changes(changes)
+        self._memory.update_fields(task_id, **changes)
+        if "is_complete" in changes:
+            changes["is_complete"] = int(changes["is_complete"])
+        self._append([_UPDATE, task_id, changes])
+        return True
+    
+    def toggle(self, task_id: int) -> bool | None:
+        """Flip a task's status and journal the new value."""
+        is_complete = self._memory.toggle(task_id)
+        if is_complete is not None:
+            self._append([_UPDATE, task_id, {"is_complete": int(is_complete)}])
+        return is_complete
+    
+    def delete(self, task_id: int) -> bool:
+        """Delete a task. Returns True if found and deleted."""
+        if not self._memory.delete(task_id):
+            return False
+        self._append([_DELETE, task_id])
+        return True
+    
+    def delete_many(self, task_ids: Iterable[int]) -> list[int]:
+        """Delete several tasks as one journal record and commit it.
+        
+        Returns:
+            The IDs that were found and deleted
+        """
+        deleted = self._memory.delete_many(task_ids)
+        if deleted:
+            self._append_batch([_DELETE_MANY, deleted], len(deleted))
+        return deleted
+    
+    def update_many(self, task_ids: Iterable[int], **changes: Any) -> list[int]:
+        """Apply the same changes to several tasks as one journal record.
+        
+        Returns:
+            The IDs that were found
+        
+        Raises:
+            ValueError: If a field is unknown or the new title is empty
+        """
+        changes = Task.clean_changes(changes)
+        updated = self._memory.update_many(task_ids, **changes)
+        if updated:
+            if "is_complete" in changes:
+                changes["is_complete"] = int(changes["is_complete"])
+            self._append_batch([_UPDATE_MANY, updated, changes], len(updated))
+        return updated
+    
+    def get_all(self) -> list[Task]:
+        """Get all tasks, sorted by ID."""
+        return self._memory.get_all()
+    
+    def get_by_id(self, task_id: int) -> Task | None:
+        """Get a task by ID, or None if not found."""
+        return self._memory.get_by_id(task_id)
+    
+    def iter_tasks(
+        self,
+        start_id: int | None = None,
+        limit: int | None = None,
+        predicate: TaskPredicate | None = None,
+        reverse: bool = False,
+        is_complete: bool | None = None,
+    ) -> Iterator[Task]:
+        """Lazily yield tasks in ID order from ``start_id`` (inclusive)."""
+        return self._memory.iter_tasks(
+            start_id, limit, predicate, reverse, is_complete
+        )
+    
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over tasks in ID order."""
+        return iter(self._memory)
+    
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return len(self._memory)
+    
+    def count(self) -> int:
+        """Get the number of stored tasks in O(1)."""
+        return self._memory.count()
+    
+    def stats(self) -> TaskStats:
+        """Get total and completed counts in O(1)."""
+        return self._memory.stats()
+    
+    def max_id(self) -> int:
+        """Get the highest stored task ID, or 0 when empty."""
+        return self._memory.max_id()
+    
+    # -------------------------------------------------------------------------
+    # Durability
+    # -------------------------------------------------------------------------
+    
+    def flush(self) -> None:
+        """Write buffered records and fsync the journal."""
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._unsynced = 0
+    
+    def compact(self) -> None:
+        """Write a snapshot of all tasks and truncate the journal.
+        
+        The snapshot is written to a temporary file and atomically renamed
+        into place before the journal is truncated. A crash in between only
+        means the old journal is replayed on top of the new snapshot, which
+        still yields the same state: records store absolute values (a
+        toggle is journaled as the new status, not as a flip), so replay
+        leaves each field at its last journaled value, which is the value
+        in the snapshot, and a deleted task stays deleted unless a later
+        record saves it again.
+        """
+        tmp_path = self._snapshot_path.with_name(self._snapshot_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as snapshot:
+            for task in self._memory:
+                snapshot.write(
+                    _encode(
+                        [task.id, task.title, task.description, int(task.is_complete)]
+                    )
+                )
+                snapshot.write("\n")
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(tmp_path, self._snapshot_path)
+        
+        self._journal.close()
+        self._journal = open(self.path, "w", encoding="utf-8")
+        self.flush()
+        self._records = 0
+    
+    def close(self) -> None:
+        """Flush pending records and close the journal file."""
+        if self._journal.closed:
+            return
+        self.flush()
+        self._journal.close()
+    
+    def __enter__(self) -> "JournalStorage":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+    
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+    
+    def _append(self, record: list[object]) -> None:
+        """Append one record, group-committing every ``sync_every`` writes."""
+        self._journal.write(_encode(record))
+        self._journal.write("\n")
+        self._records += 1
+        self._unsynced += 1
+        if self._unsynced >= self._sync_every:
+            self.flush()
+        if self._records >= self._snapshot_every:
+            self.compact()
+    
+    def _append_batch(self, record: list[object], size: int) -> None:
+        """Append a record covering ``size`` tasks and commit it at once.
+        
+        The batch is one line, so it is replayed either completely or (if
+        torn by a crash) not at all.
+        """
+        self._journal.write(_encode(record))
+        self._journal.write("\n")
+        self._records += size
+        self.flush()
+        if self._records >= self._snapshot_every:
+            self.compact()
+    
+    def _load_snapshot(self) -> None:
+        """Stream the snapshot file (if any) into memory."""
+        if not self._snapshot_path.exists():
+            return
+        save = self._memory.save
+        with open(self._snapshot_path, encoding="utf-8") as snapshot:
+            for line in snapshot:
+                task_id, title, description, is_complete = _decode(line)
+                save(
+                    Task(
+                        id=task_id,
+                        title=title,
+                        description=description,
+                        is_complete=bool(is_complete),
+                    )
+                )
+    
+    def _replay_journal(self) -> int:
+        """Stream journal records into memory and return how many were applied.
+        
+        A torn final record (from a crash mid-write) is cut off so that new
+        records are appended after the last complete one.
+        """
+        if not self.path.exists():
+            return 0
+        save = self._memory.save
+        delete = self._memory.delete
+        applied = 0
+        good_bytes = 0
+        with open(self.path, "rb") as journal:
+            for line in journal:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = _decode(line.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    break
+                kind = record[0]
+                if kind == _SAVE:
+                    _, task_id, title, description, is_complete = record
+                    save(
+                        Task(
+                            id=task_id,
+                            title=title,
+                            description=description,
+                            is_complete=bool(is_complete),
+                        )
+                    )
+                    applied += 1
+                elif kind == _SAVE_MANY:
+                    for task_id, title, description, is_complete in record[1]:
+                        save(
+                            Task(
+                                id=task_id,
+                                title=title,
+                                description=description,
+                                is_complete=bool(is_complete),
+                            )
+                        )
+                    applied += len(record[1])
+                elif kind == _UPDATE:
+                    self._memory.update_fields(record[1], **record[2])
+                    applied += 1
+                elif kind == _UPDATE_MANY:
+                    self._memory.update_many(record[1], **record[2])
+                    applied += len(record[1])
+                elif kind == _DELETE_MANY:
+                    self._memory.delete_many(record[1])
+                    applied += len(record[1])
+                else:
+                    delete(record[1])
+                    applied += 1
+                good_bytes += len(line)
+        if good_bytes != self.path.stat().st_size:
+            os.truncate(self.path, good_bytes)
+        return applied
@@ -0,0 +1,189 @@
+"""Metrics - Opt-in call counters and latency histograms.
+
+Instrumentation is off until ``TaskManager.enable_metrics()`` is called.
+Until then nothing is wrapped, so disabled metrics cost nothing. Once
+enabled, every public TaskManager method and every call the manager makes
+on its storage backend goes through a thin wrapper that updates a
+``LatencyHistogram``.
+
+Every call is counted, but only one call in ``sample_every`` (16 by
+default) is timed: reading the clock twice costs more than many in-memory
+operations take, so timing every call would distort the numbers being
+collected. Timed calls go into power-of-two buckets of nanoseconds, which
+is enough to estimate percentiles without keeping individual samples.
+
+Updates are plain attribute increments without a lock; with several
+threads a few increments can be lost, which is acceptable for
+diagnostics. Storage methods returning lazy iterators (``iter_tasks``)
+are timed until the iterator is created; the time spent consuming it is
+counted in the TaskManager method that consumes it.
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from functools import wraps
+from typing import Any, NamedTuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Bucket i counts durations of i bits, i.e. in [2**(i-1), 2**i) ns; the last
+# bucket (2**40 ns is about 18 minutes) takes everything longer.
+_BUCKETS = 41
+
+
+class OperationStats(NamedTuple):
+    """Summary of one instrumented operation, in microseconds."""
+    
+    calls: int
+    total_us: float
+    mean_us: float
+    p50_us: float
+    p99_us: float
+    max_us: float
+
+
+class LatencyHistogram:
+    """Call count and log2-bucketed durations of the timed calls."""
+    
+    __slots__ = ("calls", "samples", "total_ns", "max_ns", "buckets", "countdown")
+    
+    def __init__(self) -> None:
+        self.calls = 0
+        self.samples = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * _BUCKETS
+        # Calls left until the next timed one; the first call is timed.
+        self.countdown = 1
+    
+    def record(self, elapsed_ns: int) -> None:
+        """Add one timed call that took ``elapsed_ns`` nanoseconds."""
+        self.samples += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.buckets[min(elapsed_ns.bit_length(), _BUCKETS - 1)] += 1
+    
+    def percentile(self, fraction: float) -> int:
+        """Upper bound in ns of the bucket holding the given percentile.
+        
+        The estimate is at most twice the true value of the timed calls,
+        and never above the largest duration recorded.
+        """
+        if not self.samples:
+            return 0
+        rank = fraction * self.samples
+        seen = 0
+        for bits, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min((1 << bits) - 1, self.max_ns)
+        return self.max_ns
+    
+    def summary(self) -> OperationStats:
+        """Summarize the histogram in microseconds.
+        
+        ``total_us`` is extrapolated from the timed calls to all calls.
+        """
+        mean_ns = self.total_ns / self.samples if self.samples else 0.0
+        return OperationStats(
+            calls=self.calls,
+            total_us=mean_ns * self.calls / 1e3,
+            mean_us=mean_ns / 1e3,
+            p50_us=self.percentile(0.50) / 1e3,
+            p99_us=self.percentile(0.99) / 1e3,
+            max_us=self.max_ns / 1e3,
+        )
+
+
+class Metrics:
+    """Registry of latency histograms keyed by operation name.
+    
+    Attributes:
+        sample_every: Time one call in this many (1 times every call)
+    
+    Example:
+        >>> metrics = Metrics()
+        >>> slow_call = metrics.timed("slow_call", slow_call)
+        >>> metrics.snapshot()["slow_call"].calls
+    """
+    
+    def __init__(self, sample_every: int = 16) -> None:
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        self.sample_every = sample_every
+        self._histograms: dict[str, LatencyHistogram] = {}
+    
+    def histogram(self, name: str) -> LatencyHistogram:
+        """Get (creating if needed) the histogram for an operation."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = LatencyHistogram()
+        return histogram
+    
+    def timed(self, name: str, func: F) -> F:
+        """Wrap ``func`` so that its calls are recorded under ``name``."""
+        histogram = self.histogram(name)
+        record = histogram.record
+        clock = time.perf_counter_ns
+        every = self.sample_every
+        
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            histogram.calls += 1
+            histogram.countdown -= 1
+            if histogram.countdown:
+                return func(*args, **kwargs)
+            histogram.countdown = every
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(clock() - start)
+        
+        return wrapper  # type: ignore[return-value]
+    
+    def snapshot(self) -> dict[str, OperationStats]:
+        """Summaries of the operations called so far, sorted by name."""
+        return {
+            name: histogram.summary()
+            for name, histogram in sorted(self._histograms.items())
+            if histogram.calls
+        }
+    
+    def reset(self) -> None:
+        """Zero every counter, keeping the wrappers in place."""
+        for histogram in self._histograms.values():
+            histogram.__init__()  # type: ignore[misc]
+
+
+class InstrumentedStorage:
+    """Storage wrapper timing every method call under ``storage.<name>``.
+    
+    Methods are looked up on the backend on first use and the timed wrapper
+    is then cached on the instance, so optional methods the backend lacks
+    stay missing (TaskManager's ``getattr`` checks keep working).
+    
+    Attributes:
+        backend: The wrapped storage
+    """
+    
+    def __init__(self, backend: Any, metrics: Metrics) -> None:
+        self.backend = backend
+        self._metrics = metrics
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the instance or class.
+        if name in ("backend", "_metrics"):
+            raise AttributeError(name)
+        attr = getattr(self.backend, name)
+        if callable(attr) and not name.startswith("_"):
+            attr = self._metrics.timed(f"storage.{name}", attr)
+            setattr(self, name, attr)
+        return attr
+    
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.backend)
+    
+    def __len__(self) -> int:
+        return len(self.backend)
@@ -0,0 +1,360 @@
+"""Memory-mapped storage - Read-optimized task file accessed through mmap.
+
+The task file has a fixed binary layout (all integers little-endian):
+
+    header   magic "TODOMMAP", version, reserved (u32 each after the
+             magic), task count, completed count, index offset (u64 each)
+    records  one per task in ID order: id (i64), is_complete (u8),
+             title length, description length (u32 each), then the
+             UTF-8 title and description bytes
+    index    the task IDs (i64 each, ascending), then the byte offset of
+             each task's record (i64 each), 8-byte aligned
+
+Opening a file only maps it and reads the header, so it takes the same
+few milliseconds for any size. ``get_by_id`` bisects the ID column of the
+index and decodes one record; iteration decodes records lazily through
+``memoryview`` slices of the map. Only the pages actually read become
+resident.
+
+The file itself is never modified in place. Writes go to an in-memory
+overlay that reads consult first, and ``compact()`` (also run by
+``close()``) streams the merged result into a new file that atomically
+replaces the old one. Until then, changes exist only in memory.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from src.models.task import Task
+from src.services.task_manager import TaskPredicate, TaskStats, filter_tasks
+
+MAGIC = b"TODOMMAP"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQQQ")
+_RECORD = struct.Struct("<qBII")
+
+
+def write_task_file(path: str | os.PathLike[str], tasks: Iterable[Task]) -> int:
+    """Write tasks (in ascending ID order) to a new task file.
+    
+    Records are streamed to disk as they come; only the 16-byte index
+    entry per task is held in memory until the index is written.
+    
+    Args:
+        path: File to create or overwrite
+        tasks: Tasks sorted by ID
+    
+    Returns:
+        Number of tasks written
+    
+    Raises:
+        ValueError: If the IDs are not strictly ascending
+    """
+    ids = array("q")
+    offsets = array("q")
+    completed = 0
+    with open(path, "wb") as out:
+        out.write(bytes(_HEADER.size))
+        offset = _HEADER.size
+        for task in tasks:
+            if ids and task.id <= ids[-1]:
+                raise ValueError("Tasks must be written in ascending ID order")
+            title = task.title.encode()
+            description = task.description.encode()
+            ids.append(task.id)
+            offsets.append(offset)
+            out.write(
+                _RECORD.pack(task.id, task.is_complete, len(title), len(description))
+            )
+            out.write(title)
+            out.write(description)
+            offset += _RECORD.size + len(title) + len(description)
+            completed += task.is_complete
+        padding = -offset % 8
+        out.write(bytes(padding))
+        index_offset = offset + padding
+        out.write(ids.tobytes())
+        out.write(offsets.tobytes())
+        out.seek(0)
+        out.write(_HEADER.pack(MAGIC, VERSION, 0, len(ids), completed, index_offset))
+        out.flush()
+        os.fsync(out.fileno())
+    return len(ids)
+
+
+class MmapStorage:
+    """Storage backend over a memory-mapped task file plus a write overlay.
+    
+    Attributes:
+        path: Location of the task file
+    
+    Example:
+        >>> with MmapStorage("tasks.bin") as storage:
+        ...     manager = TaskManager(storage)
+        ...     manager.get_task(12_345_678)  # one bisect, one record decoded
+    """
+    
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Map an existing task file, or create an empty one.
+        
+        Raises:
+            ValueError: If the file is not a task file of this version
+        """
+        self.path = os.fspath(path)
+        if not os.path.exists(self.path):
+            write_task_file(self.path, ())
+        # Pending changes: a Task to add or replace, None for a deletion.
+        self._overlay: dict[int, Task | None] = {}
+        self._map()
+    
+    # -------------------------------------------------------------------------
+    # TaskStorage protocol
+    # -------------------------------------------------------------------------
+    
+    def save(self, task: Task) -> None:
+        """Record a new or replaced task in the overlay."""
+        self._apply(task.id, task)
+    
+    def save_many(self, tasks: Iterable[Task]) -> None:
+        """Record a batch of tasks in the overlay."""
+        for task in tasks:
+            self._apply(task.id, task)
+    
+    def update_fields(self, task_id: int, **changes: Any) -> bool:
+        """Change fields of a task by saving an updated copy to the overlay.
+        
+        Raises:
+            ValueError: If a field is unknown or the new title is empty
+        """
+        task = self.get_by_id(task_id)
+        if task is None:
+            return False
+        for name, value in Task.clean_changes(changes).items():
+            setattr(task, name, value)
+        self._apply(task_id, task)
+        return True
+    
+    def delete(self, task_id: int) -> bool:
+        """Delete a task. Returns True if found and deleted."""
+        if self.get_by_id(task_id) is None:
+            return False
+        self._apply(task_id, None)
+        return True
+    
+    def get_all(self) -> list[Task]:
+        """Get all tasks, sorted by ID."""
+        return list(self.iter_tasks())
+    
+    def get_by_id(self, task_id: int) -> Task | None:
+        """Get a task by ID, or None if not found."""
+        if task_id in self._overlay:
+            task = self._overlay[task_id]
+            return task.copy() if task is not None else None
+        index = self._index_of(task_id)
+        if index is None:
+            return None
+        return _decode(self._mmap, self._view, self._offsets[index])
+    
+    def iter_tasks(
+        self,
+        start_id: int | None = None,
+        limit: int | None = None,
+        predicate: TaskPredicate | None = None,
+        reverse: bool = False,
+        is_complete: bool | None = None,
+    ) -> Iterator[Task]:
+        """Lazily yield tasks in ID order from ``start_id`` (inclusive).
+        
+        The file's records are decoded one at a time straight from the
+        map; overlay entries are merged in by ID.
+        """
+        return filter_tasks(
+            self._scan(start_id, reverse, is_complete), limit, predicate
+        )
+    
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over tasks in ID order."""
+        return self.iter_tasks()
+    
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return self._total
+    
+    def count(self) -> int:
+        """Get the number of stored tasks in O(1)."""
+        return self._total
+    
+    def stats(self) -> TaskStats:
+        """Get total and completed counts in O(1)."""
+        return TaskStats(total=self._total, completed=self._completed)
+    
+    def max_id(self) -> int:
+        """Get the highest stored task ID, or 0 when empty."""
+        last = next(self.iter_tasks(limit=1, reverse=True), None)
+        return last.id if last is not None else 0
+    
+    # -------------------------------------------------------------------------
+    # File management
+    # -------------------------------------------------------------------------
+    
+    def id_ranges(self, parts: int) -> list[tuple[int, int]]:
+        """Split the file's records into ``parts`` ranges of similar size.
+        
+        Ranges are read from the index without touching the records, for
+        handing out chunks of a scan (see ``ParallelQuery``). Changes still
+        in the overlay are not included; ``compact()`` first to cover them.
+        
+        Returns:
+            Inclusive ``(first_id, last_id)`` pairs in ID order; fewer than
+            ``parts`` when there are fewer records
+        """
+        ids = self._ids
+        count = len(ids)
+        bounds = sorted({count * part // parts for part in range(parts + 1)})
+        return [(ids[lo], ids[hi - 1]) for lo, hi in zip(bounds, bounds[1:])]
+    
+    def compact(self) -> None:
+        """Write the file plus overlay to a new file and map that instead.
+        
+        The new file is written next to the old one and moved into place
+        with ``os.replace``, so a crash leaves either the old or the new
+        file intact. Iterators already running keep reading the old map,
+        which is unmapped once the last of them is done.
+        """
+        if not self._overlay:
+            return
+        tmp_path = self.path + ".tmp"
+        write_task_file(tmp_path, self._scan(None, False, None))
+        os.replace(tmp_path, self.path)
+        self._overlay.clear()
+        self._map()
+    
+    def close(self) -> None:
+        """Write pending changes and unmap the file.
+        
+        Iterators over the storage must not be used after closing.
+        """
+        if self._mmap.closed:
+            return
+        self.compact()
+        self._unmap()
+    
+    def __enter__(self) -> "MmapStorage":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+    
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+    
+    def _map(self) -> None:
+        with open(self.path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        header = self._mmap[:_HEADER.size]
+        if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a task file")
+        _, version, _, count, completed, index_offset = _HEADER.unpack(header)
+        if version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is a version {version} task file")
+        self._view = memoryview(self._mmap)
+        ids_end = index_offset + 8 * count
+        self._ids = self._view[index_offset:ids_end].cast("q")
+        self._offsets = self._view[ids_end:ids_end + 8 * count].cast("q")
+        self._total = count
+        self._completed = completed
+    
+    def _unmap(self) -> None:
+        for view in (self._ids, self._offsets, self._view):
+            view.release()
+        self._mmap.close()
+    
+    def _index_of(self, task_id: int) -> int | None:
+        ids = self._ids
+        index = bisect_left(ids, task_id)
+        if index < len(ids) and ids[index] == task_id:
+            return index
+        return None
+    
+    def _apply(self, task_id: int, task: Task | None) -> None:
+        """Put a change in the overlay and keep the counts current."""
+        old = self.get_by_id(task_id)
+        if old is not None:
+            self._total -= 1
+            self._completed -= old.is_complete
+        if task is not None:
+            self._total += 1
+            self._completed += task.is_complete
+            task = task.copy()
+        self._overlay[task_id] = task
+    
+    def _scan(
+        self, start_id: int | None, reverse: bool, is_complete: bool | None
+    ) -> Iterator[Task]:
+        """Merge file records and overlay entries in (reverse) ID order.
+        
+        The map and a copy of the overlay are bound on the first ``next()``,
+        so later writes and compactions do not change a running scan.
+        """
+        buffer, view = self._mmap, self._view
+        ids, offsets = self._ids, self._offsets
+        overlay = dict(self._overlay)
+        if reverse:
+            end = bisect_right(ids, start_id) if start_id is not None else len(ids)
+            indexes: Iterable[int] = range(end - 1, -1, -1)
+            pending = sorted(
+                (i for i in overlay if start_id is None or i <= start_id),
+                reverse=True,
+            )
+        else:
+            start = bisect_left(ids, start_id) if start_id is not None else 0
+            indexes = range(start, len(ids))
+            pending = sorted(i for i in overlay if start_id is None or i >= start_id)
+        
+        position = 0
+        for index in indexes:
+            task_id = ids[index]
+            # Emit the overlay entries that come before this file record.
+            while position < len(pending) and (
+                pending[position] > task_id if reverse else pending[position] < task_id
+            ):
+                task = overlay[pending[position]]
+                position += 1
+                if task is not None and is_complete in (None, task.is_complete):
+                    yield task.copy()
+            if task_id in overlay:
+                continue
+            offset = offsets[index]
+            # The completion flag is the byte after the record's ID.
+            if is_complete is not None and bool(buffer[offset + 8]) != is_complete:
+                continue
+            yield _decode(buffer, view, offset)
+        for task_id in pending[position:]:
+            task = overlay[task_id]
+            if task is not None and is_complete in (None, task.is_complete):
+                yield task.copy()
+
+
+def _decode(buffer: mmap.mmap, view: memoryview, offset: int) -> Task:
+    """Build the Task whose record starts at ``offset`` in the map."""
+    task_id, is_complete, title_length, description_length = _RECORD.unpack_from(
+        buffer, offset
+    )
+    start = offset + _RECORD.size
+    middle = start + title_length
+    return Task(
+        id=task_id,
+        title=str(view[start:middle], "utf-8"),
+        description=str(view[middle:middle + description_length], "utf-8"),
+        is_complete=bool(is_complete),
+    )
+
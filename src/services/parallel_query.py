@@ -0,0 +1,216 @@
+"""Parallel queries - Fan scans of a task file out to worker processes.
+
+Scans that look at every task (substring filters, per-keyword counts) are
+CPU-bound, so threads do not speed them up. ParallelQuery splits the ID
+space of a memory-mapped task file (see ``MmapStorage``) into chunks of
+roughly equal size and hands each chunk to a ``ProcessPoolExecutor``.
+Workers map the file themselves, so only the chunk bounds and the small
+partial results cross the process boundary; the task data is never
+pickled. The parent combines the partial results in ID order.
+
+Custom scans plug in through ``map_chunks``: pass a module-level function
+taking an iterable of tasks (plus any picklable arguments) and reduce the
+list of partial results it returns.
+"""
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import takewhile
+from typing import Any
+
+from src.models.task import Task
+from src.services.mmap_storage import MmapStorage
+from src.services.search_index import task_tokens, tokenize
+from src.services.task_manager import TaskStats
+
+type ChunkFunction[T] = Callable[..., T]
+
+
+# =============================================================================
+# Worker side (module-level so that it pickles by reference)
+# =============================================================================
+
+def _iter_chunk(storage: MmapStorage, first_id: int, last_id: int) -> Iterator[Task]:
+    return takewhile(
+        lambda task: task.id <= last_id, storage.iter_tasks(start_id=first_id)
+    )
+
+
+def _run_chunk[T](
+    path: str, first_id: int, last_id: int, func: ChunkFunction[T], args: tuple
+) -> T:
+    """Map the task file and apply ``func`` to the tasks of one ID range."""
+    storage = MmapStorage(path)
+    try:
+        return func(_iter_chunk(storage, first_id, last_id), *args)
+    finally:
+        storage.close()
+
+
+def count_containing(
+    tasks: Iterable[Task], text: str, field: str, is_complete: bool | None
+) -> int:
+    """Count tasks whose ``field`` contains ``text``, ignoring case."""
+    needle = text.casefold()
+    return sum(
+        1
+        for task in tasks
+        if needle in getattr(task, field).casefold()
+        and is_complete in (None, task.is_complete)
+    )
+
+
+def ids_containing(tasks: Iterable[Task], text: str, field: str) -> list[int]:
+    """IDs of the tasks whose ``field`` contains ``text``, ignoring case."""
+    needle = text.casefold()
+    return [task.id for task in tasks if needle in getattr(task, field).casefold()]
+
+
+def keyword_counts(
+    tasks: Iterable[Task], keywords: tuple[str, ...]
+) -> dict[str, tuple[int, int]]:
+    """(total, completed) per keyword, over tasks containing the word."""
+    wanted = frozenset(keywords)
+    counts = {keyword: [0, 0] for keyword in keywords}
+    for task in tasks:
+        for keyword in wanted.intersection(task_tokens(task)):
+            pair = counts[keyword]
+            pair[0] += 1
+            pair[1] += task.is_complete
+    return {keyword: (total, done) for keyword, (total, done) in counts.items()}
+
+
+# =============================================================================
+# Parent side
+# =============================================================================
+
+FIELDS = ("title", "description")
+
+
+class ParallelQuery:
+    """Run scans over an MmapStorage file in a pool of worker processes.
+    
+    Pending changes in the storage's write overlay are compacted into the
+    file before each query, since the workers only see the file.
+    
+    Attributes:
+        storage: The storage whose file is scanned
+        workers: Number of worker processes (1 scans in this process)
+        chunks_per_worker: Chunks per worker; more chunks even out
+            workers that finish early
+    
+    Example:
+        >>> with MmapStorage("huge.tasks") as storage:
+        ...     with ParallelQuery(storage, workers=8) as query:
+        ...         query.count_containing("invoice")
+        ...         query.keyword_stats(["urgent", "later"])
+    """
+    
+    def __init__(
+        self,
+        storage: MmapStorage,
+        workers: int | None = None,
+        chunks_per_worker: int = 4,
+    ) -> None:
+        """Create the query runner; the pool starts on the first query.
+        
+        Args:
+            storage: Memory-mapped storage to scan
+            workers: Worker processes (default: ``os.cpu_count()``)
+            chunks_per_worker: Chunks to split the scan into per worker
+        """
+        self.storage = storage
+        self.workers = workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self._pool: ProcessPoolExecutor | None = None
+    
+    def map_chunks[T](self, func: ChunkFunction[T], *args: Any) -> list[T]:
+        """Apply ``func(tasks, *args)`` to each chunk of the task file.
+        
+        Args:
+            func: Module-level function taking an iterable of tasks
+            *args: Picklable extra arguments for ``func``
+        
+        Returns:
+            One partial result per chunk, in ID order
+        """
+        self.storage.compact()
+        path = self.storage.path
+        ranges = self.storage.id_ranges(self.workers * self.chunks_per_worker)
+        if self.workers == 1:
+            return [
+                func(_iter_chunk(self.storage, first, last), *args)
+                for first, last in ranges
+            ]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers)
+        futures = [
+            self._pool.submit(_run_chunk, path, first, last, func, args)
+            for first, last in ranges
+        ]
+        return [future.result() for future in futures]
+    
+    def count_containing(
+        self,
+        text: str,
+        field: str = "description",
+        is_complete: bool | None = None,
+    ) -> int:
+        """Count tasks whose title or description contains ``text``.
+        
+        Args:
+            text: Substring to look for, ignoring case
+            field: "title" or "description"
+            is_complete: Count only complete (True) or pending (False) tasks
+        
+        Raises:
+            ValueError: If ``field`` is not a text field
+        """
+        return sum(self.map_chunks(count_containing, text, _field(field), is_complete))
+    
+    def ids_containing(self, text: str, field: str = "description") -> list[int]:
+        """IDs of the tasks whose ``field`` contains ``text``, in order.
+        
+        Raises:
+            ValueError: If ``field`` is not a text field
+        """
+        ids: list[int] = []
+        for part in self.map_chunks(ids_containing, text, _field(field)):
+            ids.extend(part)
+        return ids
+    
+    def keyword_stats(self, keywords: Iterable[str]) -> dict[str, TaskStats]:
+        """Total and completed counts of the tasks containing each word.
+        
+        Keywords match whole words of the title or description, ignoring
+        case, the way search tokens do.
+        """
+        words = tuple(dict.fromkeys(word for k in keywords for word in tokenize(k)))
+        totals = {word: [0, 0] for word in words}
+        for part in self.map_chunks(keyword_counts, words):
+            for word, (total, completed) in part.items():
+                totals[word][0] += total
+                totals[word][1] += completed
+        return {
+            word: TaskStats(total=total, completed=completed)
+            for word, (total, completed) in totals.items()
+        }
+    
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    def __enter__(self) -> "ParallelQuery":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _field(name: str) -> str:
+    if name not in FIELDS:
+        raise ValueError(f"Cannot search task field: {name}")
+    return name
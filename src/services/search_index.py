@@ -0,0 +1,197 @@
+"""Search index - Inverted index over task titles and descriptions.
+
+Text is split into lowercase word tokens and each token maps to the set of
+task IDs containing it. A sorted vocabulary list sits next to the postings
+so that prefix queries become a bisect plus a contiguous slice, rather than
+a scan over every token or every task. Newly seen tokens are collected in a
+short side list and merged into the vocabulary in batches, so indexing a
+stream of unique words does not pay a full list shift per token.
+"""
+
+import heapq
+import re
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Set
+
+from src.models.task import Task
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Sorts after every character that can follow a prefix in a token.
+_PREFIX_END = "\U0010ffff"
+
+# New tokens wait in a small sorted side list and are merged into the main
+# vocabulary in one pass once there are this many of them.
+_PENDING_LIMIT = 1024
+
+
+def tokenize(text: str) -> set[str]:
+    """Split text into a set of case-folded word tokens.
+    
+    Args:
+        text: Any text, e.g. a task title
+    
+    Returns:
+        The distinct tokens found in the text
+    """
+    return set(_TOKEN_PATTERN.findall(text.casefold()))
+
+
+def task_text(task: Task) -> str:
+    """Get the searchable text of a task (title and description)."""
+    return f"{task.title} {task.description}"
+
+
+def task_tokens(task: Task) -> set[str]:
+    """Get the tokens of a task's title and description."""
+    return tokenize(task_text(task))
+
+
+class SearchIndex:
+    """Token → task-ID inverted index with prefix matching.
+    
+    The index is updated incrementally: ``add`` and ``remove`` touch only
+    the tokens of the task involved, and ``replace`` only the tokens that
+    actually changed between the old and new version of a task.
+    
+    Example:
+        >>> index = SearchIndex()
+        >>> index.add(Task(id=1, title="Buy groceries"))
+        >>> index.search("groc")
+        [1]
+    """
+    
+    def __init__(self, tasks: Iterable[Task] = ()) -> None:
+        """Create an index, optionally pre-filled with tasks.
+        
+        Args:
+            tasks: Tasks to index initially
+        """
+        self._postings: dict[str, set[int]] = {}
+        self._vocabulary: list[str] = []
+        self._pending: list[str] = []
+        self.add_many(tasks)
+    
+    def __len__(self) -> int:
+        """Return the number of distinct indexed tokens."""
+        return len(self._postings)
+    
+    def add(self, task: Task) -> None:
+        """Index a task's title and description."""
+        self._add_tokens(task.id, task_tokens(task))
+    
+    def add_many(self, tasks: Iterable[Task]) -> None:
+        """Index many tasks, sorting the new vocabulary once at the end."""
+        postings = self._postings
+        new_tokens: list[str] = []
+        for task in tasks:
+            task_id = task.id
+            for token in task_tokens(task):
+                ids = postings.get(token)
+                if ids is None:
+                    postings[token] = {task_id}
+                    new_tokens.append(token)
+                else:
+                    ids.add(task_id)
+        if new_tokens:
+            self._vocabulary = sorted(self._vocabulary + self._pending + new_tokens)
+            self._pending.clear()
+    
+    def remove(self, task: Task) -> None:
+        """Remove a task (as it was last indexed) from the index."""
+        self._remove_tokens(task.id, task_tokens(task))
+    
+    def replace(self, old: Task, new: Task) -> None:
+        """Re-index a task whose text changed from ``old`` to ``new``."""
+        self.replace_text(new.id, task_text(old), task_text(new))
+    
+    def replace_text(self, task_id: int, old_text: str, new_text: str) -> None:
+        """Re-index a task given its text before and after a change.
+        
+        Useful when the task was modified in place and the old version is
+        no longer available as a Task.
+        """
+        old_tokens = tokenize(old_text)
+        new_tokens = tokenize(new_text)
+        self._remove_tokens(task_id, old_tokens - new_tokens)
+        self._add_tokens(task_id, new_tokens - old_tokens)
+    
+    def search(self, query: str, limit: int | None = None) -> list[int]:
+        """Find tasks matching every word of the query.
+        
+        Each query word matches any indexed token it is a prefix of, so
+        ``"gro"`` finds "groceries" and "grow". Words are combined with AND,
+        starting from the longest (usually most selective) word.
+        
+        Args:
+            query: Free-text query
+            limit: Return only the lowest ``limit`` matching IDs
+        
+        Returns:
+            Matching task IDs in ascending order (empty for a blank query)
+        """
+        words = sorted(tokenize(query), key=len, reverse=True)
+        if not words:
+            return []
+        
+        matches: Set[int] | None = None
+        for word in words:
+            ids = self._prefix_ids(word)
+            matches = ids if matches is None else matches & ids
+            if not matches:
+                return []
+        if limit is not None and limit < len(matches):
+            return heapq.nsmallest(max(limit, 0), matches)
+        return sorted(matches)
+    
+    def _prefix_ids(self, prefix: str) -> Set[int]:
+        """Union the postings of every token starting with ``prefix``.
+        
+        A single matching token returns its posting set itself; callers
+        must treat the result as read-only.
+        """
+        tokens = self._tokens_with_prefix(self._vocabulary, prefix)
+        if self._pending:
+            tokens += self._tokens_with_prefix(self._pending, prefix)
+        postings = self._postings
+        if len(tokens) == 1:
+            return postings[tokens[0]]
+        ids: set[int] = set()
+        for token in tokens:
+            ids |= postings[token]
+        return ids
+    
+    @staticmethod
+    def _tokens_with_prefix(vocabulary: list[str], prefix: str) -> list[str]:
+        """Slice the tokens starting with ``prefix`` out of a sorted list."""
+        start = bisect_left(vocabulary, prefix)
+        end = bisect_left(vocabulary, prefix + _PREFIX_END, start)
+        return vocabulary[start:end]
+    
+    def _add_tokens(self, task_id: int, tokens: Iterable[str]) -> None:
+        postings = self._postings
+        for token in tokens:
+            ids = postings.get(token)
+            if ids is None:
+                postings[token] = {task_id}
+                insort(self._pending, token)
+                if len(self._pending) >= _PENDING_LIMIT:
+                    self._vocabulary = sorted(self._vocabulary + self._pending)
+                    self._pending.clear()
+            else:
+                ids.add(task_id)
+    
+    def _remove_tokens(self, task_id: int, tokens: Iterable[str]) -> None:
+        postings = self._postings
+        for token in tokens:
+            ids = postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(task_id)
+            if not ids:
+                del postings[token]
+                for vocabulary in (self._pending, self._vocabulary):
+                    position = bisect_left(vocabulary, token)
+                    if position < len(vocabulary) and vocabulary[position] == token:
+                        del vocabulary[position]
+                        break
@@ -0,0 +1,277 @@
+"""SQLite storage - Persistent task storage on the stdlib sqlite3 module.
+
+Tasks live in a single ``tasks`` table keyed by an INTEGER PRIMARY KEY (the
+rowid, so lookups and ordered scans by ID use the table's own B-tree) with
+a secondary index on ``is_complete`` for the completion counts. One
+connection is opened per storage and reused for every call; all SQL is
+kept in module constants so sqlite3's statement cache hands back the same
+prepared statement each time.
+"""
+
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from src.models.task import Task
+from src.services.task_manager import TaskPredicate, TaskStats, filter_tasks
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS tasks (
+        id          INTEGER PRIMARY KEY,
+        title       TEXT    NOT NULL,
+        description TEXT    NOT NULL DEFAULT '',
+        is_complete INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_tasks_is_complete ON tasks (is_complete)",
+)
+
+_COLUMNS = "id, title, description, is_complete"
+
+_UPSERT = (
+    f"INSERT INTO tasks ({_COLUMNS}) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET title = excluded.title, "
+    "description = excluded.description, is_complete = excluded.is_complete"
+)
+_DELETE = "DELETE FROM tasks WHERE id = ?"
+_TOGGLE = (
+    "UPDATE tasks SET is_complete = 1 - is_complete WHERE id = ? "
+    "RETURNING is_complete"
+)
+_SELECT_ALL = f"SELECT {_COLUMNS} FROM tasks ORDER BY id"
+_SELECT_RANGE = f"SELECT {_COLUMNS} FROM tasks WHERE id >= ? ORDER BY id LIMIT ?"
+_SELECT_RANGE_DESC = (
+    f"SELECT {_COLUMNS} FROM tasks WHERE id <= ? ORDER BY id DESC LIMIT ?"
+)
+_SELECT_STATUS_RANGE = (
+    f"SELECT {_COLUMNS} FROM tasks WHERE is_complete = ? AND id >= ? "
+    "ORDER BY id LIMIT ?"
+)
+_SELECT_STATUS_RANGE_DESC = (
+    f"SELECT {_COLUMNS} FROM tasks WHERE is_complete = ? AND id <= ? "
+    "ORDER BY id DESC LIMIT ?"
+)
+_SELECT_ONE = f"SELECT {_COLUMNS} FROM tasks WHERE id = ?"
+_COUNT = "SELECT COUNT(*) FROM tasks"
+_COUNT_COMPLETED = "SELECT COUNT(*) FROM tasks WHERE is_complete = 1"
+_MAX_ID = "SELECT COALESCE(MAX(id), 0) FROM tasks"
+
+_FETCH_SIZE = 1024
+_MIN_ID = -(2**63)
+_MAX_ID_VALUE = 2**63 - 1
+_NO_LIMIT = -1
+
+
+def _row_to_task(row: tuple[int, str, str, int]) -> Task:
+    """Build a Task from a ``(id, title, description, is_complete)`` row."""
+    task_id, title, description, is_complete = row
+    return Task(
+        id=task_id,
+        title=title,
+        description=description,
+        is_complete=bool(is_complete),
+    )
+
+
+class SQLiteStorage:
+    """Storage backend that keeps tasks in an SQLite database.
+    
+    File databases are switched to WAL journaling with ``synchronous=NORMAL``
+    so readers never block the writer and each commit costs one WAL append.
+    Each call runs in autocommit mode except batch writes, which share one
+    transaction; counts are answered by SQL
+    ``COUNT(*)`` queries rather than by loading tasks into Python.
+    
+    Attributes:
+        path: Database location (``":memory:"`` for a private in-memory DB)
+    
+    Example:
+        >>> storage = SQLiteStorage("tasks.db")
+        >>> manager = TaskManager(storage)
+        >>> manager.add_task("Stored in SQLite")
+        >>> storage.close()
+    """
+    
+    def __init__(self, path: str | os.PathLike[str] = ":memory:") -> None:
+        """Open (or create) the database and ensure the schema exists.
+        
+        Args:
+            path: Database file, or ``":memory:"`` (default)
+        """
+        self.path = os.fspath(path)
+        self._conn = sqlite3.connect(
+            self.path,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+    
+    def save(self, task: Task) -> None:
+        """Insert or replace a task."""
+        self._conn.execute(
+            _UPSERT,
+            (task.id, task.title, task.description, int(task.is_complete)),
+        )
+    
+    def save_many(self, tasks: Iterable[Task]) -> None:
+        """Insert or replace a batch of tasks in one transaction."""
+        with self._transaction():
+            self._conn.executemany(
+                _UPSERT,
+                (
+                    (task.id, task.title, task.description, int(task.is_complete))
+                    for task in tasks
+                ),
+            )
+    
+    def update_fields(self, task_id: int, **changes: Any) -> bool:
+        """Write only the changed columns of a task.
+        
+        Column names come from the validated field names, never from the
+        caller directly, and each field combination maps to one cached
+        statement.
+        """
+        changes = Task.clean_changes(changes)
+        if not changes:
+            return self._conn.execute(_SELECT_ONE, (task_id,)).fetchone() is not None
+        if "is_complete" in changes:
+            changes["is_complete"] = int(changes["is_complete"])
+        columns = sorted(changes)
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        cursor = self._conn.execute(
+            f"UPDATE tasks SET {assignments} WHERE id = ?",
+            [changes[column] for column in columns] + [task_id],
+        )
+        return cursor.rowcount > 0
+    
+    def toggle(self, task_id: int) -> bool | None:
+        """Flip a task's status in one UPDATE; return the new one."""
+        # fetchall() runs the statement to completion so the change commits.
+        rows = self._conn.execute(_TOGGLE, (task_id,)).fetchall()
+        return bool(rows[0][0]) if rows else None
+    
+    def delete(self, task_id: int) -> bool:
+        """Delete a task. Returns True if found and deleted."""
+        return self._conn.execute(_DELETE, (task_id,)).rowcount > 0
+    
+    def delete_many(self, task_ids: Iterable[int]) -> list[int]:
+        """Delete several tasks in one transaction; return the IDs found."""
+        execute = self._conn.execute
+        with self._transaction():
+            return [
+                task_id for task_id in task_ids
+                if execute(_DELETE, (task_id,)).rowcount > 0
+            ]
+    
+    def update_many(self, task_ids: Iterable[int], **changes: Any) -> list[int]:
+        """Apply the same changes to several tasks in one transaction.
+        
+        Returns:
+            The IDs that were found
+        
+        Raises:
+            ValueError: If a field is unknown or the new title is empty
+        """
+        changes = Task.clean_changes(changes)
+        update = self.update_fields
+        with self._transaction():
+            return [task_id for task_id in task_ids if update(task_id, **changes)]
+    
+    def get_all(self) -> list[Task]:
+        """Get all tasks, sorted by ID."""
+        return [_row_to_task(row) for row in self._conn.execute(_SELECT_ALL)]
+    
+    def get_by_id(self, task_id: int) -> Task | None:
+        """Get a task by ID, or None if not found."""
+        row = self._conn.execute(_SELECT_ONE, (task_id,)).fetchone()
+        return _row_to_task(row) if row is not None else None
+    
+    def iter_tasks(
+        self,
+        start_id: int | None = None,
+        limit: int | None = None,
+        predicate: TaskPredicate | None = None,
+        reverse: bool = False,
+        is_complete: bool | None = None,
+    ) -> Iterator[Task]:
+        """Stream tasks in ID order from ``start_id`` (inclusive).
+        
+        The start ID is a primary-key range seek (descending with
+        ``reverse``); a status filter seeks the ``is_complete`` index, whose
+        entries are already ordered by ID. Without a predicate the limit
+        goes into the SQL ``LIMIT``; with one, rows are streamed in batches
+        and filtered in Python until the limit is reached.
+        """
+        sql_limit = limit if limit is not None and predicate is None else _NO_LIMIT
+        if sql_limit != _NO_LIMIT and sql_limit <= 0:
+            return iter(())
+        if reverse:
+            sql = _SELECT_RANGE_DESC
+            bound = start_id if start_id is not None else _MAX_ID_VALUE
+        else:
+            sql = _SELECT_RANGE
+            bound = start_id if start_id is not None else _MIN_ID
+        if is_complete is None:
+            cursor = self._conn.execute(sql, (bound, sql_limit))
+        else:
+            sql = _SELECT_STATUS_RANGE_DESC if reverse else _SELECT_STATUS_RANGE
+            cursor = self._conn.execute(sql, (int(is_complete), bound, sql_limit))
+        return filter_tasks(
+            self._stream(cursor), limit if predicate else None, predicate
+        )
+    
+    def __iter__(self) -> Iterator[Task]:
+        """Stream tasks in ID order, fetching rows in batches."""
+        return self._stream(self._conn.execute(_SELECT_ALL))
+    
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return self.count()
+    
+    def count(self) -> int:
+        """Count tasks with ``SELECT COUNT(*)``."""
+        return self._conn.execute(_COUNT).fetchone()[0]
+    
+    def stats(self) -> TaskStats:
+        """Get total and completed counts; the latter uses the status index."""
+        total = self._conn.execute(_COUNT).fetchone()[0]
+        completed = self._conn.execute(_COUNT_COMPLETED).fetchone()[0]
+        return TaskStats(total=total, completed=completed)
+    
+    def max_id(self) -> int:
+        """Get the highest stored task ID, or 0 when empty."""
+        return self._conn.execute(_MAX_ID).fetchone()[0]
+    
+    @staticmethod
+    def _stream(cursor: sqlite3.Cursor) -> Iterator[Task]:
+        """Turn a cursor into Tasks, fetching ``_FETCH_SIZE`` rows at a time."""
+        while rows := cursor.fetchmany(_FETCH_SIZE):
+            for row in rows:
+                yield _row_to_task(row)
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the enclosed statements in one BEGIN/COMMIT transaction."""
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+    
+    def __enter__(self) -> "SQLiteStorage":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
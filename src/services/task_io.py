@@ -0,0 +1,130 @@
+"""Task I/O - Streaming import and export of tasks as JSONL or CSV.
+
+Readers yield one record (a dict) per line and writers consume any iterable
+of tasks, so neither side ever holds the whole task set in memory. Records
+use the field names of the Task model: ``id``, ``title``, ``description``
+and ``is_complete``.
+"""
+
+import csv
+import json
+import os
+from collections.abc import Iterable, Iterator
+from typing import IO, Any
+
+from src.models.task import Task
+
+FIELDS = ("id", "title", "description", "is_complete")
+FORMATS = ("jsonl", "csv")
+
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "y", "x", "✓"})
+# JSON types of the record fields; each may also be absent or null.
+_FIELD_TYPES = (
+    ("title", str, "a string"),
+    ("description", str, "a string"),
+    ("is_complete", bool, "true or false"),
+)
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def format_for_path(path: str | os.PathLike[str]) -> str:
+    """Pick the file format from a path's suffix.
+    
+    Args:
+        path: File path ending in ``.jsonl``/``.ndjson`` or ``.csv``
+    
+    Returns:
+        ``"jsonl"`` or ``"csv"``
+    
+    Raises:
+        ValueError: If the suffix is not recognised
+    """
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".csv":
+        return "csv"
+    raise ValueError(f"Unsupported task file type: {suffix or path!s}")
+
+
+def read_jsonl(stream: IO[str]) -> Iterator[dict[str, Any]]:
+    """Yield one record per non-blank JSON line."""
+    decode = json.JSONDecoder().decode
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = decode(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line_number}: invalid JSON ({e.msg})") from e
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {line_number}: expected a JSON object")
+        for name, kind, expected in _FIELD_TYPES:
+            value = record.get(name)
+            if value is not None and type(value) is not kind:
+                raise ValueError(f'Line {line_number}: "{name}" must be {expected}')
+        yield record
+
+
+def read_csv(stream: IO[str]) -> Iterator[dict[str, Any]]:
+    """Yield one record per CSV row; the first row must be a header."""
+    for row in csv.DictReader(stream):
+        record: dict[str, Any] = {
+            "title": row.get("title") or "",
+            "description": row.get("description") or "",
+            "is_complete": (row.get("is_complete") or "").strip().lower()
+            in _TRUE_STRINGS,
+        }
+        yield record
+
+
+def write_jsonl(tasks: Iterable[Task], stream: IO[str]) -> int:
+    """Write tasks as JSON lines and return how many were written."""
+    written = 0
+    write = stream.write
+    for task in tasks:
+        write(
+            _encode(
+                {
+                    "id": task.id,
+                    "title": task.title,
+                    "description": task.description,
+                    "is_complete": task.is_complete,
+                }
+            )
+        )
+        write("\n")
+        written += 1
+    return written
+
+
+def write_csv(tasks: Iterable[Task], stream: IO[str]) -> int:
+    """Write tasks as CSV with a header row and return how many were written."""
+    writer = csv.writer(stream)
+    writer.writerow(FIELDS)
+    written = 0
+    for task in tasks:
+        writer.writerow(
+            (task.id, task.title, task.description, int(task.is_complete))
+        )
+        written += 1
+    return written
+
+
+def read_tasks(stream: IO[str], fmt: str) -> Iterator[dict[str, Any]]:
+    """Yield records from a stream in the given format (``jsonl``/``csv``)."""
+    if fmt == "jsonl":
+        return read_jsonl(stream)
+    if fmt == "csv":
+        return read_csv(stream)
+    raise ValueError(f"Unsupported format: {fmt}")
+
+
+def write_tasks(tasks: Iterable[Task], stream: IO[str], fmt: str) -> int:
+    """Write tasks to a stream in the given format (``jsonl``/``csv``)."""
+    if fmt == "jsonl":
+        return write_jsonl(tasks, stream)
+    if fmt == "csv":
+        return write_csv(tasks, stream)
+    raise ValueError(f"Unsupported format: {fmt}")
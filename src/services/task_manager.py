@@ -4,13 +4,198 @@ This module provides the core service layer for managing tasks in memory.
 Follows the Single Responsibility Principle - only handles task operations.
 """
 
-from typing import Protocol
+import threading
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, Protocol
 
 from src.models.task import Task
+from src.services.history import (
+    History,
+    Operation,
+    RemoveTasks,
+    RestoreTasks,
+    SetFields,
+    SetStatus,
+)
+from src.services.search_index import SearchIndex, task_text
+
+if TYPE_CHECKING:
+    from src.services.metrics import Metrics, OperationStats
+
+TaskPredicate = Callable[[Task], bool]
+TaskStatus = Literal["all", "pending", "completed"]
+
+# Upper bound for parse_id_ranges, so a typo like "1-10000000000" fails fast
+# instead of building a huge list.
+MAX_BATCH_IDS = 1_000_000
+
+_STATUS_FILTERS: dict[str, bool | None] = {
+    "all": None,
+    "pending": False,
+    "completed": True,
+}
+
+
+def status_filter(status: TaskStatus) -> bool | None:
+    """Translate a status name into the ``is_complete`` storage filter.
+    
+    Raises:
+        ValueError: If the status is not "all", "pending" or "completed"
+    """
+    try:
+        return _STATUS_FILTERS[status]
+    except KeyError:
+        raise ValueError(f"Unknown task status: {status!r}") from None
+
+
+def parse_id_ranges(text: str) -> list[int]:
+    """Parse a list of task IDs and ID ranges such as ``"1-200,305,400-410"``.
+    
+    Items are separated by commas (or whitespace); a range includes both
+    ends. IDs keep the order they are given in, without duplicates.
+    
+    Raises:
+        ValueError: If an item is not a positive ID or ``low-high`` range,
+            or the text selects more than MAX_BATCH_IDS IDs
+    """
+    ids: dict[int, None] = {}
+    for item in text.replace(",", " ").split():
+        low, dash, high = item.partition("-")
+        try:
+            first = int(low)
+            last = int(high) if dash else first
+        except ValueError:
+            raise ValueError(f"Invalid task ID or range: {item!r}") from None
+        if first < 1 or last < first:
+            raise ValueError(f"Invalid task ID or range: {item!r}")
+        if len(ids) + last - first + 1 > MAX_BATCH_IDS:
+            raise ValueError(f"Select at most {MAX_BATCH_IDS} task IDs at once")
+        ids.update(dict.fromkeys(range(first, last + 1)))
+    if not ids:
+        raise ValueError("No task IDs given")
+    return list(ids)
+
+
+def batch_ids(ids: str | Iterable[int]) -> list[int]:
+    """Turn the IDs given to a batch operation into a list of unique IDs.
+    
+    Text is parsed with parse_id_ranges; other iterables keep their order
+    with duplicates removed.
+    
+    Raises:
+        ValueError: If text is not a valid list of IDs and ranges
+    """
+    if isinstance(ids, str):
+        return parse_id_ranges(ids)
+    return list(dict.fromkeys(ids))
+
+
+def task_from_record(record: Mapping[str, Any]) -> Task:
+    """Build an unnumbered Task from an import record, checking field types.
+    
+    Raises:
+        KeyError: If the record has no title
+        ValueError: If the title or description is not a string, the status
+            is not a bool, or the title is empty
+    """
+    title = record["title"]
+    description = record.get("description") or ""
+    is_complete = record.get("is_complete", False)
+    if not isinstance(title, str) or not isinstance(description, str):
+        raise ValueError("title and description must be strings")
+    if not isinstance(is_complete, bool):
+        raise ValueError(f"is_complete must be true or false, not {is_complete!r}")
+    return Task(id=0, title=title, description=description, is_complete=is_complete)
+
+
+def filter_tasks(
+    tasks: Iterable[Task],
+    limit: int | None = None,
+    predicate: TaskPredicate | None = None,
+) -> Iterator[Task]:
+    """Lazily apply an optional predicate and then an optional limit.
+    
+    Shared by storage backends whose ``iter_tasks`` cannot evaluate the
+    predicate natively.
+    
+    Args:
+        tasks: Tasks in the order they should be yielded
+        limit: Maximum number of tasks to yield (None for no limit)
+        predicate: Only tasks for which this returns True are yielded
+        
+    Returns:
+        Iterator over the selected tasks
+    """
+    selected: Iterable[Task] = tasks
+    if predicate is not None:
+        selected = filter(predicate, selected)
+    if limit is not None:
+        selected = islice(selected, max(limit, 0))
+    return iter(selected)
+
+
+class TaskStats(NamedTuple):
+    """Aggregate task counts reported by a storage backend.
+    
+    Attributes:
+        total: Number of stored tasks
+        completed: Number of tasks marked complete
+    """
+    
+    total: int
+    completed: int
+    
+    @property
+    def pending(self) -> int:
+        """Number of tasks not yet complete."""
+        return self.total - self.completed
+
+
+class TaskPage(NamedTuple):
+    """One page of tasks from a keyset (ID-cursor) query.
+    
+    Attributes:
+        tasks: Tasks on this page, in ascending ID order
+        has_previous: Whether tasks exist before the first one on the page
+        has_next: Whether tasks exist after the last one on the page
+    """
+    
+    tasks: list[Task]
+    has_previous: bool
+    has_next: bool
+    
+    @property
+    def first_id(self) -> int | None:
+        """ID of the first task on the page (None if empty)."""
+        return self.tasks[0].id if self.tasks else None
+    
+    @property
+    def last_id(self) -> int | None:
+        """ID of the last task on the page (None if empty)."""
+        return self.tasks[-1].id if self.tasks else None
 
 
 class TaskStorage(Protocol):
-    """Protocol for task storage backends (for future extensibility)."""
+    """Protocol for task storage backends (for future extensibility).
+    
+    Backends may also provide ``count() -> int`` and ``stats() -> TaskStats``
+    to report aggregates without a scan, ``max_id() -> int`` so that a
+    TaskManager opened on existing data can continue the ID sequence, and
+    ``save_many(tasks)`` to store a batch in one operation, and
+    ``update_fields(task_id, **changes) -> bool`` to change individual
+    fields without rebuilding the Task. For batches, ``delete_many(ids)``
+    and ``update_many(ids, **changes)`` apply one change to many tasks in
+    one operation (one transaction where the backend has them) and return
+    the IDs that were found. ``toggle(task_id) -> bool | None`` flips the
+    completion status as one atomic step and returns the new status (None
+    if not found), so concurrent toggles of one task cannot lose updates.
+    TaskManager uses them when present and falls back to the basic methods
+    otherwise; the same goes for ``iter_tasks``, which older backends may
+    not implement.
+    """
     
     def save(self, task: Task) -> None:
         """Save a task to storage."""
@@ -27,37 +212,308 @@ class TaskStorage(Protocol):
     def get_by_id(self, task_id: int) -> Task | None:
         """Get a specific task by ID."""
         ...
+    
+    def iter_tasks(
+        self,
+        start_id: int | None = None,
+        limit: int | None = None,
+        predicate: TaskPredicate | None = None,
+        reverse: bool = False,
+        is_complete: bool | None = None,
+    ) -> Iterator[Task]:
+        """Lazily yield tasks in ID order, starting at ``start_id``.
+        
+        ``limit`` applies after ``predicate``. With ``reverse`` the tasks
+        come in descending ID order starting at or below ``start_id``, and
+        ``is_complete`` restricts them to one completion status. Backends
+        should push all of these down as far as they can instead of
+        materializing every task.
+        """
+        ...
+
+
+def _walk_sorted(
+    ids: list[int], start_id: int | None, reverse: bool
+) -> Iterator[int]:
+    """Yield IDs from a sorted list that may change while it is walked.
+    
+    The position is kept only while the last ID yielded is still there;
+    once IDs were inserted or removed before it, the next one is found by
+    bisecting for the last ID, so none is skipped or repeated.
+    """
+    if reverse:
+        position = bisect_right(ids, start_id) if start_id is not None else len(ids)
+        while position:
+            position -= 1
+            task_id = ids[position]
+            yield task_id
+            if position >= len(ids) or ids[position] != task_id:
+                position = bisect_left(ids, task_id)
+    else:
+        position = bisect_left(ids, start_id) if start_id is not None else 0
+        while position < len(ids):
+            task_id = ids[position]
+            yield task_id
+            position += 1
+            if position > len(ids) or ids[position - 1] != task_id:
+                position = bisect_right(ids, task_id)
 
 
 class InMemoryStorage:
     """In-memory storage implementation using a dictionary.
     
     Tasks are stored with their ID as key for O(1) lookup.
+    A sorted list of IDs is kept alongside the dictionary so that ordered
+    reads never have to sort. IDs handed out by TaskManager only grow, so
+    new tasks take an O(1) append; out-of-order IDs fall back to bisect.
+    Each task's ID is also in exactly one of two status sets (complete or
+    pending), which gives O(1) counts and lets filtered views touch only
+    the matching tasks. A status holding few of the tasks also keeps its
+    IDs in a sorted list, maintained like the ID index, so its pages are
+    read without sorting.
     Data is lost when the application exits.
     """
     
+    # A status smaller than this fraction of all tasks is read from its
+    # own sorted ID list; larger ones are read by filtering the ID index.
+    SPARSE_STATUS_RATIO = 0.125
+    
     def __init__(self) -> None:
         """Initialize empty storage."""
         self._tasks: dict[int, Task] = {}
+        self._ids: list[int] = []
+        self._ids_by_status: dict[bool, set[int]] = {True: set(), False: set()}
+        # Built on the first read of a sparse status, dropped once it is dense.
+        self._sorted_by_status: dict[bool, list[int] | None] = {
+            True: None,
+            False: None,
+        }
+    
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over tasks in ID order without copying them into a list."""
+        return self.iter_tasks()
+    
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return len(self._tasks)
     
     def save(self, task: Task) -> None:
         """Save a task to memory."""
-        self._tasks[task.id] = task
+        task_id = task.id
+        previous = self._tasks.get(task_id)
+        if previous is None:
+            ids = self._ids
+            if not ids or task_id > ids[-1]:
+                ids.append(task_id)
+            else:
+                insort(ids, task_id)
+            self._tasks[task_id] = task
+            self._index_status(task_id, task.is_complete)
+            return
+        self._tasks[task_id] = task
+        if previous.is_complete != task.is_complete:
+            self._unindex_status(task_id, previous.is_complete)
+            self._index_status(task_id, task.is_complete)
+    
+    def save_many(self, tasks: Iterable[Task]) -> None:
+        """Save a batch of tasks to memory.
+        
+        New tasks with ascending IDs above the current maximum (what
+        TaskManager.add_tasks produces) skip the per-task index bookkeeping.
+        New IDs below the maximum (such as restored deletions) are merged
+        into the ID index with one sort instead of one insertion each; the
+        sorted status lists are then rebuilt on their next read.
+        """
+        self._sorted_by_status = {True: None, False: None}
+        store = self._tasks
+        ids = self._ids
+        by_status = self._ids_by_status
+        save = self.save
+        inserted: list[int] = []
+        for task in tasks:
+            task_id = task.id
+            if task_id in store:
+                save(task)
+                continue
+            if not ids or task_id > ids[-1]:
+                ids.append(task_id)
+            else:
+                inserted.append(task_id)
+            store[task_id] = task
+            by_status[task.is_complete].add(task_id)
+        if len(inserted) > 64:
+            # Sorting two ascending runs is a linear merge.
+            inserted.sort()
+            ids.extend(inserted)
+            ids.sort()
+        else:
+            for task_id in inserted:
+                insort(ids, task_id)
     
     def delete(self, task_id: int) -> bool:
         """Delete a task from memory. Returns True if found and deleted."""
-        if task_id in self._tasks:
-            del self._tasks[task_id]
+        task = self._tasks.pop(task_id, None)
+        if task is not None:
+            self._unindex_status(task_id, task.is_complete)
+            ids = self._ids
+            if ids[-1] == task_id:
+                ids.pop()
+            else:
+                del ids[bisect_left(ids, task_id)]
             return True
         return False
     
+    def update_fields(self, task_id: int, **changes: Any) -> bool:
+        """Change fields of a stored task in place.
+        
+        Only the changed fields are validated, and a status change just
+        moves the ID between the status indexes.
+        
+        Returns:
+            True if the task was found and updated, False otherwise
+            
+        Raises:
+            ValueError: If a field is unknown or the new title is empty
+        """
+        task = self._tasks.get(task_id)
+        if task is None:
+            return False
+        changes = Task.clean_changes(changes)
+        was_complete = task.is_complete
+        for name, value in changes.items():
+            setattr(task, name, value)
+        if task.is_complete != was_complete:
+            self._unindex_status(task_id, was_complete)
+            self._index_status(task_id, not was_complete)
+        return True
+    
+    def toggle(self, task_id: int) -> bool | None:
+        """Flip a task's completion status; return the new one (None if not found)."""
+        task = self._tasks.get(task_id)
+        if task is None:
+            return None
+        was_complete = task.is_complete
+        task.is_complete = not was_complete
+        self._unindex_status(task_id, was_complete)
+        self._index_status(task_id, not was_complete)
+        return not was_complete
+    
+    def delete_many(self, task_ids: Iterable[int]) -> list[int]:
+        """Delete several tasks and return the IDs that were found.
+        
+        Large batches rebuild the ordered ID index in one pass instead of
+        removing each ID from the middle of the list.
+        """
+        self._sorted_by_status = {True: None, False: None}
+        tasks = self._tasks
+        by_status = self._ids_by_status
+        deleted: list[int] = []
+        for task_id in task_ids:
+            task = tasks.pop(task_id, None)
+            if task is not None:
+                by_status[task.is_complete].discard(task_id)
+                deleted.append(task_id)
+        if len(deleted) > 64:
+            # In place, so iterators walking the index see the new one.
+            self._ids[:] = [task_id for task_id in self._ids if task_id in tasks]
+        else:
+            ids = self._ids
+            for task_id in deleted:
+                del ids[bisect_left(ids, task_id)]
+        return deleted
+    
+    def _index_status(self, task_id: int, is_complete: bool) -> None:
+        """Add an ID to a status set and, if it has one, its sorted list."""
+        self._ids_by_status[is_complete].add(task_id)
+        ordered = self._sorted_by_status[is_complete]
+        if ordered is None:
+            return
+        if len(ordered) >= len(self._tasks) * self.SPARSE_STATUS_RATIO:
+            self._sorted_by_status[is_complete] = None
+        elif not ordered or task_id > ordered[-1]:
+            ordered.append(task_id)
+        else:
+            insort(ordered, task_id)
+    
+    def _unindex_status(self, task_id: int, is_complete: bool) -> None:
+        """Remove an ID from a status set and, if it has one, its sorted list."""
+        self._ids_by_status[is_complete].discard(task_id)
+        ordered = self._sorted_by_status[is_complete]
+        if ordered is not None:
+            if ordered[-1] == task_id:
+                ordered.pop()
+            else:
+                del ordered[bisect_left(ordered, task_id)]
+    
+    def update_many(self, task_ids: Iterable[int], **changes: Any) -> list[int]:
+        """Apply the same changes to several tasks; return the IDs found.
+        
+        Raises:
+            ValueError: If a field is unknown or the new title is empty
+        """
+        changes = Task.clean_changes(changes)
+        update = self.update_fields
+        return [task_id for task_id in task_ids if update(task_id, **changes)]
+    
     def get_all(self) -> list[Task]:
         """Get all tasks, sorted by ID."""
-        return sorted(self._tasks.values(), key=lambda t: t.id)
+        tasks = self._tasks
+        return [tasks[task_id] for task_id in self._ids]
     
     def get_by_id(self, task_id: int) -> Task | None:
         """Get a task by ID, or None if not found."""
         return self._tasks.get(task_id)
+    
+    def iter_tasks(
+        self,
+        start_id: int | None = None,
+        limit: int | None = None,
+        predicate: TaskPredicate | None = None,
+        reverse: bool = False,
+        is_complete: bool | None = None,
+    ) -> Iterator[Task]:
+        """Lazily yield tasks in ID order from ``start_id`` (inclusive).
+        
+        The start position is found by bisecting the ID index, so reading a
+        page from the middle costs the same as reading the first one, and
+        each later step bisects again, so tasks can be saved or deleted
+        while the iterator is in use. With
+        ``is_complete`` set, a small status is walked through its own sorted
+        ID list (sorted once, then kept up to date); a large one is applied
+        as a filter on the ID index, which stops as soon as ``limit``
+        matches are found.
+        """
+        ids = self._ids
+        wanted: set[int] | None = None
+        if is_complete is not None:
+            wanted = self._ids_by_status[is_complete]
+            if len(wanted) < len(ids) * self.SPARSE_STATUS_RATIO:
+                ordered = self._sorted_by_status[is_complete]
+                if ordered is None:
+                    ordered = sorted(wanted)
+                    self._sorted_by_status[is_complete] = ordered
+                ids = ordered
+            else:
+                self._sorted_by_status[is_complete] = None
+        
+        selected: Iterable[int] = _walk_sorted(ids, start_id, reverse)
+        if wanted is not None:
+            selected = filter(wanted.__contains__, selected)
+        return filter_tasks(map(self._tasks.__getitem__, selected), limit, predicate)
+    
+    def count(self) -> int:
+        """Get the number of stored tasks in O(1)."""
+        return len(self._tasks)
+    
+    def stats(self) -> TaskStats:
+        """Get total and completed counts in O(1)."""
+        return TaskStats(
+            total=len(self._tasks), completed=len(self._ids_by_status[True])
+        )
+    
+    def max_id(self) -> int:
+        """Get the highest stored task ID, or 0 when empty."""
+        return self._ids[-1] if self._ids else 0
 
 
 class TaskManager:
@@ -66,6 +522,10 @@ class TaskManager:
     This is the main service class that coordinates task operations.
     Uses InMemoryStorage by default, but can accept any TaskStorage implementation.
     
+    IDs are allocated atomically and the search index is guarded by a lock,
+    so a manager can be shared between threads as long as its storage is
+    thread-safe too (see ConcurrentStorage).
+    
     Attributes:
         storage: The storage backend (default: InMemoryStorage)
         
@@ -85,7 +545,35 @@ class TaskManager:
             storage: Storage implementation (default: InMemoryStorage)
         """
         self._storage = storage if storage is not None else InMemoryStorage()
-        self._next_id: int = 1
+        self._next_id: int = self._highest_stored_id() + 1
+        self._id_lock = threading.Lock()
+        # Built on the first search, then maintained by every text change.
+        self._search_index: SearchIndex | None = None
+        self._index_lock = threading.Lock()
+        self._metrics: Metrics | None = None
+        self._history: History | None = None
+    
+    def _highest_stored_id(self) -> int:
+        """Find the largest ID already in storage (0 if empty)."""
+        max_id = getattr(self._storage, "max_id", None)
+        if max_id is not None:
+            return max_id()
+        tasks = self._storage.get_all()
+        return tasks[-1].id if tasks else 0
+    
+    def _allocate_ids(self, count: int) -> int:
+        """Atomically reserve ``count`` consecutive IDs and return the first."""
+        with self._id_lock:
+            first_id = self._next_id
+            self._next_id = first_id + count
+        return first_id
+    
+    def _update_index(self, apply: Callable[[SearchIndex], None]) -> None:
+        """Apply a change to the search index if it has been built."""
+        if self._search_index is None:
+            return
+        with self._index_lock:
+            apply(self._search_index)
     
     def add_task(self, title: str, description: str = "") -> Task:
         """Create a new task with auto-generated ID.
@@ -100,11 +588,149 @@ class TaskManager:
         Raises:
             ValueError: If title is empty or whitespace
         """
-        task = Task(id=self._next_id, title=title, description=description)
+        # Validate before reserving an ID so invalid input leaves no gap.
+        task = Task(id=0, title=title, description=description)
+        task.id = self._allocate_ids(1)
         self._storage.save(task)
-        self._next_id += 1
+        self._update_index(lambda index: index.add(task))
+        if self._history is not None:
+            self._history.record(
+                f"add task {task.id}", RemoveTasks(range(task.id, task.id + 1))
+            )
         return task
     
+    def add_tasks(
+        self,
+        records: Iterable[Mapping[str, Any]],
+        batch_size: int = 10_000,
+    ) -> int:
+        """Create many tasks from a stream of records.
+        
+        Records are consumed lazily in batches. Each batch gets a contiguous
+        block of IDs and is written with the backend's ``save_many`` when it
+        has one, so persistent backends commit once per batch rather than
+        once per task. Any ``id`` in a record is ignored.
+        
+        Args:
+            records: Mappings with a ``title`` and optional ``description``
+                and ``is_complete``
+            batch_size: Number of tasks validated and stored per batch
+            
+        Returns:
+            The number of tasks created
+            
+        Raises:
+            ValueError: If a record has an empty title; tasks from earlier
+                batches are kept
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        records = iter(records)
+        created = 0
+        # ID blocks of the stored batches, merged while they are contiguous.
+        added: list[range] = []
+        try:
+            while batch := list(islice(records, batch_size)):
+                try:
+                    tasks = [task_from_record(record) for record in batch]
+                except (KeyError, ValueError) as e:
+                    raise ValueError(f"Invalid task record: {e}") from e
+                
+                first_id = self._allocate_ids(len(tasks))
+                for task_id, task in enumerate(tasks, start=first_id):
+                    task.id = task_id
+                self._save_tasks(tasks)
+                created += len(tasks)
+                if added and added[-1].stop == first_id:
+                    added[-1] = range(added[-1].start, first_id + len(tasks))
+                else:
+                    added.append(range(first_id, first_id + len(tasks)))
+        finally:
+            if added and self._history is not None:
+                ids = added[0] if len(added) == 1 else array("q", chain(*added))
+                self._history.record(f"add {created} tasks", RemoveTasks(ids))
+        return created
+    
+    def export_tasks(self) -> Iterator[Task]:
+        """Stream all tasks in ID order for export.
+        
+        Returns:
+            Iterator over every stored task
+        """
+        return self.iter_tasks()
+    
+    def iter_tasks(
+        self,
+        start_id: int | None = None,
+        limit: int | None = None,
+        predicate: TaskPredicate | None = None,
+        reverse: bool = False,
+        status: TaskStatus = "all",
+    ) -> Iterator[Task]:
+        """Lazily yield tasks in ID order.
+        
+        Nothing is materialized up front, so memory use stays flat however
+        many tasks are stored. Backends without ``iter_tasks`` are read with
+        ``get_all()`` and filtered here.
+        
+        Args:
+            start_id: First ID to include (None to start at the lowest, or
+                the highest when ``reverse`` is set)
+            limit: Maximum number of tasks to yield (None for no limit)
+            predicate: Only yield tasks for which this returns True
+            reverse: Yield in descending ID order from ``start_id`` down
+            status: "all", or only "pending" or "completed" tasks
+            
+        Returns:
+            Iterator over the matching tasks
+        """
+        is_complete = status_filter(status)
+        iter_tasks = getattr(self._storage, "iter_tasks", None)
+        if iter_tasks is not None:
+            return iter_tasks(
+                start_id=start_id,
+                limit=limit,
+                predicate=predicate,
+                reverse=reverse,
+                is_complete=is_complete,
+            )
+        tasks: Iterable[Task] = self._storage.get_all()
+        if reverse:
+            tasks = reversed(tasks)
+        if start_id is not None:
+            if reverse:
+                tasks = (task for task in tasks if task.id <= start_id)
+            else:
+                tasks = (task for task in tasks if task.id >= start_id)
+        if is_complete is not None:
+            tasks = (task for task in tasks if task.is_complete == is_complete)
+        return filter_tasks(tasks, limit, predicate)
+    
+    def get_tasks(
+        self,
+        status: TaskStatus = "all",
+        start_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        """Get tasks with a given completion status, sorted by ID.
+        
+        Backed by per-status ID sets in storage, so a filtered view only
+        touches the tasks that match rather than scanning the whole list.
+        
+        Args:
+            status: "all", "pending" or "completed"
+            start_id: First ID to include (None to start at the lowest)
+            limit: Maximum number of tasks to return (None for all)
+            
+        Returns:
+            Matching tasks in ID order
+            
+        Raises:
+            ValueError: If the status is not recognised
+        """
+        return list(self.iter_tasks(start_id=start_id, limit=limit, status=status))
+    
     def get_all_tasks(self) -> list[Task]:
         """Get all tasks, sorted by ID.
         
@@ -113,6 +739,75 @@ class TaskManager:
         """
         return self._storage.get_all()
     
+    def get_page(
+        self,
+        start_id: int | None = None,
+        limit: int = 20,
+        status: TaskStatus = "all",
+    ) -> TaskPage:
+        """Get a page of tasks starting at ``start_id`` (inclusive).
+        
+        Pages are addressed by ID rather than by offset, so fetching a page
+        deep into the list costs the same as fetching the first one. Pass
+        ``page.last_id + 1`` to move forward.
+        
+        Args:
+            start_id: First ID to include (None for the first page)
+            limit: Maximum number of tasks on the page
+            status: "all", or page through only "pending"/"completed" tasks
+            
+        Returns:
+            The requested TaskPage
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        tasks = list(self.iter_tasks(start_id=start_id, limit=limit + 1, status=status))
+        has_next = len(tasks) > limit
+        del tasks[limit:]
+        has_previous = bool(tasks) and self._has_task_before(tasks[0].id, status)
+        return TaskPage(tasks=tasks, has_previous=has_previous, has_next=has_next)
+    
+    def get_page_before(
+        self,
+        before_id: int,
+        limit: int = 20,
+        status: TaskStatus = "all",
+    ) -> TaskPage:
+        """Get the page of tasks that ends just before ``before_id``.
+        
+        Used to move backwards with ``page.first_id``. If fewer than
+        ``limit`` tasks precede ``before_id``, the first page is returned.
+        
+        Args:
+            before_id: Exclusive upper bound for the page
+            limit: Maximum number of tasks on the page
+            status: "all", or page through only "pending"/"completed" tasks
+            
+        Returns:
+            The requested TaskPage
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        tasks = list(
+            self.iter_tasks(
+                start_id=before_id - 1, limit=limit + 1, reverse=True, status=status
+            )
+        )
+        if len(tasks) <= limit:
+            return self.get_page(limit=limit, status=status)
+        del tasks[limit:]
+        tasks.reverse()
+        later = self.iter_tasks(start_id=before_id, limit=1, status=status)
+        has_next = next(later, None) is not None
+        return TaskPage(tasks=tasks, has_previous=True, has_next=has_next)
+    
+    def _has_task_before(self, task_id: int, status: TaskStatus = "all") -> bool:
+        """Check whether any matching task has an ID lower than ``task_id``."""
+        earlier = self.iter_tasks(
+            start_id=task_id - 1, limit=1, reverse=True, status=status
+        )
+        return next(earlier, None) is not None
+    
     def get_task(self, task_id: int) -> Task | None:
         """Get a specific task by ID.
         
@@ -140,25 +835,31 @@ class TaskManager:
         Returns:
             True if task found and updated, False otherwise
             
+        Raises:
+            ValueError: If the new title is empty or whitespace
+            
         Note:
-            Creates a new Task instance with updated values since Task is immutable-ish.
+            Backends with ``update_fields`` change only the given fields in
+            place; otherwise a new Task instance is built and saved.
         """
         existing = self._storage.get_by_id(task_id)
         if existing is None:
             return False
         
-        # Use existing values if not provided
-        new_title = title if title is not None else existing.title
-        new_description = description if description is not None else existing.description
-        
-        # Create updated task (preserving id and is_complete)
-        updated_task = Task(
-            id=existing.id,
-            title=new_title,
-            description=new_description,
-            is_complete=existing.is_complete
-        )
-        self._storage.save(updated_task)
+        changes: dict[str, Any] = {}
+        if title is not None:
+            changes["title"] = title
+        if description is not None:
+            changes["description"] = description
+        history = self._history
+        if history is None:
+            return self._set_fields(existing, changes)
+        # Read before writing: some backends return the stored Task itself.
+        previous = {name: getattr(existing, name) for name in changes}
+        if not self._set_fields(existing, changes):
+            return False
+        if previous:
+            history.record(f"update task {task_id}", SetFields(task_id, previous))
         return True
     
     def delete_task(self, task_id: int) -> bool:
@@ -170,7 +871,75 @@ class TaskManager:
         Returns:
             True if task found and deleted, False otherwise
         """
-        return self._storage.delete(task_id)
+        if self._search_index is None and self._history is None:
+            return self._storage.delete(task_id)
+        existing = self._storage.get_by_id(task_id)
+        if existing is None or not self._storage.delete(task_id):
+            return False
+        self._update_index(lambda index: index.remove(existing))
+        if self._history is not None:
+            self._history.record(f"delete task {task_id}", RestoreTasks((existing,)))
+        return True
+    
+    def delete_tasks(self, ids: str | Iterable[int]) -> dict[int, bool]:
+        """Delete several tasks in one storage operation.
+        
+        Args:
+            ids: Task IDs, or ID ranges as text (``"1-200,305"``)
+        
+        Returns:
+            Whether each ID was found and deleted, in the order given
+        
+        Raises:
+            ValueError: If ``ids`` is text that is not a valid ID list
+        """
+        task_ids = batch_ids(ids)
+        if self._search_index is None and self._history is None:
+            deleted = self._delete_ids(task_ids)
+        else:
+            found = [task for task in map(self._storage.get_by_id, task_ids) if task]
+            removed = self._remove_tasks(found)
+            deleted = {task.id for task in removed}
+            if removed and self._history is not None:
+                label = f"delete {len(removed)} tasks"
+                self._history.record(label, RestoreTasks(removed))
+        return {task_id: task_id in deleted for task_id in task_ids}
+    
+    def toggle_tasks(
+        self, ids: str | Iterable[int], complete: bool = True
+    ) -> dict[int, bool]:
+        """Mark several tasks complete (or pending) in one storage operation.
+        
+        Unlike ``toggle_complete``, every task ends up in the same state, so
+        tasks already in that state are left as they are.
+        
+        Args:
+            ids: Task IDs, or ID ranges as text (``"1-200,305"``)
+            complete: True to mark tasks complete, False to mark them pending
+        
+        Returns:
+            Whether each ID was found, in the order given
+        
+        Raises:
+            ValueError: If ``ids`` is text that is not a valid ID list
+        """
+        task_ids = batch_ids(ids)
+        history = self._history
+        if history is None:
+            found = self._set_status(task_ids, complete)
+        else:
+            changed = array("q")
+            for task in map(self._storage.get_by_id, task_ids):
+                if task is not None and task.is_complete != complete:
+                    changed.append(task.id)
+            found = self._set_status(task_ids, complete)
+            if changed:
+                state = "complete" if complete else "pending"
+                history.record(
+                    f"mark {len(changed)} tasks {state}",
+                    SetStatus(changed, not complete),
+                )
+        return {task_id: task_id in found for task_id in task_ids}
     
     def toggle_complete(self, task_id: int) -> bool:
         """Toggle a task's completion status.
@@ -181,26 +950,64 @@ class TaskManager:
         Returns:
             True if task found and toggled, False otherwise
         """
-        existing = self._storage.get_by_id(task_id)
-        if existing is None:
-            return False
-        
-        # Create task with toggled status
-        toggled_task = Task(
-            id=existing.id,
-            title=existing.title,
-            description=existing.description,
-            is_complete=not existing.is_complete
-        )
-        self._storage.save(toggled_task)
+        toggle = getattr(self._storage, "toggle", None)
+        if toggle is not None:
+            # One atomic step in the backend: no read-modify-write race.
+            is_complete = toggle(task_id)
+            if is_complete is None:
+                return False
+            was_complete = not is_complete
+        else:
+            existing = self._storage.get_by_id(task_id)
+            if existing is None:
+                return False
+            was_complete = existing.is_complete
+            update_fields = getattr(self._storage, "update_fields", None)
+            if update_fields is not None:
+                toggled = update_fields(task_id, is_complete=not was_complete)
+            else:
+                toggled = self._set_fields(existing, {"is_complete": not was_complete})
+            if not toggled:
+                return False
+        if self._history is not None:
+            self._history.record(
+                f"toggle task {task_id}", SetStatus((task_id,), was_complete)
+            )
         return True
     
+    def search(self, query: str, limit: int | None = None) -> list[Task]:
+        """Find tasks whose title or description contains every query word.
+        
+        Words match as prefixes ("gro" finds "groceries") and case is
+        ignored. The inverted index behind this is built from storage on
+        the first call and kept up to date by add/update/delete afterwards.
+        
+        Args:
+            query: Free-text search query
+            limit: Maximum number of tasks to return (None for all)
+            
+        Returns:
+            Matching tasks in ID order
+        """
+        with self._index_lock:
+            if self._search_index is None:
+                # Publish the index before filling it: concurrent writers
+                # then queue on the lock and apply their change afterwards.
+                self._search_index = SearchIndex()
+                self._search_index.add_many(self.iter_tasks())
+            ids = self._search_index.search(query, limit)
+        get_by_id = self._storage.get_by_id
+        return [task for task in map(get_by_id, ids) if task is not None]
+    
     def get_task_count(self) -> int:
         """Get the total number of tasks.
         
         Returns:
             Count of all tasks
         """
+        count = getattr(self._storage, "count", None)
+        if count is not None:
+            return count()
         return len(self._storage.get_all())
     
     def get_completed_count(self) -> int:
@@ -209,4 +1016,256 @@ class TaskManager:
         Returns:
             Count of completed tasks
         """
-        return sum(1 for task in self._storage.get_all() if task.is_complete)
+        return self.get_stats().completed
+    
+    def get_stats(self) -> TaskStats:
+        """Get total, completed and pending counts in one call.
+        
+        Uses the storage backend's ``stats()`` when available, otherwise
+        scans all tasks once.
+        
+        Returns:
+            TaskStats snapshot of the current counts
+        """
+        stats = getattr(self._storage, "stats", None)
+        if stats is not None:
+            return stats()
+        tasks = self._storage.get_all()
+        completed = sum(1 for task in tasks if task.is_complete)
+        return TaskStats(total=len(tasks), completed=completed)
+    
+    # -------------------------------------------------------------------------
+    # Undo/redo
+    # -------------------------------------------------------------------------
+    
+    def enable_history(self, depth: int = 100) -> None:
+        """Start logging changes so that they can be undone and redone.
+        
+        Each change made through this manager is logged as the operation
+        that reverts it (see ``src.services.history``); only the latest
+        ``depth`` are kept. Changes made to the storage by other means are
+        not tracked, and undoing across them may not restore the old state.
+        
+        Args:
+            depth: Number of changes that can be undone
+        """
+        if self._history is None:
+            self._history = History(depth)
+    
+    def disable_history(self) -> None:
+        """Stop logging changes and drop the logged ones."""
+        self._history = None
+    
+    @property
+    def history_enabled(self) -> bool:
+        """Whether ``enable_history()`` is in effect."""
+        return self._history is not None
+    
+    @property
+    def can_undo(self) -> bool:
+        """Whether there is a logged change to undo."""
+        return self._history is not None and self._history.can_undo
+    
+    @property
+    def can_redo(self) -> bool:
+        """Whether there is an undone change to redo."""
+        return self._history is not None and self._history.can_redo
+    
+    def undo(self) -> str | None:
+        """Revert the latest change.
+        
+        A batch (bulk add, ``delete_tasks``, ``toggle_tasks``) is reverted
+        with one batched storage call.
+        
+        Returns:
+            A description of the reverted change, such as
+            ``"delete 3 tasks"``, or None if there is nothing to undo
+        """
+        if self._history is None:
+            return None
+        return self._history.undo(self._apply_operation)
+    
+    def redo(self) -> str | None:
+        """Re-apply the latest undone change.
+        
+        Returns:
+            A description of the change, or None if there is nothing to redo
+        """
+        if self._history is None:
+            return None
+        return self._history.redo(self._apply_operation)
+    
+    def _apply_operation(self, operation: Operation) -> Operation:
+        """Perform a logged operation and return the one that reverts it."""
+        if isinstance(operation, RestoreTasks):
+            tasks = list(operation.tasks)
+            self._save_tasks(tasks)
+            return RemoveTasks(array("q", [task.id for task in tasks]))
+        if isinstance(operation, RemoveTasks):
+            found = [
+                task for task in map(self._storage.get_by_id, operation.ids) if task
+            ]
+            return RestoreTasks(self._remove_tasks(found))
+        if isinstance(operation, SetStatus):
+            found = self._set_status(list(operation.ids), operation.is_complete)
+            ids = array("q", [task_id for task_id in operation.ids if task_id in found])
+            return SetStatus(ids, not operation.is_complete)
+        existing = self._storage.get_by_id(operation.task_id)
+        if existing is None:
+            return operation
+        previous = {name: getattr(existing, name) for name in operation.changes}
+        self._set_fields(existing, operation.changes)
+        return SetFields(operation.task_id, previous)
+    
+    # -------------------------------------------------------------------------
+    # Storage writes shared by the public operations and undo/redo
+    # -------------------------------------------------------------------------
+    
+    def _save_tasks(self, tasks: list[Task]) -> None:
+        """Store tasks that already have IDs, batched when possible."""
+        save_many = getattr(self._storage, "save_many", None)
+        if save_many is not None:
+            save_many(tasks)
+        else:
+            for task in tasks:
+                self._storage.save(task)
+        self._update_index(lambda index: index.add_many(tasks))
+    
+    def _delete_ids(self, task_ids: list[int]) -> set[int]:
+        """Delete tasks by ID, batched when possible; return the IDs found."""
+        delete_many = getattr(self._storage, "delete_many", None)
+        if delete_many is not None:
+            return set(delete_many(task_ids))
+        return {task_id for task_id in task_ids if self._storage.delete(task_id)}
+    
+    def _remove_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Delete tasks read from storage; return those actually deleted."""
+        deleted = self._delete_ids([task.id for task in tasks])
+        removed = [task for task in tasks if task.id in deleted]
+        if removed:
+            def apply(index: SearchIndex) -> None:
+                for task in removed:
+                    index.remove(task)
+            
+            self._update_index(apply)
+        return removed
+    
+    def _set_status(self, task_ids: list[int], complete: bool) -> set[int]:
+        """Set the status of tasks, batched when possible; return the IDs found."""
+        storage = self._storage
+        update_many = getattr(storage, "update_many", None)
+        if update_many is not None:
+            return set(update_many(task_ids, is_complete=complete))
+        found = set()
+        for task_id in task_ids:
+            task = storage.get_by_id(task_id)
+            if task is None:
+                continue
+            found.add(task_id)
+            if task.is_complete != complete:
+                # Never mutate the fetched task: it may be the stored object.
+                self._set_fields(task, {"is_complete": complete})
+        return found
+    
+    def _set_fields(self, existing: Task, changes: dict[str, Any]) -> bool:
+        """Change fields of a stored task and keep the search index current.
+        
+        Backends with ``update_fields`` change only the given fields in
+        place; otherwise a new Task instance is built and saved.
+        
+        Returns:
+            True if the task was still stored and has been updated
+        
+        Raises:
+            ValueError: If the new title is empty or whitespace
+        """
+        task_id = existing.id
+        text_changed = "title" in changes or "description" in changes
+        update_fields = getattr(self._storage, "update_fields", None)
+        if update_fields is not None:
+            if self._search_index is None or not text_changed:
+                return update_fields(task_id, **changes)
+            old_text = task_text(existing)
+            if not update_fields(task_id, **changes):
+                return False
+            updated = self._storage.get_by_id(task_id)
+            if updated is not None:
+                new_text = task_text(updated)
+                self._update_index(
+                    lambda index: index.replace_text(task_id, old_text, new_text)
+                )
+            return True
+        
+        fields = {
+            "title": existing.title,
+            "description": existing.description,
+            "is_complete": existing.is_complete,
+        }
+        fields.update(changes)
+        updated_task = Task(id=task_id, **fields)
+        self._storage.save(updated_task)
+        if text_changed:
+            self._update_index(lambda index: index.replace(existing, updated_task))
+        return True
+    
+    # -------------------------------------------------------------------------
+    # Instrumentation
+    # -------------------------------------------------------------------------
+    
+    def enable_metrics(self, sample_every: int = 16) -> None:
+        """Start counting and timing manager and storage calls.
+        
+        Every public method of this manager, and the storage it uses, is
+        replaced by a timing wrapper (see ``src.services.metrics``). While
+        metrics are disabled nothing is wrapped, so they cost nothing.
+        
+        Args:
+            sample_every: Time one call in this many (every call is counted)
+        """
+        if self._metrics is not None:
+            return
+        from src.services.metrics import InstrumentedStorage, Metrics
+        
+        metrics = Metrics(sample_every)
+        self._storage = InstrumentedStorage(self._storage, metrics)
+        for name in _INSTRUMENTED_METHODS:
+            setattr(self, name, metrics.timed(f"manager.{name}", getattr(self, name)))
+        self._metrics = metrics
+    
+    def disable_metrics(self) -> None:
+        """Stop instrumenting and drop the collected metrics."""
+        if self._metrics is None:
+            return
+        for name in _INSTRUMENTED_METHODS:
+            del self.__dict__[name]
+        self._storage = self._storage.backend  # type: ignore[attr-defined]
+        self._metrics = None
+    
+    @property
+    def metrics_enabled(self) -> bool:
+        """Whether ``enable_metrics()`` is in effect."""
+        return self._metrics is not None
+    
+    def metrics(self) -> "dict[str, OperationStats]":
+        """Snapshot of call counts and latencies since metrics were enabled.
+        
+        Returns:
+            OperationStats keyed by ``manager.<method>`` or
+            ``storage.<method>``, sorted by name; empty when disabled
+        """
+        return self._metrics.snapshot() if self._metrics is not None else {}
+    
+    def reset_metrics(self) -> None:
+        """Zero the collected metrics without disabling them."""
+        if self._metrics is not None:
+            self._metrics.reset()
+
+
+_METRICS_API = frozenset(
+    {"enable_metrics", "disable_metrics", "metrics", "reset_metrics"}
+)
+_INSTRUMENTED_METHODS = tuple(
+    name
+    for name, value in vars(TaskManager).items()
+    if callable(value) and not name.startswith("_") and name not in _METRICS_API
+)
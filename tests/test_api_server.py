@@ -0,0 +1,169 @@
+"""Tests for the HTTP API server."""
+
+import json
+import socket
+import threading
+from collections.abc import Iterator
+from http.client import HTTPConnection
+from typing import Any
+
+import pytest
+
+from src.api.server import make_server
+from src.services.concurrent_storage import ConcurrentStorage
+from src.services.task_manager import TaskManager
+
+
+class Client:
+    """Minimal JSON client reusing one keep-alive connection."""
+    
+    def __init__(self, port: int) -> None:
+        self.connection = HTTPConnection("127.0.0.1", port, timeout=5)
+    
+    def request(self, method: str, path: str, body: Any = None) -> tuple[int, Any]:
+        payload = None if body is None else json.dumps(body)
+        headers = {"Content-Type": "application/json"} if payload else {}
+        self.connection.request(method, path, body=payload, headers=headers)
+        response = self.connection.getresponse()
+        raw = response.read()
+        return response.status, json.loads(raw) if raw else None
+
+
+@pytest.fixture
+def client() -> Iterator[Client]:
+    """A client talking to a server on a free loopback port."""
+    server = make_server(TaskManager(ConcurrentStorage()), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = Client(server.server_port)
+    yield client
+    client.connection.close()
+    server.shutdown()
+    server.server_close()
+
+
+class TestTaskEndpoints:
+    """Tests for the CRUD endpoints."""
+    
+    def test_create_get_update_toggle_delete(self, client: Client) -> None:
+        """A task goes through its whole life cycle over one connection."""
+        status, task = client.request("POST", "/tasks", {"title": "Write API"})
+        assert status == 201
+        assert task == {
+            "id": 1,
+            "title": "Write API",
+            "description": "",
+            "is_complete": False,
+        }
+        
+        assert client.request("GET", "/tasks/1") == (200, task)
+        status, task = client.request(
+            "PATCH", "/tasks/1", {"description": "with tests", "is_complete": True}
+        )
+        assert status == 200
+        assert (task["description"], task["is_complete"]) == ("with tests", True)
+        status, task = client.request("POST", "/tasks/1/toggle")
+        assert (status, task["is_complete"]) == (200, False)
+        assert client.request("DELETE", "/tasks/1") == (204, None)
+        assert client.request("GET", "/tasks/1")[0] == 404
+    
+    def test_invalid_input_is_a_bad_request(self, client: Client) -> None:
+        """Validation errors come back as 400 with a message."""
+        status, body = client.request("POST", "/tasks", {"title": "  "})
+        assert status == 400
+        assert "empty" in body["error"]
+        assert client.request("GET", "/tasks?status=bogus")[0] == 400
+        assert client.request("POST", "/tasks", ["not", "an", "object"])[0] == 400
+    
+    def test_wrong_field_types_are_bad_requests(self, client: Client) -> None:
+        """Non-string text and non-boolean status are rejected with 400."""
+        client.request("POST", "/tasks", {"title": "Task"})
+        
+        assert client.request("POST", "/tasks", {"title": 5})[0] == 400
+        assert client.request("PATCH", "/tasks/1", {"description": ["x"]})[0] == 400
+        batch = {"tasks": [{"title": 5}]}
+        assert client.request("POST", "/tasks/batch", batch)[0] == 400
+        status, body = client.request("PATCH", "/tasks/1", {"is_complete": "false"})
+        assert (status, body) == (400, {"error": '"is_complete" must be a boolean'})
+        assert client.request("GET", "/tasks/1")[1]["is_complete"] is False
+    
+    def test_patch_status_is_idempotent(self, client: Client) -> None:
+        """Repeating a PATCH of is_complete leaves the same state."""
+        client.request("POST", "/tasks", {"title": "Task"})
+        
+        for _ in range(2):
+            status, task = client.request("PATCH", "/tasks/1", {"is_complete": True})
+            assert (status, task["is_complete"]) == (200, True)
+    
+    def test_unexpected_error_is_a_server_error(
+        self, client: Client, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Bugs in a handler still produce a response, with status 500."""
+        def fail(self: TaskManager) -> None:
+            raise RuntimeError("boom")
+        
+        monkeypatch.setattr(TaskManager, "get_stats", fail)
+        
+        status, body = client.request("GET", "/stats")
+        assert (status, body) == (500, {"error": "Internal server error"})
+        assert client.request("GET", "/tasks")[0] == 200
+    
+    def test_negative_content_length_is_a_bad_request(self, client: Client) -> None:
+        """A negative body length is answered at once instead of hanging."""
+        address = ("127.0.0.1", client.connection.port)
+        with socket.create_connection(address, timeout=5) as raw:
+            raw.sendall(
+                b"POST /tasks HTTP/1.1\r\nHost: localhost\r\n"
+                b"Content-Length: -1\r\n\r\n"
+            )
+            response = raw.makefile("rb").read()
+        
+        assert response.startswith(b"HTTP/1.1 400")
+        assert b"Invalid Content-Length" in response
+    
+    def test_unknown_route_is_not_found(self, client: Client) -> None:
+        """Paths and methods without a handler return 404."""
+        assert client.request("GET", "/nope")[0] == 404
+        assert client.request("DELETE", "/tasks")[0] == 404
+
+
+class TestBatchAndPaging:
+    """Tests for batch endpoints, pagination and counts."""
+    
+    def test_batch_create_and_page_through(self, client: Client) -> None:
+        """Batch-created tasks are paged with next_start_id cursors."""
+        records = [
+            {"title": f"Task {n}", "is_complete": n % 2 == 0} for n in range(1, 26)
+        ]
+        assert client.request("POST", "/tasks/batch", {"tasks": records}) == (
+            201,
+            {"created": 25},
+        )
+        
+        status, page = client.request("GET", "/tasks?limit=10")
+        assert [t["id"] for t in page["tasks"]] == list(range(1, 11))
+        assert (page["has_previous"], page["has_next"], page["next_start_id"]) == (
+            False,
+            True,
+            11,
+        )
+        _, page = client.request("GET", "/tasks?limit=10&start_id=21")
+        assert [t["id"] for t in page["tasks"]] == [21, 22, 23, 24, 25]
+        assert page["next_start_id"] is None
+        _, page = client.request("GET", "/tasks?status=completed&limit=3")
+        assert [t["id"] for t in page["tasks"]] == [2, 4, 6]
+        
+        assert client.request("GET", "/stats") == (
+            200,
+            {"total": 25, "completed": 12, "pending": 13},
+        )
+    
+    def test_batch_delete_reports_deleted_ids(self, client: Client) -> None:
+        """Only IDs that existed are reported as deleted."""
+        records = [{"title": "a"}, {"title": "b"}]
+        client.request("POST", "/tasks/batch", {"tasks": records})
+        assert client.request("POST", "/tasks/delete", {"ids": [1, 7]}) == (
+            200,
+            {"deleted": [1]},
+        )
+        assert client.request("POST", "/tasks/delete", {"ids": "1"})[0] == 400
@@ -0,0 +1,169 @@
+"""Tests for the AsyncTaskManager facade and AsyncStorageAdapter."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.services.async_task_manager import AsyncStorageAdapter, AsyncTaskManager
+from src.services.sqlite_storage import SQLiteStorage
+from src.services.task_manager import InMemoryStorage, TaskStats
+
+
+class BasicStorage(InMemoryStorage):
+    """InMemoryStorage reduced to the basic TaskStorage methods."""
+    
+    save_many = update_fields = stats = None  # type: ignore[assignment]
+    max_id = iter_tasks = None  # type: ignore[assignment]
+    delete_many = update_many = toggle = None  # type: ignore[assignment]
+
+
+class TestAsyncTaskManager:
+    """Tests for the coroutine API."""
+    
+    def test_crud_round_trip(self) -> None:
+        """Add, read, update, toggle and delete all work as coroutines."""
+        async def scenario() -> None:
+            manager = AsyncTaskManager()
+            task = await manager.add_task("Write docs", "for the API")
+            assert task.id == 1
+            assert (await manager.get_task(1)).title == "Write docs"
+            assert await manager.update_task(1, title="Write more docs")
+            assert await manager.toggle_complete(1)
+            updated = await manager.get_task(1)
+            assert (updated.title, updated.is_complete) == ("Write more docs", True)
+            assert await manager.get_completed_count() == 1
+            assert await manager.delete_task(1)
+            assert not await manager.delete_task(1)
+            assert await manager.get_task_count() == 0
+        
+        asyncio.run(scenario())
+    
+    def test_batch_operations(self) -> None:
+        """delete_tasks and toggle_tasks accept ranges and report per ID."""
+        async def scenario() -> None:
+            manager = AsyncTaskManager()
+            await manager.add_tasks({"title": f"T{n}"} for n in range(6))
+            assert await manager.toggle_tasks("1-3") == {1: True, 2: True, 3: True}
+            assert await manager.delete_tasks("3-4,8") == {3: True, 4: True, 8: False}
+            assert await manager.get_stats() == TaskStats(total=4, completed=2)
+        
+        asyncio.run(scenario())
+    
+    def test_concurrent_toggles_of_one_task(self) -> None:
+        """Many clients toggling one task lose no flips."""
+        async def scenario() -> None:
+            manager = AsyncTaskManager()
+            await manager.add_task("Contended")
+            await asyncio.gather(*(manager.toggle_complete(1) for _ in range(2000)))
+            assert not (await manager.get_task(1)).is_complete
+        
+        asyncio.run(scenario())
+    
+    def test_invalid_title_raises(self) -> None:
+        """Validation errors propagate out of the coroutines."""
+        async def scenario() -> None:
+            manager = AsyncTaskManager()
+            with pytest.raises(ValueError):
+                await manager.add_task("   ")
+            await manager.add_task("Valid")
+            with pytest.raises(ValueError):
+                await manager.update_task(1, title="")
+            assert (await manager.add_task("Next")).id == 2
+        
+        asyncio.run(scenario())
+    
+    @pytest.mark.parametrize(
+        "record", [{"title": "T", "is_complete": "false"}, {"title": 5}]
+    )
+    def test_add_tasks_rejects_wrong_types(self, record: dict[str, object]) -> None:
+        """A string status or non-string title is a ValueError, not a crash."""
+        async def scenario() -> None:
+            async with AsyncTaskManager() as manager:
+                with pytest.raises(ValueError, match="Invalid task record"):
+                    await manager.add_tasks([record])
+                assert await manager.get_task_count() == 0
+        
+        asyncio.run(scenario())
+    
+    def test_aclose_stops_default_workers(self) -> None:
+        """Leaving the context stops the threads of the default storage."""
+        def workers() -> list[threading.Thread]:
+            return [
+                thread
+                for thread in threading.enumerate()
+                if thread.name.startswith("task-storage")
+            ]
+        
+        async def scenario() -> None:
+            async with AsyncTaskManager() as manager:
+                await manager.add_task("Task")
+                assert workers()
+        
+        before = len(workers())
+        asyncio.run(scenario())
+        
+        assert len(workers()) == before
+    
+    def test_many_concurrent_clients_get_unique_ids(self) -> None:
+        """Thousands of concurrent add_task calls share a few worker threads."""
+        async def scenario() -> None:
+            manager = AsyncTaskManager()
+            tasks = await asyncio.gather(
+                *(manager.add_task(f"Task {n}") for n in range(3000))
+            )
+            assert sorted(t.id for t in tasks) == list(range(1, 3001))
+            await asyncio.gather(
+                *(manager.toggle_complete(n) for n in range(1, 3001, 3))
+            )
+            assert await manager.get_stats() == TaskStats(total=3000, completed=1000)
+        
+        asyncio.run(scenario())
+    
+    def test_continues_ids_of_existing_storage(self) -> None:
+        """IDs continue after the highest stored ID of a wrapped backend."""
+        async def scenario() -> None:
+            storage = SQLiteStorage()
+            async with AsyncStorageAdapter(storage, max_workers=1) as adapter:
+                manager = AsyncTaskManager(adapter)
+                assert await manager.add_tasks(
+                    [{"title": "A"}, {"title": "B", "is_complete": True}]
+                ) == 2
+                reopened = AsyncTaskManager(adapter)
+                assert (await reopened.add_task("C")).id == 3
+                pending = await reopened.get_tasks("pending")
+                assert [t.title for t in pending] == ["A", "C"]
+            storage.close()
+        
+        asyncio.run(scenario())
+
+
+class TestAsyncStorageAdapter:
+    """Tests for wrapping sync backends."""
+    
+    def test_rejects_zero_workers(self) -> None:
+        """The pool needs at least one worker."""
+        with pytest.raises(ValueError):
+            AsyncStorageAdapter(InMemoryStorage(), max_workers=0)
+    
+    def test_falls_back_to_basic_methods(self) -> None:
+        """Backends without the optional methods still support every call."""
+        async def scenario() -> None:
+            async with AsyncStorageAdapter(BasicStorage(), max_workers=1) as adapter:
+                manager = AsyncTaskManager(adapter)
+                await manager.add_tasks({"title": f"T{n}"} for n in range(5))
+                assert await manager.toggle_complete(2)
+                assert await manager.update_task(3, description="changed")
+                assert await manager.get_stats() == TaskStats(total=5, completed=1)
+                listed = await manager.get_tasks(start_id=2, limit=2)
+                assert [(t.id, t.description) for t in listed] == [
+                    (2, ""),
+                    (3, "changed"),
+                ]
+                assert (await AsyncTaskManager(adapter).add_task("Next")).id == 6
+                toggled = await manager.toggle_tasks("4-5,9")
+                assert toggled == {4: True, 5: True, 9: False}
+                assert await manager.delete_tasks([1, 2]) == {1: True, 2: True}
+                assert await manager.get_stats() == TaskStats(total=4, completed=2)
+        
+        asyncio.run(scenario())
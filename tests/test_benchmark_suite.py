@@ -0,0 +1,45 @@
+"""Tests for the benchmark suite runner."""
+
+import json
+from pathlib import Path
+
+from benchmarks.suite import CASES, Comparison, compare, main, regressions, run_suite
+
+
+class TestBenchmarkSuite:
+    """Tests for running, saving and comparing benchmark results."""
+    
+    def test_runs_every_case(self) -> None:
+        """Each case reports a positive time per operation."""
+        results = run_suite("memory", (30,), repeat=1, log=lambda line: None)
+        
+        assert list(results) == [f"memory/{case.name}/30" for case in CASES]
+        assert all(result["us_per_op"] > 0 for result in results.values())
+    
+    def test_regressions_use_threshold(self) -> None:
+        """Only cases slower than baseline * (1 + threshold) regress."""
+        baseline = {"a": {"us_per_op": 1.0}, "b": {"us_per_op": 1.0}}
+        current = {
+            "a": {"us_per_op": 1.1},
+            "b": {"us_per_op": 1.5},
+            "new": {"us_per_op": 9.0},
+        }
+        
+        comparisons = compare(baseline, current)
+        
+        assert [c.key for c in comparisons] == ["a", "b"]
+        assert regressions(comparisons, threshold=0.2) == [Comparison("b", 1.0, 1.5)]
+    
+    def test_main_writes_json_and_fails_on_regression(self, tmp_path: Path) -> None:
+        """--output saves results; a much faster baseline fails the run."""
+        output = tmp_path / "results.json"
+        argv = ["--sizes", "20", "--repeat", "1", "--case", "get_task"]
+        
+        assert main([*argv, "--output", str(output)]) == 0
+        document = json.loads(output.read_text())
+        assert list(document["results"]) == ["memory/get_task/20"]
+        
+        document["results"]["memory/get_task/20"]["us_per_op"] = 1e-9
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(document))
+        assert main([*argv, "--baseline", str(baseline)]) == 1
@@ -0,0 +1,173 @@
+"""Tests for the CachedStorage wrapper."""
+
+from collections.abc import Iterator
+
+from src.models.task import Task
+from src.services.cached_storage import CachedStorage, CacheInfo
+from src.services.task_manager import InMemoryStorage, TaskManager, TaskStats
+
+
+class CountingStorage(InMemoryStorage):
+    """InMemoryStorage that counts get_by_id calls."""
+    
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+    
+    def get_by_id(self, task_id: int) -> Task | None:
+        self.lookups += 1
+        return super().get_by_id(task_id)
+
+
+class BasicStorage:
+    """A backend with only the required TaskStorage methods."""
+    
+    def __init__(self) -> None:
+        self.tasks: dict[int, Task] = {}
+    
+    def save(self, task: Task) -> None:
+        self.tasks[task.id] = task
+    
+    def delete(self, task_id: int) -> bool:
+        return self.tasks.pop(task_id, None) is not None
+    
+    def get_all(self) -> list[Task]:
+        return sorted(self.tasks.values(), key=lambda task: task.id)
+    
+    def get_by_id(self, task_id: int) -> Task | None:
+        return self.tasks.get(task_id)
+    
+    def iter_tasks(self, **kwargs: object) -> Iterator[Task]:
+        return iter(self.get_all())
+
+
+def filled(count: int, capacity: int = 8) -> tuple[CachedStorage, CountingStorage]:
+    """A cache over a counting backend holding tasks 1..count."""
+    backend = CountingStorage()
+    backend.save_many(Task(id=n, title=f"Task {n}") for n in range(1, count + 1))
+    return CachedStorage(backend, capacity=capacity), backend
+
+
+class TestCachedStorage:
+    """Tests for caching, invalidation and counters."""
+    
+    def test_repeated_reads_hit_the_cache(self) -> None:
+        """Only the first read of a task reaches the backend."""
+        storage, backend = filled(3)
+        
+        for _ in range(3):
+            assert storage.get_by_id(2) == Task(id=2, title="Task 2")
+        
+        assert backend.lookups == 1
+        assert storage.cache_info() == CacheInfo(
+            hits=2, misses=1, evictions=0, size=1, capacity=8
+        )
+    
+    def test_missing_tasks_are_not_cached(self) -> None:
+        """A miss for an unknown ID is asked again next time."""
+        storage, backend = filled(1)
+        
+        assert storage.get_by_id(5) is None
+        backend.save(Task(id=5, title="Late"))
+        
+        assert storage.get_by_id(5) == Task(id=5, title="Late")
+    
+    def test_least_recently_used_is_evicted(self) -> None:
+        """Past capacity, the entry read longest ago is dropped."""
+        storage, backend = filled(4, capacity=2)
+        storage.get_by_id(1)
+        storage.get_by_id(2)
+        storage.get_by_id(1)
+        storage.get_by_id(3)  # evicts 2
+        
+        backend.lookups = 0
+        storage.get_by_id(1)
+        storage.get_by_id(2)
+        
+        assert backend.lookups == 1
+        assert storage.cache_info().evictions == 2
+    
+    def test_writes_go_through_and_refresh_the_cache(self) -> None:
+        """save, update_fields and delete keep cache and backend in step."""
+        storage, backend = filled(3)
+        storage.get_by_id(1)
+        storage.get_by_id(2)
+        
+        storage.save(Task(id=1, title="Saved"))
+        storage.update_fields(2, title="Updated", is_complete=True)
+        storage.delete(3)
+        
+        assert storage.get_by_id(1) == backend.get_by_id(1) == Task(id=1, title="Saved")
+        assert storage.get_by_id(2) == backend.get_by_id(2)
+        assert storage.get_by_id(2).is_complete  # type: ignore[union-attr]
+        assert storage.get_by_id(3) is None
+        assert storage.stats() == TaskStats(total=2, completed=1)
+    
+    def test_batch_writes_keep_the_cache_current(self) -> None:
+        """update_many changes cached copies; delete_many drops them."""
+        cache, _ = filled(5)
+        cache.get_by_id(1)
+        cache.get_by_id(2)
+        
+        assert cache.update_many([1, 2, 3], is_complete=True) == [1, 2, 3]
+        assert cache.get_by_id(1).is_complete  # type: ignore[union-attr]
+        assert cache.delete_many([2, 9]) == [2]
+        assert cache.get_by_id(2) is None
+    
+    def test_toggle_updates_cached_copy(self) -> None:
+        """toggle flips the cached copy along with the backend."""
+        cache, backend = filled(2)
+        cache.get_by_id(1)
+        
+        assert cache.toggle(1) is True
+        assert cache.get_by_id(1).is_complete  # type: ignore[union-attr]
+        assert backend.get_by_id(1).is_complete  # type: ignore[union-attr]
+        assert cache.toggle(9) is None
+    
+    def test_basic_backend_batches_per_id(self) -> None:
+        """Backends without batch methods get one call per ID."""
+        backend = BasicStorage()
+        cache = CachedStorage(backend)  # type: ignore[arg-type]
+        cache.save(Task(id=1, title="One"))
+        cache.save(Task(id=2, title="Two"))
+        
+        assert cache.update_many([1, 3], is_complete=True) == [1]
+        assert cache.delete_many([1, 2, 3]) == [1, 2]
+        assert backend.tasks == {}
+    
+    def test_returned_tasks_are_snapshots(self) -> None:
+        """Changing a returned Task does not change the cached copy."""
+        storage, _ = filled(1)
+        storage.get_by_id(1).title = "Changed"  # type: ignore[union-attr]
+        
+        assert storage.get_by_id(1).title == "Task 1"  # type: ignore[union-attr]
+    
+    def test_delegates_optional_methods(self) -> None:
+        """Optional methods come from the backend, or are absent with it."""
+        storage, backend = filled(5)
+        assert storage.max_id() == 5
+        assert storage.count() == 5
+        assert len(storage) == 5
+        
+        basic = CachedStorage(BasicStorage())  # type: ignore[arg-type]
+        assert not hasattr(basic, "stats")
+    
+    def test_basic_backend_updates_by_saving(self) -> None:
+        """Without backend update_fields, a changed Task is saved."""
+        backend = BasicStorage()
+        manager = TaskManager(CachedStorage(backend))  # type: ignore[arg-type]
+        task = manager.add_task("Walk")
+        
+        assert manager.toggle_complete(task.id)
+        assert backend.tasks[task.id].is_complete
+    
+    def test_menu_workflow_reads_backend_once(self) -> None:
+        """Show, toggle and show again costs one backend read."""
+        storage, backend = filled(10)
+        manager = TaskManager(storage)
+        
+        manager.get_task(4)
+        manager.toggle_complete(4)
+        assert manager.get_task(4).is_complete  # type: ignore[union-attr]
+        
+        assert backend.lookups == 1
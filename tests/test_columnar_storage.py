@@ -0,0 +1,98 @@
+"""Tests for the ColumnarStorage backend."""
+
+from src.models.task import Task
+from src.services.columnar_storage import ColumnarStorage
+from src.services.task_manager import TaskStats
+
+
+def ids(storage: ColumnarStorage, **kwargs: object) -> list[int]:
+    """IDs yielded by iter_tasks with the given arguments."""
+    return [task.id for task in storage.iter_tasks(**kwargs)]  # type: ignore[arg-type]
+
+
+class TestColumnarStorage:
+    """Tests for columnar-specific behaviour."""
+    
+    def test_round_trips_unicode_text(self) -> None:
+        """Text is stored as UTF-8 in the arena and decoded on read."""
+        storage = ColumnarStorage()
+        storage.save(
+            Task(id=1, title="Café ☕", description="naïve 📝", is_complete=True)
+        )
+        
+        assert storage.get_by_id(1) == Task(
+            id=1, title="Café ☕", description="naïve 📝", is_complete=True
+        )
+    
+    def test_returned_tasks_are_snapshots(self) -> None:
+        """Changing a returned Task does not change the store."""
+        storage = ColumnarStorage()
+        storage.save(Task(id=1, title="Original"))
+        
+        storage.get_by_id(1).title = "Changed"  # type: ignore[union-attr]
+        
+        assert storage.get_by_id(1).title == "Original"  # type: ignore[union-attr]
+    
+    def test_out_of_order_ids_are_merged_into_order(self) -> None:
+        """IDs saved below the maximum are found and iterated in order."""
+        storage = ColumnarStorage()
+        storage.save_many(Task(id=n, title=f"T{n}") for n in (2, 4, 6))
+        storage.save(Task(id=3, title="T3"))
+        storage.save(Task(id=1, title="T1"))
+        
+        assert storage.get_by_id(3).title == "T3"  # type: ignore[union-attr]
+        assert storage.max_id() == 6
+        assert ids(storage) == [1, 2, 3, 4, 6]
+        assert ids(storage, start_id=4, reverse=True) == [4, 3, 2, 1]
+    
+    def test_delete_then_restore_reuses_row(self) -> None:
+        """Saving a deleted ID brings it back with the new values."""
+        storage = ColumnarStorage()
+        storage.save_many(Task(id=n, title=f"T{n}") for n in range(1, 11))
+        storage.delete(5)
+        
+        storage.save(Task(id=5, title="Back", is_complete=True))
+        
+        assert ids(storage) == list(range(1, 11))
+        assert storage.stats() == TaskStats(total=10, completed=1)
+    
+    def test_compaction_reclaims_dead_rows_and_text(self) -> None:
+        """compact() drops tombstones and rewritten text."""
+        storage = ColumnarStorage()
+        storage.save_many(Task(id=n, title=f"Task {n}") for n in range(1, 101))
+        for n in range(1, 101, 2):
+            storage.delete(n)
+        storage.update_fields(2, title="Renamed task two")
+        before = storage.memory_usage()
+        
+        storage.compact()
+        
+        assert storage.memory_usage() < before
+        assert ids(storage, limit=3) == [2, 4, 6]
+        renamed = storage.get_by_id(2)
+        assert renamed is not None
+        assert renamed.title == "Renamed task two"
+        assert storage.count() == 50
+    
+    def test_iterator_survives_compaction(self) -> None:
+        """An iterator started before a compaction keeps its snapshot."""
+        storage = ColumnarStorage()
+        storage.save_many(Task(id=n, title=f"T{n}") for n in range(1, 6))
+        tasks = storage.iter_tasks()
+        first = next(tasks)
+        
+        storage.delete(2)
+        storage.compact()
+        
+        assert [first.id] + [t.id for t in tasks] == [1, 3, 4, 5]
+    
+    def test_status_filter_uses_bits(self) -> None:
+        """is_complete filtering follows status changes."""
+        storage = ColumnarStorage()
+        storage.save_many(Task(id=n, title=f"T{n}") for n in range(1, 9))
+        for n in (3, 8):
+            storage.update_fields(n, is_complete=True)
+        storage.update_fields(3, is_complete=False)
+        
+        assert ids(storage, is_complete=True) == [8]
+        assert storage.stats() == TaskStats(total=8, completed=1)
@@ -0,0 +1,126 @@
+"""Tests for the scripted CLI subcommands."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.__main__ import main
+
+
+def run(capsys: pytest.CaptureFixture[str], *argv: str) -> tuple[int, list[dict]]:
+    """Run ``todo`` with arguments and parse its JSON-lines output."""
+    code = main(list(argv))
+    out = capsys.readouterr().out
+    return code, [json.loads(line) for line in out.splitlines()]
+
+
+@pytest.fixture(params=["tasks.db", "tasks.tasks"])
+def data(request: pytest.FixtureRequest, tmp_path: Path) -> str:
+    """Path of a fresh SQLite database or memory-mapped task file."""
+    return str(tmp_path / request.param)
+
+
+class TestCommands:
+    """Tests for add/list/done/rm/import."""
+    
+    def test_add_several_titles(
+        self, capsys: pytest.CaptureFixture[str], data: str
+    ) -> None:
+        """Each title becomes a task, printed as one JSON line."""
+        code, tasks = run(capsys, "--data", data, "add", "One", "Two", "-d", "note")
+        assert code == 0
+        assert [(t["id"], t["title"], t["description"]) for t in tasks] == [
+            (1, "One", "note"),
+            (2, "Two", "note"),
+        ]
+    
+    def test_done_and_rm_report_per_id(
+        self, capsys: pytest.CaptureFixture[str], data: str
+    ) -> None:
+        """Missing IDs are reported and make the exit status 1."""
+        run(capsys, "--data", data, "add", "A", "B", "C")
+        
+        code, results = run(capsys, "--data", data, "done", "1", "3", "9")
+        assert code == 1
+        assert results == [
+            {"id": 1, "ok": True},
+            {"id": 3, "ok": True},
+            {"id": 9, "ok": False},
+        ]
+        assert run(capsys, "--data", data, "done", "1")[0] == 0
+        
+        code, results = run(capsys, "--data", data, "rm", "2")
+        assert (code, results) == (0, [{"id": 2, "ok": True}])
+        
+        _, tasks = run(capsys, "--data", data, "list")
+        assert [(t["id"], t["is_complete"]) for t in tasks] == [(1, True), (3, True)]
+    
+    def test_done_and_rm_accept_ranges(
+        self, capsys: pytest.CaptureFixture[str], data: str
+    ) -> None:
+        """ID ranges are expanded and applied as one batch."""
+        run(capsys, "--data", data, "add", "A", "B", "C", "D", "E")
+        
+        code, results = run(capsys, "--data", data, "done", "1-3,5", "4")
+        assert code == 0
+        assert [r["id"] for r in results] == [1, 2, 3, 5, 4]
+        
+        code, results = run(capsys, "--data", data, "rm", "2-4", "7")
+        assert code == 1
+        assert [r["ok"] for r in results] == [True, True, True, False]
+        
+        _, tasks = run(capsys, "--data", data, "list")
+        assert [t["id"] for t in tasks] == [1, 5]
+    
+    def test_list_status_and_limit(
+        self, capsys: pytest.CaptureFixture[str], data: str
+    ) -> None:
+        """list filters by status and stops after --limit tasks."""
+        run(capsys, "--data", data, "add", "A", "B", "C", "D")
+        run(capsys, "--data", data, "done", "2")
+        
+        _, tasks = run(
+            capsys, "--data", data, "list", "--status", "pending", "--limit", "2"
+        )
+        assert [t["id"] for t in tasks] == [1, 3]
+    
+    def test_import_jsonl(
+        self, capsys: pytest.CaptureFixture[str], data: str, tmp_path: Path
+    ) -> None:
+        """import reads a file and reports how many tasks were created."""
+        source = tmp_path / "tasks.jsonl"
+        source.write_text(
+            '{"title": "From file"}\n{"title": "Done", "is_complete": true}\n'
+        )
+        
+        imported = run(capsys, "--data", data, "import", str(source))
+        assert imported == (0, [{"imported": 2}])
+        _, tasks = run(capsys, "--data", data, "list", "--status", "completed")
+        assert [t["title"] for t in tasks] == ["Done"]
+    
+    def test_import_errors_are_reported(
+        self, capsys: pytest.CaptureFixture[str], data: str, tmp_path: Path
+    ) -> None:
+        """Unreadable input prints an error and exits with status 1."""
+        assert main(["--data", data, "import", str(tmp_path / "missing.jsonl")]) == 1
+        assert "todo import: error" in capsys.readouterr().err
+        
+        bad = tmp_path / "bad.jsonl"
+        bad.write_text('{"title": "A"}\n{"title": "B", "is_complete": "false"}\n')
+        assert main(["--data", data, "import", str(bad)]) == 1
+        assert "todo import: error: Line 2" in capsys.readouterr().err
+    
+    def test_requires_data_file(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Scripted commands refuse to run against throwaway in-memory storage."""
+        monkeypatch.delenv("TODO_DATA", raising=False)
+        with pytest.raises(SystemExit) as exc_info:
+            main(["list"])
+        assert exc_info.value.code == 2
+    
+    def test_rejects_invalid_ids(self, data: str) -> None:
+        """IDs must be positive integers."""
+        with pytest.raises(SystemExit):
+            main(["--data", data, "rm", "abc"])
+        with pytest.raises(SystemExit):
+            main(["--data", data, "rm", "5-2"])
@@ -0,0 +1,148 @@
+"""Tests for the ConcurrentStorage backend and thread-safe TaskManager."""
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.models.task import Task
+from src.services.concurrent_storage import ConcurrentStorage
+from src.services.task_manager import TaskManager, TaskStats
+
+THREADS = 8
+TASKS_PER_THREAD = 500
+
+
+def run_in_threads(target, count: int = THREADS) -> None:
+    """Start ``count`` threads on ``target(index)`` together and join them."""
+    barrier = threading.Barrier(count)
+    
+    def worker(index: int) -> None:
+        barrier.wait()
+        target(index)
+    
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestConcurrentStorage:
+    """Tests for sharded storage behaviour."""
+    
+    def test_rejects_zero_shards(self) -> None:
+        """At least one shard is required."""
+        with pytest.raises(ValueError):
+            ConcurrentStorage(shards=0)
+    
+    def test_iteration_merges_shards_in_id_order(self) -> None:
+        """Tasks from different shards come back in one ID-ordered stream."""
+        storage = ConcurrentStorage(shards=3)
+        storage.save_many(Task(id=n, title=f"Task {n}") for n in (5, 1, 4, 2, 3))
+        
+        assert [t.id for t in storage] == [1, 2, 3, 4, 5]
+        assert [t.id for t in storage.iter_tasks(reverse=True, limit=2)] == [5, 4]
+        assert [t.id for t in storage.iter_tasks(start_id=3, limit=2)] == [3, 4]
+    
+    def test_counts_span_shards(self) -> None:
+        """Counts and max_id are combined across shards."""
+        storage = ConcurrentStorage(shards=4)
+        storage.save(Task(id=7, title="Done", is_complete=True))
+        storage.save(Task(id=2, title="Open"))
+        
+        assert storage.stats() == TaskStats(total=2, completed=1)
+        assert storage.max_id() == 7
+        assert len(storage) == 2
+
+
+class TestThreadSafety:
+    """Stress tests running many threads against one manager."""
+    
+    def test_concurrent_adds_get_unique_ids(self) -> None:
+        """Parallel add_task calls never hand out the same ID twice."""
+        manager = TaskManager(ConcurrentStorage())
+        ids: list[list[int]] = [[] for _ in range(THREADS)]
+        
+        def add(index: int) -> None:
+            for n in range(TASKS_PER_THREAD):
+                ids[index].append(manager.add_task(f"T{index}-{n}").id)
+        
+        run_in_threads(add)
+        
+        all_ids = [task_id for chunk in ids for task_id in chunk]
+        expected = THREADS * TASKS_PER_THREAD
+        assert sorted(all_ids) == list(range(1, expected + 1))
+        assert manager.get_task_count() == expected
+    
+    def test_concurrent_toggles_of_one_task(self) -> None:
+        """Toggling the same task from many threads loses no flips."""
+        interval = sys.getswitchinterval()
+        # Switch threads often so that a read-modify-write race would show.
+        sys.setswitchinterval(1e-6)
+        manager = TaskManager(ConcurrentStorage())
+        manager.add_task("Contended")
+        
+        def toggle(index: int) -> None:
+            for _ in range(20_000):
+                manager.toggle_complete(1)
+        
+        try:
+            run_in_threads(toggle, count=4)
+        finally:
+            sys.setswitchinterval(interval)
+        
+        task = manager.get_task(1)
+        assert task is not None and task.is_complete is False
+    
+    def test_concurrent_batches_and_toggles(self) -> None:
+        """Bulk adds and toggles from many threads keep counts consistent."""
+        manager = TaskManager(ConcurrentStorage())
+        
+        def add_batch(index: int) -> None:
+            manager.add_tasks(
+                ({"title": f"T{index}-{n}"} for n in range(TASKS_PER_THREAD)),
+                batch_size=64,
+            )
+        
+        run_in_threads(add_batch)
+        total = THREADS * TASKS_PER_THREAD
+        
+        def toggle_evens(index: int) -> None:
+            for task_id in range(2 + 2 * index, total + 1, 2 * THREADS):
+                manager.toggle_complete(task_id)
+        
+        run_in_threads(toggle_evens)
+        
+        assert manager.get_stats() == TaskStats(total=total, completed=total // 2)
+        assert all(t.is_complete == (t.id % 2 == 0) for t in manager.iter_tasks())
+    
+    def test_search_index_sees_concurrent_writes(self) -> None:
+        """Tasks added while the index is being built are still searchable."""
+        manager = TaskManager(ConcurrentStorage())
+        manager.add_tasks({"title": f"seed {n}"} for n in range(2000))
+        
+        def work(index: int) -> None:
+            if index == 0:
+                manager.search("seed")
+            else:
+                for n in range(100):
+                    manager.add_task(f"fresh {index} {n}")
+        
+        run_in_threads(work)
+        
+        assert len(manager.search("fresh")) == (THREADS - 1) * 100
+    
+    def test_thread_pool_mixed_workload(self) -> None:
+        """Adds, updates and deletes through a pool leave a consistent store."""
+        manager = TaskManager(ConcurrentStorage())
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            tasks = list(pool.map(manager.add_task, (f"T{n}" for n in range(1000))))
+            list(pool.map(lambda t: manager.update_task(t.id, title="Renamed"), tasks))
+            deleted = list(pool.map(manager.delete_task, range(1, 1001, 2)))
+        
+        assert all(deleted)
+        remaining = manager.get_all_tasks()
+        assert [t.id for t in remaining] == list(range(2, 1001, 2))
+        assert {t.title for t in remaining} == {"Renamed"}
@@ -0,0 +1,73 @@
+"""Tests for the History undo/redo log."""
+
+import pytest
+
+from src.services.history import History, Operation, RemoveTasks, SetStatus
+
+
+def inverse(operation: Operation) -> Operation:
+    """Stand-in for TaskManager: flips a status operation."""
+    assert isinstance(operation, SetStatus)
+    return SetStatus(operation.ids, not operation.is_complete)
+
+
+class TestHistory:
+    """Tests for the undo and redo stacks."""
+    
+    def test_undo_then_redo(self) -> None:
+        """Undo moves the inverse to the redo stack and back."""
+        history = History()
+        history.record("toggle task 1", SetStatus((1,), False))
+        applied: list[Operation] = []
+        
+        def apply(operation: Operation) -> Operation:
+            applied.append(operation)
+            return inverse(operation)
+        
+        assert history.undo(apply) == "toggle task 1"
+        assert (history.can_undo, history.can_redo) == (False, True)
+        assert history.redo(apply) == "toggle task 1"
+        assert applied == [SetStatus((1,), False), SetStatus((1,), True)]
+        assert history.undo(apply) == "toggle task 1"
+    
+    def test_empty_stacks_return_none(self) -> None:
+        """Nothing is applied when there is nothing to undo or redo."""
+        history = History()
+        
+        assert history.undo(inverse) is None
+        assert history.redo(inverse) is None
+    
+    def test_depth_drops_oldest_entries(self) -> None:
+        """The undo stack keeps only the latest ``depth`` changes."""
+        history = History(depth=3)
+        for n in range(1, 6):
+            history.record(f"toggle task {n}", SetStatus((n,), False))
+        
+        labels = [history.undo(inverse) for _ in range(4)]
+        
+        assert labels == ["toggle task 5", "toggle task 4", "toggle task 3", None]
+    
+    def test_recording_clears_redo(self) -> None:
+        """A new change after an undo discards the undone branch."""
+        history = History()
+        history.record("toggle task 1", SetStatus((1,), False))
+        history.undo(inverse)
+        
+        history.record("add task 2", RemoveTasks(range(2, 3)))
+        
+        assert not history.can_redo
+    
+    def test_failed_apply_keeps_entry(self) -> None:
+        """If applying raises, the change can still be undone later."""
+        history = History()
+        history.record("add task 1", RemoveTasks(range(1, 2)))
+        
+        with pytest.raises(AssertionError):
+            history.undo(inverse)
+        
+        assert history.can_undo and not history.can_redo
+    
+    def test_rejects_zero_depth(self) -> None:
+        """At least one change must fit."""
+        with pytest.raises(ValueError):
+            History(depth=0)
@@ -0,0 +1,206 @@
+"""Tests for the JournalStorage backend."""
+
+from pathlib import Path
+
+import pytest
+
+from src.models.task import Task
+from src.services.journal_storage import JournalStorage
+from src.services.task_manager import TaskManager, TaskStats
+
+
+class TestJournalStoragePersistence:
+    """Tests for state surviving a close and reopen."""
+    
+    def test_tasks_survive_reopen(self, tmp_path: Path) -> None:
+        """Saved tasks are replayed from the journal."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path) as storage:
+            storage.save(Task(id=1, title="First", description="Desc"))
+            storage.save(Task(id=2, title="Second", is_complete=True))
+        
+        with JournalStorage(path) as storage:
+            tasks = storage.get_all()
+        
+        assert [(t.id, t.title, t.description, t.is_complete) for t in tasks] == [
+            (1, "First", "Desc", False),
+            (2, "Second", "", True),
+        ]
+    
+    def test_updates_and_deletes_are_replayed(self, tmp_path: Path) -> None:
+        """Later records override earlier ones and deletes are applied."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path) as storage:
+            storage.save(Task(id=1, title="Old"))
+            storage.save(Task(id=2, title="Doomed"))
+            storage.save(Task(id=1, title="New"))
+            storage.delete(2)
+        
+        with JournalStorage(path) as storage:
+            assert [t.title for t in storage.get_all()] == ["New"]
+            assert storage.stats() == TaskStats(total=1, completed=0)
+    
+    def test_delete_missing_task_is_not_journaled(self, tmp_path: Path) -> None:
+        """Deleting an unknown ID returns False and writes nothing."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path) as storage:
+            assert storage.delete(42) is False
+        
+        assert path.read_text(encoding="utf-8") == ""
+    
+    def test_torn_final_record_is_discarded(self, tmp_path: Path) -> None:
+        """A half-written last line is dropped and later writes still replay."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path) as storage:
+            storage.save(Task(id=1, title="Kept"))
+        with open(path, "a", encoding="utf-8") as journal:
+            journal.write('["s",2,"Torn')
+        
+        with JournalStorage(path) as storage:
+            assert [t.id for t in storage.get_all()] == [1]
+            storage.save(Task(id=3, title="After crash"))
+        
+        with JournalStorage(path) as storage:
+            assert [t.id for t in storage.get_all()] == [1, 3]
+    
+    def test_manager_continues_id_sequence(self, tmp_path: Path) -> None:
+        """A TaskManager on existing data does not reuse IDs."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path) as storage:
+            manager = TaskManager(storage)
+            manager.add_task("One")
+            manager.add_task("Two")
+        
+        with JournalStorage(path) as storage:
+            task = TaskManager(storage).add_task("Three")
+        
+        assert task.id == 3
+    
+    def test_save_many_is_one_record(self, tmp_path: Path) -> None:
+        """A batch is journaled as a single line and replayed in full."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path) as storage:
+            storage.save_many(Task(id=n, title=f"Task {n}") for n in range(1, 4))
+        
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+        with JournalStorage(path) as storage:
+            assert [t.id for t in storage.get_all()] == [1, 2, 3]
+    
+    def test_update_fields_journals_changed_fields(self, tmp_path: Path) -> None:
+        """Partial updates are journaled compactly and replayed."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path) as storage:
+            storage.save(Task(id=1, title="Task", description="Keep me"))
+            storage.update_fields(1, is_complete=True)
+        
+        last_record = path.read_text(encoding="utf-8").splitlines()[-1]
+        assert last_record == '["u",1,{"is_complete":1}]'
+        with JournalStorage(path) as storage:
+            task = storage.get_by_id(1)
+        assert task is not None
+        assert (task.description, task.is_complete) == ("Keep me", True)
+    
+    def test_toggle_journals_new_status(self, tmp_path: Path) -> None:
+        """A toggle is journaled as the status it produced."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path) as storage:
+            storage.save(Task(id=1, title="Task"))
+            assert storage.toggle(1) is True
+        
+        last_record = path.read_text(encoding="utf-8").splitlines()[-1]
+        assert last_record == '["u",1,{"is_complete":1}]'
+        with JournalStorage(path) as storage:
+            assert storage.get_by_id(1).is_complete  # type: ignore[union-attr]
+    
+    def test_batches_are_one_record_each(self, tmp_path: Path) -> None:
+        """delete_many and update_many journal one line each and replay."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path) as storage:
+            storage.save_many(Task(id=n, title=f"Task {n}") for n in range(1, 6))
+            assert storage.update_many([1, 2, 9], is_complete=True) == [1, 2]
+            assert storage.delete_many([2, 3, 9]) == [2, 3]
+        
+        assert path.read_text(encoding="utf-8").splitlines()[1:] == [
+            '["U",[1,2],{"is_complete":1}]',
+            '["D",[2,3]]',
+        ]
+        with JournalStorage(path) as storage:
+            assert [(t.id, t.is_complete) for t in storage.get_all()] == [
+                (1, True),
+                (4, False),
+                (5, False),
+            ]
+    
+    def test_delete_while_iterating(self, tmp_path: Path) -> None:
+        """Deleting tasks as they are read leaves none behind."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path) as storage:
+            storage.save_many(Task(id=n, title=f"Task {n}") for n in range(1, 21))
+            for task in storage.iter_tasks():
+                storage.delete(task.id)
+            assert storage.count() == 0
+        
+        with JournalStorage(path) as storage:
+            assert storage.count() == 0
+
+
+class TestJournalStorageCompaction:
+    """Tests for snapshotting and journal truncation."""
+    
+    def test_compaction_truncates_journal(self, tmp_path: Path) -> None:
+        """Reaching snapshot_every writes a snapshot and empties the journal."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path, snapshot_every=4) as storage:
+            for task_id in range(1, 5):
+                storage.save(Task(id=task_id, title=f"Task {task_id}"))
+            storage.save(Task(id=5, title="Task 5"))
+        
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+        assert (tmp_path / "tasks.journal.snapshot").exists()
+        
+        with JournalStorage(path) as storage:
+            assert [t.id for t in storage.get_all()] == [1, 2, 3, 4, 5]
+    
+    def test_long_journal_is_compacted_on_open(self, tmp_path: Path) -> None:
+        """Opening a journal longer than snapshot_every compacts it."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path) as storage:
+            for task_id in range(1, 11):
+                storage.save(Task(id=task_id, title=f"Task {task_id}"))
+        
+        with JournalStorage(path, snapshot_every=5) as storage:
+            assert storage.count() == 10
+        
+        assert path.read_text(encoding="utf-8") == ""
+    
+    def test_replaying_old_journal_over_new_snapshot(self, tmp_path: Path) -> None:
+        """A crash after the snapshot but before truncation loses nothing."""
+        path = tmp_path / "tasks.journal"
+        with JournalStorage(path) as storage:
+            storage.save_many(Task(id=n, title=f"Task {n}") for n in range(1, 5))
+            storage.update_fields(1, description="first")
+            storage.toggle(2)
+            storage.delete(3)
+            storage.update_fields(1, description="second")
+            storage.toggle(2)
+            storage.toggle(4)
+            storage.flush()
+            old_journal = path.read_text(encoding="utf-8")
+            storage.compact()
+            expected = [
+                (t.id, t.description, t.is_complete) for t in storage.get_all()
+            ]
+        path.write_text(old_journal, encoding="utf-8")
+        
+        with JournalStorage(path) as storage:
+            replayed = [(t.id, t.description, t.is_complete) for t in storage.get_all()]
+        
+        assert expected == [(1, "second", False), (2, "", False), (4, "", True)]
+        assert replayed == expected
+    
+    def test_invalid_settings_raise(self, tmp_path: Path) -> None:
+        """Non-positive batch sizes are rejected."""
+        with pytest.raises(ValueError):
+            JournalStorage(tmp_path / "a.journal", sync_every=0)
+        with pytest.raises(ValueError):
+            JournalStorage(tmp_path / "b.journal", snapshot_every=0)
@@ -0,0 +1,178 @@
+"""Tests for the interactive TodoMenu."""
+
+from collections.abc import Callable
+
+import pytest
+
+from src.cli import menu as menu_module
+from src.cli.menu import TodoMenu
+from src.services.task_manager import TaskManager
+
+
+@pytest.fixture
+def feed_input(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """Replace input() with a scripted sequence and silence screen clears."""
+    monkeypatch.setattr(menu_module, "clear_screen", lambda: None)
+    
+    def feed(*answers: str) -> None:
+        replies = iter(answers)
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(replies))
+    
+    return feed
+
+
+class TestTaskPager:
+    """Tests for the paginated task view."""
+    
+    def _menu(self, tasks: int) -> TodoMenu:
+        manager = TaskManager()
+        manager.add_tasks({"title": f"Task {n}"} for n in range(1, tasks + 1))
+        menu = TodoMenu(manager)
+        menu.PAGE_SIZE = 3
+        return menu
+    
+    def test_pages_forward_and_back(
+        self, feed_input: Callable[..., None], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """n/p move between pages and Enter on the last page leaves."""
+        menu = self._menu(tasks=7)
+        feed_input("n", "p", "n", "n", "")
+        
+        menu._view_tasks()
+        
+        output = capsys.readouterr().out
+        assert output.count("Showing IDs 1–3") == 2
+        assert output.count("Showing IDs 4–6") == 2
+        assert "Showing IDs 7–7" in output
+    
+    def test_jump_to_id(
+        self, feed_input: Callable[..., None], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """j jumps to the page starting at the requested ID."""
+        menu = self._menu(tasks=10)
+        feed_input("j", "5", "q")
+        
+        menu._view_tasks()
+        
+        assert "Showing IDs 5–7" in capsys.readouterr().out
+    
+    def test_jump_past_end_keeps_page(
+        self, feed_input: Callable[..., None], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Jumping beyond the last ID keeps the current page with a notice."""
+        menu = self._menu(tasks=2)
+        feed_input("j", "50", "q")
+        
+        menu._view_tasks()
+        
+        output = capsys.readouterr().out
+        assert "No tasks at or after ID 50" in output
+        assert output.count("Showing IDs 1–2") == 2
+
+
+class TestBatchActions:
+    """Tests for deleting and toggling ID ranges from the menu."""
+    
+    def _menu(self) -> TodoMenu:
+        manager = TaskManager()
+        manager.add_tasks({"title": f"Task {n}"} for n in range(1, 6))
+        return TodoMenu(manager)
+    
+    def test_delete_range_confirms_once(
+        self, feed_input: Callable[..., None], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A range is deleted after one confirmation and missing IDs listed."""
+        menu = self._menu()
+        feed_input("2-3,9", "y", "")
+        
+        menu._delete_task()
+        
+        output = capsys.readouterr().out
+        assert "2 task(s) deleted" in output
+        assert "Not found: 9" in output
+        assert [t.id for t in menu.manager.get_all_tasks()] == [1, 4, 5]
+    
+    def test_toggle_range_marks_incomplete(
+        self, feed_input: Callable[..., None], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Answering i marks the whole range incomplete; n is not an answer."""
+        menu = self._menu()
+        menu.manager.toggle_tasks("1-5")
+        feed_input("x-1", "1-4", "n", "i", "")
+        
+        menu._toggle_complete()
+        
+        output = capsys.readouterr().out
+        assert "Invalid task ID or range" in output
+        assert "Invalid input" in output
+        assert "4 task(s) marked incomplete" in output
+        assert menu.manager.get_completed_count() == 1
+    
+    def test_toggle_range_can_be_cancelled(
+        self, feed_input: Callable[..., None], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Pressing Enter at the status question changes nothing."""
+        menu = self._menu()
+        feed_input("1-3", "", "")
+        
+        menu._toggle_complete()
+        
+        assert "No tasks changed" in capsys.readouterr().out
+        assert menu.manager.get_completed_count() == 0
+
+
+class TestUndoRedo:
+    """Tests for the Undo and Redo menu options."""
+    
+    def test_undo_and_redo_delete(
+        self, feed_input: Callable[..., None], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """u reverts the latest change and r re-applies it."""
+        menu = TodoMenu(TaskManager())
+        menu.manager.add_tasks({"title": f"Task {n}"} for n in range(1, 4))
+        menu.manager.delete_tasks("1-2")
+        feed_input("u", "", "r", "", "r", "")
+        
+        menu._show_main_menu()
+        assert menu.manager.get_task_count() == 3
+        menu._show_main_menu()
+        menu._show_main_menu()
+        
+        output = capsys.readouterr().out
+        assert "Undone: delete 2 tasks" in output
+        assert "Redone: delete 2 tasks" in output
+        assert "Nothing to redo" in output
+        assert menu.manager.get_task_count() == 1
+
+
+class TestDiagnostics:
+    """Tests for the hidden Diagnostics screen."""
+    
+    def test_offers_to_enable_metrics(
+        self, feed_input: Callable[..., None], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """With metrics off, the screen can switch them on."""
+        menu = TodoMenu(TaskManager())
+        feed_input("y", "")
+        
+        menu._show_diagnostics()
+        
+        assert "Metrics are off" in capsys.readouterr().out
+        assert menu.manager.metrics_enabled
+    
+    def test_lists_operations(
+        self, feed_input: Callable[..., None], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Entering d on the main menu shows each operation's calls."""
+        manager = TaskManager()
+        manager.enable_metrics()
+        manager.add_task("A")
+        menu = TodoMenu(manager)
+        feed_input("d", "")
+        
+        menu._show_main_menu()
+        
+        output = capsys.readouterr().out
+        assert "DIAGNOSTICS" in output
+        assert "manager.add_task" in output
+        assert "storage.save" in output
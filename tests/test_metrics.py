@@ -0,0 +1,132 @@
+"""Tests for opt-in metrics on TaskManager and storage calls."""
+
+from src.services.metrics import InstrumentedStorage, LatencyHistogram, Metrics
+from src.services.task_manager import InMemoryStorage, TaskManager
+
+
+class TestLatencyHistogram:
+    """Tests for bucketed latency recording."""
+    
+    def test_summary_in_microseconds(self) -> None:
+        """Means come from the timed calls; totals cover every call."""
+        histogram = LatencyHistogram()
+        for elapsed_ns in (1_000, 3_000, 8_000):
+            histogram.record(elapsed_ns)
+        histogram.calls = 6
+        
+        summary = histogram.summary()
+        
+        assert (summary.calls, summary.mean_us, summary.max_us) == (6, 4.0, 8.0)
+        assert summary.total_us == 24.0
+    
+    def test_percentiles_bound_true_value(self) -> None:
+        """Percentiles are bucket upper bounds: at most 2x the real value."""
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.record(1_000)
+        histogram.record(1_000_000)
+        
+        assert 1_000 <= histogram.percentile(0.50) < 2_000
+        assert 1_000 <= histogram.percentile(0.99) < 2_000
+        assert histogram.percentile(1.0) == 1_000_000
+        assert LatencyHistogram().percentile(0.5) == 0
+
+
+class TestMetrics:
+    """Tests for the registry and wrappers."""
+    
+    def test_timed_records_calls_and_errors(self) -> None:
+        """Calls are recorded even when the wrapped function raises."""
+        metrics = Metrics()
+        
+        def fail() -> None:
+            raise ValueError("boom")
+        
+        double = metrics.timed("double", lambda x: 2 * x)
+        failing = metrics.timed("fail", fail)
+        assert double(4) == 8
+        try:
+            failing()
+        except ValueError:
+            pass
+        
+        snapshot = metrics.snapshot()
+        assert list(snapshot) == ["double", "fail"]
+        assert snapshot["double"].calls == snapshot["fail"].calls == 1
+    
+    def test_counts_every_call_and_times_a_sample(self) -> None:
+        """With sample_every=4, calls 1, 5, 9, ... are timed."""
+        metrics = Metrics(sample_every=4)
+        noop = metrics.timed("noop", lambda: None)
+        for _ in range(9):
+            noop()
+        
+        histogram = metrics.histogram("noop")
+        
+        assert (histogram.calls, histogram.samples) == (9, 3)
+    
+    def test_reset_keeps_wrappers(self) -> None:
+        """reset() zeroes counts; later calls are still recorded."""
+        metrics = Metrics()
+        noop = metrics.timed("noop", lambda: None)
+        noop()
+        metrics.reset()
+        assert metrics.snapshot() == {}
+        
+        noop()
+        
+        assert metrics.snapshot()["noop"].calls == 1
+    
+    def test_instrumented_storage_keeps_optional_methods_optional(self) -> None:
+        """Methods the backend lacks stay missing on the wrapper."""
+        class Basic:
+            def get_by_id(self, task_id: int) -> None:
+                return None
+        
+        storage = InstrumentedStorage(Basic(), Metrics())
+        
+        assert storage.get_by_id(1) is None
+        assert getattr(storage, "stats", None) is None
+
+
+class TestTaskManagerMetrics:
+    """Tests for enabling metrics on a TaskManager."""
+    
+    def test_disabled_by_default(self) -> None:
+        """No wrappers are installed and the snapshot is empty."""
+        manager = TaskManager()
+        manager.add_task("A")
+        
+        assert not manager.metrics_enabled
+        assert manager.metrics() == {}
+        assert "add_task" not in vars(manager)
+    
+    def test_counts_manager_and_storage_calls(self) -> None:
+        """Each manager method and the storage calls it makes are counted."""
+        manager = TaskManager()
+        manager.enable_metrics()
+        manager.add_task("A")
+        manager.get_task(1)
+        manager.toggle_complete(1)
+        
+        snapshot = manager.metrics()
+        
+        assert snapshot["manager.get_task"].calls == 1
+        assert snapshot["manager.toggle_complete"].calls == 1
+        assert snapshot["storage.get_by_id"].calls == 1
+        assert snapshot["storage.toggle"].calls == 1
+        assert snapshot["storage.save"].calls == 1
+    
+    def test_disable_restores_plain_calls(self) -> None:
+        """disable_metrics() removes every wrapper."""
+        storage = InMemoryStorage()
+        manager = TaskManager(storage)
+        manager.enable_metrics()
+        manager.enable_metrics()  # idempotent
+        
+        manager.disable_metrics()
+        
+        assert manager._storage is storage
+        assert vars(manager).keys().isdisjoint({"get_task", "add_task"})
+        assert manager.add_task("A").id == 1
+        assert manager.metrics() == {}
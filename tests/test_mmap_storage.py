@@ -0,0 +1,120 @@
+"""Tests for the MmapStorage backend."""
+
+from pathlib import Path
+
+import pytest
+
+from src.models.task import Task
+from src.services.mmap_storage import MmapStorage, write_task_file
+from src.services.task_manager import TaskStats
+
+
+def ids(storage: MmapStorage, **kwargs: object) -> list[int]:
+    """IDs yielded by iter_tasks with the given arguments."""
+    return [task.id for task in storage.iter_tasks(**kwargs)]  # type: ignore[arg-type]
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    """A task file holding tasks 1-10, with even IDs complete."""
+    path = tmp_path / "tasks.tasks"
+    write_task_file(
+        path,
+        (
+            Task(id=n, title=f"Task {n}", description="d" * n, is_complete=n % 2 == 0)
+            for n in range(1, 11)
+        ),
+    )
+    return path
+
+
+class TestMmapStorage:
+    """Tests for memory-mapped file behaviour."""
+    
+    def test_reads_written_file(self, path: Path) -> None:
+        """Tasks in the file are found by ID and counted from the header."""
+        with MmapStorage(path) as storage:
+            assert storage.get_by_id(7) == Task(
+                id=7, title="Task 7", description="ddddddd", is_complete=False
+            )
+            assert storage.get_by_id(11) is None
+            assert storage.stats() == TaskStats(total=10, completed=5)
+            assert storage.max_id() == 10
+    
+    def test_creates_missing_file(self, tmp_path: Path) -> None:
+        """Opening a missing path creates an empty task file."""
+        with MmapStorage(tmp_path / "new.tasks") as storage:
+            assert storage.count() == 0
+            assert storage.max_id() == 0
+            assert list(storage) == []
+    
+    def test_rejects_other_files(self, tmp_path: Path) -> None:
+        """A file without the task file header raises ValueError."""
+        path = tmp_path / "notes.tasks"
+        path.write_text("not a task file, but long enough to have a header")
+        
+        with pytest.raises(ValueError):
+            MmapStorage(path)
+    
+    def test_round_trips_unicode_text(self, tmp_path: Path) -> None:
+        """Text is stored as UTF-8 and decoded from the map."""
+        path = tmp_path / "unicode.tasks"
+        task = Task(id=1, title="Café ☕", description="naïve 📝", is_complete=True)
+        with MmapStorage(path) as storage:
+            storage.save(task)
+        
+        with MmapStorage(path) as storage:
+            assert storage.get_by_id(1) == task
+    
+    def test_overlay_merges_with_file(self, path: Path) -> None:
+        """Writes are visible in order before they reach the file."""
+        with MmapStorage(path) as storage:
+            storage.delete(3)
+            storage.save(Task(id=12, title="New"))
+            storage.update_fields(4, title="Renamed", is_complete=False)
+            
+            assert ids(storage) == [1, 2, 4, 5, 6, 7, 8, 9, 10, 12]
+            assert ids(storage, start_id=5, reverse=True) == [5, 4, 2, 1]
+            assert ids(storage, is_complete=True) == [2, 6, 8, 10]
+            assert storage.get_by_id(4).title == "Renamed"  # type: ignore[union-attr]
+            assert storage.stats() == TaskStats(total=10, completed=4)
+            assert storage.max_id() == 12
+    
+    def test_close_writes_changes(self, path: Path) -> None:
+        """Changes survive closing and reopening the file."""
+        with MmapStorage(path) as storage:
+            storage.delete(10)
+            storage.update_fields(1, is_complete=True)
+        
+        with MmapStorage(path) as storage:
+            assert storage.max_id() == 9
+            assert storage.stats() == TaskStats(total=9, completed=5)
+            assert storage.get_by_id(1).is_complete  # type: ignore[union-attr]
+    
+    def test_returned_tasks_are_snapshots(self, path: Path) -> None:
+        """Changing a returned Task does not change the store."""
+        with MmapStorage(path) as storage:
+            storage.save(Task(id=20, title="Original"))
+            
+            storage.get_by_id(20).title = "Changed"  # type: ignore[union-attr]
+            
+            assert storage.get_by_id(20).title == "Original"  # type: ignore[union-attr]
+    
+    def test_iterator_survives_compaction(self, path: Path) -> None:
+        """An iterator started before a compaction keeps its snapshot."""
+        with MmapStorage(path) as storage:
+            tasks = storage.iter_tasks(limit=5)
+            first = next(tasks)
+            
+            storage.delete(2)
+            storage.compact()
+            
+            assert [first.id] + [t.id for t in tasks] == [1, 2, 3, 4, 5]
+            assert ids(storage, limit=3) == [1, 3, 4]
+    
+    def test_write_rejects_unordered_ids(self, tmp_path: Path) -> None:
+        """write_task_file needs ascending IDs for the index."""
+        with pytest.raises(ValueError):
+            write_task_file(
+                tmp_path / "bad.tasks", [Task(id=2, title="B"), Task(id=1, title="A")]
+            )
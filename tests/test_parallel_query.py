@@ -0,0 +1,77 @@
+"""Tests for ParallelQuery over memory-mapped task files."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.models.task import Task
+from src.services.mmap_storage import MmapStorage, write_task_file
+from src.services.parallel_query import ParallelQuery
+from src.services.task_manager import TaskStats
+
+WORDS = ("alpha", "beta", "gamma")
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> Iterator[MmapStorage]:
+    """A task file of 100 tasks cycling through three description words."""
+    path = tmp_path / "tasks.tasks"
+    write_task_file(
+        path,
+        (
+            Task(
+                id=n,
+                title=f"Task {n}",
+                description=f"{WORDS[n % 3].upper()} note",
+                is_complete=n % 2 == 0,
+            )
+            for n in range(1, 101)
+        ),
+    )
+    with MmapStorage(path) as storage:
+        yield storage
+
+
+class TestParallelQuery:
+    """Tests for chunked scans and their reduction."""
+    
+    def test_id_ranges_cover_file(self, storage: MmapStorage) -> None:
+        """Ranges are contiguous, ordered and about equal in size."""
+        assert storage.id_ranges(4) == [(1, 25), (26, 50), (51, 75), (76, 100)]
+        assert len(storage.id_ranges(500)) == 100
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_count_and_ids_containing(self, storage: MmapStorage, workers: int) -> None:
+        """Substring matches ignore case and come back in ID order."""
+        with ParallelQuery(storage, workers=workers) as query:
+            assert query.count_containing("beta") == 34
+            assert query.count_containing("beta", is_complete=True) == 17
+            assert query.count_containing("task 10", field="title") == 2
+            assert query.ids_containing("gamma")[:3] == [2, 5, 8]
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_keyword_stats(self, storage: MmapStorage, workers: int) -> None:
+        """Per-keyword totals and completed counts are summed over chunks."""
+        with ParallelQuery(storage, workers=workers) as query:
+            stats = query.keyword_stats(["Alpha", "gamma", "missing"])
+        
+        assert stats == {
+            "alpha": TaskStats(total=33, completed=16),
+            "gamma": TaskStats(total=33, completed=17),
+            "missing": TaskStats(total=0, completed=0),
+        }
+    
+    def test_pending_changes_are_compacted_first(self, storage: MmapStorage) -> None:
+        """Workers see changes made through the storage before the query."""
+        storage.save(Task(id=101, title="Extra", description="beta"))
+        storage.delete(1)
+        
+        with ParallelQuery(storage, workers=2) as query:
+            assert query.count_containing("beta") == 34
+            assert query.ids_containing("beta")[-1] == 101
+    
+    def test_rejects_unknown_field(self, storage: MmapStorage) -> None:
+        """Only title and description can be searched."""
+        with pytest.raises(ValueError):
+            ParallelQuery(storage, workers=1).count_containing("x", field="id")
@@ -0,0 +1,70 @@
+"""Tests for the --profile and --trace-alloc session options."""
+
+import io
+import pstats
+import time
+from pathlib import Path
+
+import pytest
+
+from src.__main__ import main
+from src.cli.profiling import trace_allocations
+from src.services.task_manager import TaskManager
+
+
+class TestProfiling:
+    """Tests for profiling and allocation tracing around a session."""
+    
+    def test_profile_saves_stats_and_prints_hot_functions(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """--profile writes a loadable stats file and reports to stderr."""
+        stats_path = tmp_path / "session.prof"
+        data = str(tmp_path / "tasks.db")
+        
+        code = main(
+            ["--data", data, "--profile", "--profile-file", str(stats_path), "add", "A"]
+        )
+        
+        assert code == 0
+        captured = capsys.readouterr()
+        assert '"title":"A"' in captured.out
+        assert str(stats_path) in captured.err
+        assert pstats.Stats(str(stats_path)).total_calls > 0
+    
+    def test_trace_alloc_reports_sites(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """--trace-alloc prints the allocation report after the command."""
+        data = str(tmp_path / "tasks.db")
+        
+        assert main(["--data", data, "--trace-alloc", "list"]) == 0
+        
+        assert "allocation sites" in capsys.readouterr().err
+    
+    def test_trace_allocations_finds_task_lists(self) -> None:
+        """A list kept alive by the session shows up with its call site."""
+        manager = TaskManager()
+        manager.add_tasks({"title": f"Task {n}"} for n in range(2000))
+        out = io.StringIO()
+        
+        tasks = trace_allocations(manager.get_all_tasks, top=3, out=out)
+        
+        assert len(tasks) == 2000
+        assert "task_manager.py" in out.getvalue()
+    
+    def test_trace_allocations_catches_freed_temporaries(self) -> None:
+        """A task list dropped before the session ends is still reported."""
+        manager = TaskManager()
+        manager.add_tasks({"title": f"Task {n}"} for n in range(20_000))
+        out = io.StringIO()
+        
+        def session() -> int:
+            tasks = manager.get_all_tasks()
+            time.sleep(0.2)
+            return len(tasks)
+        
+        assert trace_allocations(session, top=3, out=out, interval=0.01) == 20_000
+        
+        assert "task_manager.py" in out.getvalue()
+        assert "largest sample" in out.getvalue()
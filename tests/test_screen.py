@@ -0,0 +1,107 @@
+"""Tests for the buffered ANSI Screen renderer."""
+
+import io
+import os
+
+import pytest
+
+from src.cli.screen import CLEAR_SCREEN, HOME, Screen, display_width, move_to
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts write calls."""
+    
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+    
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+@pytest.fixture
+def stream(monkeypatch: pytest.MonkeyPatch) -> CountingStream:
+    """An 80x24 'terminal' output stream."""
+    monkeypatch.setattr(
+        "shutil.get_terminal_size", lambda fallback=None: os.terminal_size((80, 24))
+    )
+    return CountingStream()
+
+
+def frame(screen: Screen, stream: CountingStream, *lines: str) -> str:
+    """Draw a frame and return exactly what was written for it."""
+    stream.seek(0)
+    stream.truncate()
+    screen.clear()
+    for line in lines:
+        screen.write(line + "\n")
+    screen.flush()
+    return stream.getvalue()
+
+
+class TestScreen:
+    """Tests for frame rendering."""
+    
+    def test_first_frame_clears_and_writes_once(self, stream: CountingStream) -> None:
+        """A frame goes out in one write, starting with a full clear."""
+        screen = Screen(stream, ansi=True)
+        
+        output = frame(screen, stream, "Header", "Line 1", "Line 2")
+        
+        assert output == HOME + CLEAR_SCREEN + "Header\nLine 1\nLine 2\n"
+        assert stream.writes == 1
+    
+    def test_redraws_only_changed_lines(self, stream: CountingStream) -> None:
+        """Unchanged lines are not rewritten in the next frame."""
+        screen = Screen(stream, ansi=True)
+        frame(screen, stream, "Header", "Tasks: 1", "Menu")
+        
+        output = frame(screen, stream, "Header", "Tasks: 2", "Menu")
+        
+        assert CLEAR_SCREEN not in output
+        assert "Header" not in output and "Menu" not in output
+        assert move_to(2) + "Tasks: 2" in output
+    
+    def test_shorter_frame_clears_leftover_lines(self, stream: CountingStream) -> None:
+        """Lines below a shorter frame are erased."""
+        screen = Screen(stream, ansi=True)
+        frame(screen, stream, "A", "B", "C")
+        
+        output = frame(screen, stream, "A")
+        
+        assert output.startswith(move_to(3) + "\x1b[J")
+    
+    def test_typed_input_is_tracked(
+        self, stream: CountingStream, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The line holding a prompt and its answer is redrawn next frame."""
+        screen = Screen(stream, ansi=True)
+        monkeypatch.setattr("builtins.input", lambda prompt="": "2")
+        screen.clear()
+        screen.write("Menu\n")
+        assert screen.input("\nChoice: ") == "2"
+        
+        output = frame(screen, stream, "Menu", "", "")
+        
+        assert CLEAR_SCREEN not in output
+        assert move_to(3) + "\x1b[K" in output
+    
+    def test_wrapping_lines_force_full_redraw(self, stream: CountingStream) -> None:
+        """Lines wider than the terminal make the diff unreliable."""
+        screen = Screen(stream, ansi=True)
+        frame(screen, stream, "x" * 100)
+        
+        assert frame(screen, stream, "short").startswith(HOME + CLEAR_SCREEN)
+    
+    def test_plain_output_without_terminal(self, stream: CountingStream) -> None:
+        """Without ANSI support the text is written unchanged."""
+        screen = Screen(stream, ansi=False)
+        
+        assert frame(screen, stream, "One", "Two") == "One\nTwo\n"
+    
+    def test_display_width_counts_wide_characters(self) -> None:
+        """Emoji take two cells and variation selectors none."""
+        assert display_width("abc") == 3
+        assert display_width("📝 A") == 4
+        assert display_width("ℹ️") == 1
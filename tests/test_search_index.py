@@ -0,0 +1,73 @@
+"""Tests for the inverted search index."""
+
+from src.models.task import Task
+from src.services.search_index import SearchIndex, tokenize
+
+
+class TestTokenize:
+    """Tests for text tokenization."""
+    
+    def test_tokens_are_casefolded_words(self) -> None:
+        """Punctuation splits words and case is ignored."""
+        assert tokenize("Buy MILK, eggs & bread!") == {"buy", "milk", "eggs", "bread"}
+
+
+class TestSearchIndex:
+    """Tests for incremental indexing and prefix queries."""
+    
+    def _index(self) -> SearchIndex:
+        return SearchIndex(
+            [
+                Task(id=1, title="Buy groceries", description="milk and eggs"),
+                Task(id=2, title="Grow tomatoes"),
+                Task(id=3, title="Call the bank", description="about milk money"),
+            ]
+        )
+    
+    def test_prefix_match(self) -> None:
+        """A query word matches every token it prefixes."""
+        assert self._index().search("gro") == [1, 2]
+    
+    def test_words_are_anded(self) -> None:
+        """All query words must match."""
+        assert self._index().search("milk bank") == [3]
+    
+    def test_description_is_indexed(self) -> None:
+        """Description text is searchable."""
+        assert self._index().search("eggs") == [1]
+    
+    def test_blank_query_matches_nothing(self) -> None:
+        """A query without words returns no results."""
+        assert self._index().search("  ?! ") == []
+    
+    def test_remove(self) -> None:
+        """Removed tasks no longer match and unused tokens disappear."""
+        index = self._index()
+        
+        index.remove(Task(id=2, title="Grow tomatoes"))
+        
+        assert index.search("gro") == [1]
+        assert index.search("tomatoes") == []
+    
+    def test_replace_only_changes_differing_tokens(self) -> None:
+        """Replacing a task re-indexes its new text."""
+        index = self._index()
+        old = Task(id=1, title="Buy groceries", description="milk and eggs")
+        
+        index.replace(old, Task(id=1, title="Buy flowers", description="milk"))
+        
+        assert index.search("groceries") == []
+        assert index.search("flow") == [1]
+        assert index.search("milk") == [1, 3]
+    
+    def test_many_new_tokens_added_incrementally(self) -> None:
+        """Tokens stay searchable across vocabulary merges."""
+        index = SearchIndex()
+        for task_id in range(1, 3001):
+            index.add(Task(id=task_id, title=f"item{task_id:05d}"))
+        
+        index.remove(Task(id=1500, title="item01500"))
+        
+        assert index.search("item0299") == [2990 + n for n in range(10)]
+        assert index.search("item01500") == []
+        assert len(index) == 2999
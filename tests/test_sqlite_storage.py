@@ -0,0 +1,85 @@
+"""Tests for the SQLiteStorage backend."""
+
+from pathlib import Path
+
+from src.models.task import Task
+from src.services.sqlite_storage import SQLiteStorage
+from src.services.task_manager import TaskManager, TaskStats
+
+
+class TestSQLiteStorage:
+    """Tests for SQLite-specific behaviour."""
+    
+    def test_tasks_survive_reopen(self, tmp_path: Path) -> None:
+        """Tasks written to a database file are there after reopening."""
+        path = tmp_path / "tasks.db"
+        with SQLiteStorage(path) as storage:
+            storage.save(Task(id=1, title="Persisted", description="Desc"))
+            storage.save(Task(id=2, title="Done", is_complete=True))
+        
+        with SQLiteStorage(path) as storage:
+            tasks = storage.get_all()
+        
+        assert [(t.id, t.title, t.description, t.is_complete) for t in tasks] == [
+            (1, "Persisted", "Desc", False),
+            (2, "Done", "", True),
+        ]
+    
+    def test_file_database_uses_wal(self, tmp_path: Path) -> None:
+        """File databases are opened in WAL journal mode."""
+        with SQLiteStorage(tmp_path / "tasks.db") as storage:
+            mode = storage._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        
+        assert mode == "wal"
+    
+    def test_save_existing_id_replaces_row(self) -> None:
+        """Saving an existing ID updates the row in place."""
+        with SQLiteStorage() as storage:
+            storage.save(Task(id=1, title="Old"))
+            storage.save(Task(id=1, title="New", is_complete=True))
+            
+            assert [t.title for t in storage.get_all()] == ["New"]
+            assert storage.stats() == TaskStats(total=1, completed=1)
+    
+    def test_update_fields_writes_changed_columns(self) -> None:
+        """update_fields changes only the given columns."""
+        with SQLiteStorage() as storage:
+            storage.save(Task(id=1, title="Task", description="Keep me"))
+            
+            assert storage.update_fields(1, title=" Renamed ") is True
+            assert storage.update_fields(2, title="Missing") is False
+            task = storage.get_by_id(1)
+        
+        assert task is not None
+        assert (task.title, task.description) == ("Renamed", "Keep me")
+    
+    def test_toggle_flips_in_one_statement(self, tmp_path: Path) -> None:
+        """toggle returns the new status, and the change is committed."""
+        path = tmp_path / "tasks.db"
+        with SQLiteStorage(path) as storage:
+            storage.save(Task(id=1, title="Task"))
+            assert storage.toggle(1) is True
+            assert storage.toggle(2) is None
+        
+        with SQLiteStorage(path) as storage:
+            assert storage.get_by_id(1).is_complete  # type: ignore[union-attr]
+    
+    def test_completed_count_uses_index(self) -> None:
+        """The completed-count query is answered from the status index."""
+        with SQLiteStorage() as storage:
+            plan = storage._conn.execute(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM tasks WHERE is_complete = 1"
+            ).fetchall()
+        
+        assert any("idx_tasks_is_complete" in row[-1] for row in plan)
+    
+    def test_manager_continues_id_sequence(self, tmp_path: Path) -> None:
+        """A TaskManager on an existing database does not reuse IDs."""
+        path = tmp_path / "tasks.db"
+        with SQLiteStorage(path) as storage:
+            TaskManager(storage).add_task("One")
+        
+        with SQLiteStorage(path) as storage:
+            task = TaskManager(storage).add_task("Two")
+        
+        assert task.id == 2
@@ -0,0 +1,10 @@
+"""Tests for keeping the entry point's imports lazy."""
+
+import os
+
+from benchmarks.bench_startup import eagerly_imported
+
+
+def test_entry_point_defers_heavy_imports() -> None:
+    """Importing src.__main__ loads none of the per-command modules."""
+    assert eagerly_imported(dict(os.environ)) == []
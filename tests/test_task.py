@@ -100,3 +100,59 @@ class TestTaskDisplayString:
         
         assert result == "○ [1] Test"
         assert "Hidden" not in result
+
+
+class TestTaskCleanChanges:
+    """Tests for validating partial updates."""
+    
+    def test_only_given_fields_are_returned(self) -> None:
+        """Changes are normalized field by field."""
+        changes = Task.clean_changes({"title": "  New  ", "is_complete": 1})
+        
+        assert changes == {"title": "New", "is_complete": True}
+    
+    def test_empty_title_raises_error(self) -> None:
+        """An empty new title is rejected."""
+        with pytest.raises(ValueError, match="title cannot be empty"):
+            Task.clean_changes({"title": "  "})
+    
+    def test_unknown_or_id_field_raises_error(self) -> None:
+        """Only title, description and is_complete can change."""
+        with pytest.raises(ValueError, match="id"):
+            Task.clean_changes({"id": 5})
+
+
+class TestTaskValueSemantics:
+    """Tests for the dataclass-compatible behaviour of Task."""
+    
+    def test_equality_compares_fields(self) -> None:
+        """Tasks with the same field values are equal."""
+        assert Task(id=1, title="A") == Task(id=1, title=" A ")
+        assert Task(id=1, title="A") != Task(id=1, title="A", is_complete=True)
+    
+    def test_repr_lists_fields(self) -> None:
+        """repr shows every field like a dataclass would."""
+        assert repr(Task(id=2, title="B")) == (
+            "Task(id=2, title='B', description='', is_complete=False)"
+        )
+    
+    def test_fields_are_keyword_only_and_slotted(self) -> None:
+        """Positional arguments and unknown attributes are rejected."""
+        with pytest.raises(TypeError):
+            Task(1, "A")  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            Task(id=1, title="A").extra = True  # type: ignore[attr-defined]
+    
+    def test_not_hashable(self) -> None:
+        """Mutable tasks cannot be used as dict keys."""
+        with pytest.raises(TypeError):
+            hash(Task(id=1, title="A"))
+    
+    def test_copy_is_independent(self) -> None:
+        """copy() returns an equal Task that can change on its own."""
+        task = Task(id=1, title="A", description="note", is_complete=True)
+        copy = task.copy()
+        copy.title = "B"
+        
+        assert copy is not task
+        assert task == Task(id=1, title="A", description="note", is_complete=True)
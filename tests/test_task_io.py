@@ -0,0 +1,89 @@
+"""Tests for streaming task import and export."""
+
+import io
+
+import pytest
+
+from src.models.task import Task
+from src.services.task_io import (
+    format_for_path,
+    read_csv,
+    read_jsonl,
+    write_csv,
+    write_jsonl,
+)
+from src.services.task_manager import TaskManager
+
+
+def _tasks() -> list[Task]:
+    return [
+        Task(id=1, title="Buy milk", description="2 litres"),
+        Task(id=2, title="Call, then email", is_complete=True),
+    ]
+
+
+class TestTaskIO:
+    """Tests for the JSONL and CSV readers and writers."""
+    
+    def test_jsonl_round_trip(self) -> None:
+        """Tasks written as JSONL read back as equivalent records."""
+        buffer = io.StringIO()
+        
+        written = write_jsonl(_tasks(), buffer)
+        buffer.seek(0)
+        records = list(read_jsonl(buffer))
+        
+        assert written == 2
+        assert records[0] == {
+            "id": 1,
+            "title": "Buy milk",
+            "description": "2 litres",
+            "is_complete": False,
+        }
+        assert records[1]["is_complete"] is True
+    
+    def test_csv_round_trip(self) -> None:
+        """Tasks written as CSV read back with quoting and status intact."""
+        buffer = io.StringIO()
+        
+        write_csv(_tasks(), buffer)
+        buffer.seek(0)
+        records = list(read_csv(buffer))
+        
+        assert [r["title"] for r in records] == ["Buy milk", "Call, then email"]
+        assert [r["is_complete"] for r in records] == [False, True]
+    
+    def test_jsonl_skips_blank_lines_and_reports_bad_lines(self) -> None:
+        """Blank lines are ignored; malformed lines name the line number."""
+        buffer = io.StringIO('{"title": "ok"}\n\nnot json\n')
+        
+        with pytest.raises(ValueError, match="Line 3"):
+            list(read_jsonl(buffer))
+    
+    def test_jsonl_reports_wrong_field_types(self) -> None:
+        """A string status or numeric title is an error naming the line."""
+        buffer = io.StringIO('{"title": "ok"}\n{"title": "x", "is_complete": "no"}\n')
+        
+        with pytest.raises(ValueError, match='Line 2: "is_complete" must be true'):
+            list(read_jsonl(buffer))
+        with pytest.raises(ValueError, match='Line 1: "title" must be a string'):
+            list(read_jsonl(io.StringIO('{"title": 5}\n')))
+    
+    def test_format_for_path(self) -> None:
+        """The format is chosen from the file suffix."""
+        assert format_for_path("tasks.jsonl") == "jsonl"
+        assert format_for_path("tasks.CSV") == "csv"
+        with pytest.raises(ValueError):
+            format_for_path("tasks.txt")
+    
+    def test_import_into_manager(self) -> None:
+        """Records from a reader feed TaskManager.add_tasks directly."""
+        manager = TaskManager()
+        buffer = io.StringIO()
+        write_csv(_tasks(), buffer)
+        buffer.seek(0)
+        
+        manager.add_tasks(read_csv(buffer))
+        
+        assert manager.get_stats().completed == 1
+        assert manager.get_task(2) is not None
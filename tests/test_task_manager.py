@@ -1,18 +1,55 @@
 """Tests for the TaskManager service."""
 
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
 import pytest
 
 from src.models.task import Task
-from src.services.task_manager import TaskManager, InMemoryStorage
+from src.services.cached_storage import CachedStorage
+from src.services.columnar_storage import ColumnarStorage
+from src.services.concurrent_storage import ConcurrentStorage
+from src.services.mmap_storage import MmapStorage
+from src.services.sqlite_storage import SQLiteStorage
+from src.services.task_manager import (
+    TaskManager,
+    InMemoryStorage,
+    TaskStats,
+    parse_id_ranges,
+)
+
+
+@pytest.fixture(
+    params=["memory", "sqlite", "concurrent", "columnar", "mmap", "cached"]
+)
+def manager(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> Iterator[TaskManager]:
+    """A TaskManager on each storage backend."""
+    if request.param == "sqlite":
+        storage = SQLiteStorage()
+        yield TaskManager(storage)
+        storage.close()
+    elif request.param == "concurrent":
+        yield TaskManager(ConcurrentStorage(shards=4))
+    elif request.param == "columnar":
+        yield TaskManager(ColumnarStorage())
+    elif request.param == "cached":
+        storage = SQLiteStorage()
+        yield TaskManager(CachedStorage(storage, capacity=4))
+        storage.close()
+    elif request.param == "mmap":
+        with MmapStorage(tmp_path / "tasks.tasks") as mmap_storage:
+            yield TaskManager(mmap_storage)
+    else:
+        yield TaskManager()
 
 
 class TestTaskManagerAddTask:
     """Tests for adding tasks."""
     
-    def test_add_task_returns_task(self) -> None:
+    def test_add_task_returns_task(self, manager: TaskManager) -> None:
         """Adding a task returns the created Task."""
-        manager = TaskManager()
-        
         task = manager.add_task("Test Task", "Description")
         
         assert isinstance(task, Task)
@@ -20,10 +57,8 @@ class TestTaskManagerAddTask:
         assert task.description == "Description"
         assert task.is_complete is False
     
-    def test_add_task_assigns_incremental_ids(self) -> None:
+    def test_add_task_assigns_incremental_ids(self, manager: TaskManager) -> None:
         """Tasks get incrementing IDs."""
-        manager = TaskManager()
-        
         task1 = manager.add_task("Task 1")
         task2 = manager.add_task("Task 2")
         task3 = manager.add_task("Task 3")
@@ -32,37 +67,87 @@ class TestTaskManagerAddTask:
         assert task2.id == 2
         assert task3.id == 3
     
-    def test_add_task_without_description(self) -> None:
+    def test_add_task_without_description(self, manager: TaskManager) -> None:
         """Task can be added without description."""
-        manager = TaskManager()
-        
         task = manager.add_task("Only Title")
         
         assert task.title == "Only Title"
         assert task.description == ""
     
-    def test_add_task_with_empty_title_raises_error(self) -> None:
+    def test_add_task_with_empty_title_raises_error(self, manager: TaskManager) -> None:
         """Empty title raises ValueError."""
-        manager = TaskManager()
-        
         with pytest.raises(ValueError):
             manager.add_task("")
 
 
+class TestTaskManagerBulk:
+    """Tests for bulk import and export."""
+    
+    def test_add_tasks_assigns_contiguous_ids(self, manager: TaskManager) -> None:
+        """Bulk-added tasks get sequential IDs across batches."""
+        manager.add_task("Existing")
+        records = [{"title": f"Task {n}", "description": "bulk"} for n in range(5)]
+        
+        created = manager.add_tasks(records, batch_size=2)
+        
+        assert created == 5
+        assert [t.id for t in manager.get_all_tasks()] == [1, 2, 3, 4, 5, 6]
+        assert manager.add_task("Next").id == 7
+    
+    def test_add_tasks_keeps_completion_status(self, manager: TaskManager) -> None:
+        """Records can import already-completed tasks."""
+        manager.add_tasks(
+            iter([{"title": "Done", "is_complete": True}, {"title": "Open"}])
+        )
+        
+        assert manager.get_stats() == TaskStats(total=2, completed=1)
+    
+    def test_add_tasks_invalid_record_raises(self, manager: TaskManager) -> None:
+        """An invalid record raises ValueError and keeps earlier batches."""
+        records = [{"title": "Good"}, {"title": "   "}]
+        
+        with pytest.raises(ValueError):
+            manager.add_tasks(records, batch_size=1)
+        
+        assert [t.title for t in manager.get_all_tasks()] == ["Good"]
+        assert manager.add_task("Next").id == 2
+    
+    @pytest.mark.parametrize(
+        "record",
+        [
+            {"title": 5},
+            {"title": "T", "description": 1},
+            {"title": "T", "is_complete": "false"},
+        ],
+    )
+    def test_add_tasks_rejects_wrong_types(
+        self, manager: TaskManager, record: dict[str, object]
+    ) -> None:
+        """Non-string text and non-bool status raise ValueError, not a crash."""
+        with pytest.raises(ValueError, match="Invalid task record"):
+            manager.add_tasks([record])
+        
+        assert manager.get_task_count() == 0
+    
+    def test_export_tasks_streams_in_id_order(self, manager: TaskManager) -> None:
+        """Export yields every task in ID order."""
+        manager.add_tasks([{"title": "A"}, {"title": "B"}, {"title": "C"}])
+        manager.delete_task(2)
+        
+        assert [t.title for t in manager.export_tasks()] == ["A", "C"]
+
+
 class TestTaskManagerGetTasks:
     """Tests for retrieving tasks."""
     
-    def test_get_all_tasks_empty(self) -> None:
+    def test_get_all_tasks_empty(self, manager: TaskManager) -> None:
         """Getting all tasks from empty manager returns empty list."""
-        manager = TaskManager()
-        
         tasks = manager.get_all_tasks()
         
         assert tasks == []
     
-    def test_get_all_tasks_returns_all(self) -> None:
+    def test_get_all_tasks_returns_all(self, manager: TaskManager) -> None:
         """All added tasks are returned."""
-        manager = TaskManager()
         manager.add_task("Task 1")
         manager.add_task("Task 2")
         manager.add_task("Task 3")
@@ -71,9 +156,8 @@ class TestTaskManagerGetTasks:
         
         assert len(tasks) == 3
     
-    def test_get_all_tasks_sorted_by_id(self) -> None:
+    def test_get_all_tasks_sorted_by_id(self, manager: TaskManager) -> None:
         """Tasks are returned sorted by ID."""
-        manager = TaskManager()
         manager.add_task("First")
         manager.add_task("Second")
         manager.add_task("Third")
@@ -82,9 +166,8 @@ class TestTaskManagerGetTasks:
         
         assert [t.id for t in tasks] == [1, 2, 3]
     
-    def test_get_task_by_id(self) -> None:
+    def test_get_task_by_id(self, manager: TaskManager) -> None:
         """Can retrieve specific task by ID."""
-        manager = TaskManager()
         manager.add_task("Task 1")
         manager.add_task("Target Task", "Find me")
         manager.add_task("Task 3")
@@ -95,9 +178,8 @@ class TestTaskManagerGetTasks:
         assert task.title == "Target Task"
         assert task.description == "Find me"
     
-    def test_get_task_not_found(self) -> None:
+    def test_get_task_not_found(self, manager: TaskManager) -> None:
         """Getting non-existent task returns None."""
-        manager = TaskManager()
         manager.add_task("Task 1")
         
         task = manager.get_task(999)
@@ -105,12 +187,166 @@ class TestTaskManagerGetTasks:
         assert task is None
 
 
+class TestTaskManagerIterTasks:
+    """Tests for lazy, ordered iteration."""
+    
+    def test_iter_tasks_yields_in_id_order(self, manager: TaskManager) -> None:
+        """All tasks are yielded in ID order by default."""
+        manager.add_tasks({"title": f"Task {n}"} for n in range(5))
+        
+        assert [t.id for t in manager.iter_tasks()] == [1, 2, 3, 4, 5]
+    
+    def test_iter_tasks_start_id_and_limit(self, manager: TaskManager) -> None:
+        """start_id is inclusive and limit caps the number yielded."""
+        manager.add_tasks({"title": f"Task {n}"} for n in range(10))
+        manager.delete_task(4)
+        
+        tasks = manager.iter_tasks(start_id=4, limit=3)
+        
+        assert [t.id for t in tasks] == [5, 6, 7]
+    
+    def test_iter_tasks_limit_applies_after_predicate(
+        self, manager: TaskManager
+    ) -> None:
+        """The limit counts matching tasks, not scanned ones."""
+        manager.add_tasks({"title": f"Task {n}"} for n in range(10))
+        
+        tasks = manager.iter_tasks(limit=2, predicate=lambda t: t.id % 3 == 0)
+        
+        assert [t.id for t in tasks] == [3, 6]
+    
+    def test_iter_tasks_zero_limit(self, manager: TaskManager) -> None:
+        """A zero limit yields nothing."""
+        manager.add_task("Task")
+        
+        assert list(manager.iter_tasks(limit=0)) == []
+    
+    def test_iter_tasks_is_lazy(self, manager: TaskManager) -> None:
+        """Tasks are produced on demand, not as a prebuilt list."""
+        manager.add_tasks({"title": f"Task {n}"} for n in range(3))
+        
+        tasks = manager.iter_tasks()
+        
+        assert not isinstance(tasks, list)
+        assert next(tasks).id == 1
+
+
+class TestTaskManagerPaging:
+    """Tests for keyset pagination."""
+    
+    def test_first_page(self, manager: TaskManager) -> None:
+        """The first page has no previous page and knows there is more."""
+        manager.add_tasks({"title": f"Task {n}"} for n in range(5))
+        
+        page = manager.get_page(limit=2)
+        
+        assert [t.id for t in page.tasks] == [1, 2]
+        assert page.has_previous is False
+        assert page.has_next is True
+    
+    def test_next_and_last_page(self, manager: TaskManager) -> None:
+        """Moving forward from last_id reaches the final page."""
+        manager.add_tasks({"title": f"Task {n}"} for n in range(5))
+        
+        page = manager.get_page(limit=2)
+        page = manager.get_page(page.last_id + 1, limit=2)
+        page = manager.get_page(page.last_id + 1, limit=2)
+        
+        assert [t.id for t in page.tasks] == [5]
+        assert page.has_previous is True
+        assert page.has_next is False
+    
+    def test_page_before(self, manager: TaskManager) -> None:
+        """Moving back from first_id returns the preceding tasks in order."""
+        manager.add_tasks({"title": f"Task {n}"} for n in range(6))
+        manager.delete_task(2)
+        
+        page = manager.get_page_before(6, limit=2)
+        
+        assert [t.id for t in page.tasks] == [4, 5]
+        assert page.has_previous is True
+        assert page.has_next is True
+    
+    def test_page_before_near_start_returns_first_page(
+        self, manager: TaskManager
+    ) -> None:
+        """A short backward page snaps to a full first page."""
+        manager.add_tasks({"title": f"Task {n}"} for n in range(5))
+        
+        page = manager.get_page_before(2, limit=3)
+        
+        assert [t.id for t in page.tasks] == [1, 2, 3]
+        assert page.has_previous is False
+    
+    def test_reverse_iteration(self, manager: TaskManager) -> None:
+        """reverse yields descending IDs at or below start_id."""
+        manager.add_tasks({"title": f"Task {n}"} for n in range(5))
+        
+        tasks = manager.iter_tasks(start_id=4, limit=2, reverse=True)
+        
+        assert [t.id for t in tasks] == [4, 3]
+
+
+class TestTaskManagerStatusFilter:
+    """Tests for filtering tasks by completion status."""
+    
+    def _populate(self, manager: TaskManager) -> None:
+        manager.add_tasks({"title": f"Task {n}"} for n in range(1, 21))
+        for task_id in (3, 7, 8, 15):
+            manager.toggle_complete(task_id)
+    
+    def test_get_completed_tasks(self, manager: TaskManager) -> None:
+        """Only completed tasks are returned, in ID order."""
+        self._populate(manager)
+        
+        tasks = manager.get_tasks(status="completed")
+        
+        assert [t.id for t in tasks] == [3, 7, 8, 15]
+    
+    def test_get_pending_tasks_with_start_and_limit(
+        self, manager: TaskManager
+    ) -> None:
+        """Pending tasks can be paged with start_id and limit."""
+        self._populate(manager)
+        
+        tasks = manager.get_tasks(status="pending", start_id=6, limit=3)
+        
+        assert [t.id for t in tasks] == [6, 9, 10]
+    
+    def test_toggle_moves_task_between_statuses(self, manager: TaskManager) -> None:
+        """Toggling moves a task from one filtered view to the other."""
+        self._populate(manager)
+        
+        manager.toggle_complete(7)
+        manager.toggle_complete(1)
+        manager.delete_task(15)
+        
+        assert [t.id for t in manager.get_tasks(status="completed")] == [1, 3, 8]
+        assert 7 in [t.id for t in manager.get_tasks(status="pending")]
+    
+    def test_status_pages(self, manager: TaskManager) -> None:
+        """Keyset paging works within a status."""
+        self._populate(manager)
+        
+        first = manager.get_page(limit=2, status="completed")
+        second = manager.get_page(first.last_id + 1, limit=2, status="completed")
+        back = manager.get_page_before(second.first_id, limit=2, status="completed")
+        
+        assert [t.id for t in second.tasks] == [8, 15]
+        assert second.has_next is False
+        assert [t.id for t in back.tasks] == [3, 7]
+    
+    def test_unknown_status_raises(self, manager: TaskManager) -> None:
+        """An unknown status name raises ValueError."""
+        with pytest.raises(ValueError):
+            manager.get_tasks(status="archived")  # type: ignore[arg-type]
+
+
 class TestTaskManagerUpdateTask:
     """Tests for updating tasks."""
     
-    def test_update_task_title(self) -> None:
+    def test_update_task_title(self, manager: TaskManager) -> None:
         """Task title can be updated."""
-        manager = TaskManager()
         manager.add_task("Original Title")
         
         result = manager.update_task(1, title="Updated Title")
@@ -120,9 +356,8 @@ class TestTaskManagerUpdateTask:
         assert task is not None
         assert task.title == "Updated Title"
     
-    def test_update_task_description(self) -> None:
+    def test_update_task_description(self, manager: TaskManager) -> None:
         """Task description can be updated."""
-        manager = TaskManager()
         manager.add_task("Title", "Original Desc")
         
         result = manager.update_task(1, description="Updated Desc")
@@ -132,9 +367,8 @@ class TestTaskManagerUpdateTask:
         assert task is not None
         assert task.description == "Updated Desc"
     
-    def test_update_task_both_fields(self) -> None:
+    def test_update_task_both_fields(self, manager: TaskManager) -> None:
         """Both title and description can be updated together."""
-        manager = TaskManager()
         manager.add_task("Old Title", "Old Desc")
         
         result = manager.update_task(1, title="New Title", description="New Desc")
@@ -145,9 +379,8 @@ class TestTaskManagerUpdateTask:
         assert task.title == "New Title"
         assert task.description == "New Desc"
     
-    def test_update_preserves_completion_status(self) -> None:
+    def test_update_preserves_completion_status(self, manager: TaskManager) -> None:
         """Update preserves is_complete status."""
-        manager = TaskManager()
         manager.add_task("Task")
         manager.toggle_complete(1)  # Mark complete
         
@@ -157,10 +390,8 @@ class TestTaskManagerUpdateTask:
         assert task is not None
         assert task.is_complete is True
     
-    def test_update_task_not_found(self) -> None:
+    def test_update_task_not_found(self, manager: TaskManager) -> None:
         """Updating non-existent task returns False."""
-        manager = TaskManager()
-        
         result = manager.update_task(999, title="Nope")
         
         assert result is False
@@ -169,9 +400,8 @@ class TestTaskManagerUpdateTask:
 class TestTaskManagerDeleteTask:
     """Tests for deleting tasks."""
     
-    def test_delete_task(self) -> None:
+    def test_delete_task(self, manager: TaskManager) -> None:
         """Task can be deleted by ID."""
-        manager = TaskManager()
         manager.add_task("To Delete")
         
         result = manager.delete_task(1)
@@ -180,9 +410,8 @@ class TestTaskManagerDeleteTask:
         assert manager.get_task(1) is None
         assert manager.get_task_count() == 0
     
-    def test_delete_task_not_found(self) -> None:
+    def test_delete_task_not_found(self, manager: TaskManager) -> None:
         """Deleting non-existent task returns False."""
-        manager = TaskManager()
         manager.add_task("Task 1")
         
         result = manager.delete_task(999)
@@ -190,9 +419,8 @@ class TestTaskManagerDeleteTask:
         assert result is False
         assert manager.get_task_count() == 1
     
-    def test_delete_task_preserves_others(self) -> None:
+    def test_delete_task_preserves_others(self, manager: TaskManager) -> None:
         """Deleting one task preserves other tasks."""
-        manager = TaskManager()
         manager.add_task("Task 1")
         manager.add_task("Task 2")
         manager.add_task("Task 3")
@@ -207,9 +435,8 @@ class TestTaskManagerDeleteTask:
 class TestTaskManagerToggleComplete:
     """Tests for toggling completion status."""
     
-    def test_toggle_incomplete_to_complete(self) -> None:
+    def test_toggle_incomplete_to_complete(self, manager: TaskManager) -> None:
         """Incomplete task can be marked complete."""
-        manager = TaskManager()
         manager.add_task("Task")
         
         result = manager.toggle_complete(1)
@@ -219,9 +446,8 @@ class TestTaskManagerToggleComplete:
         assert task is not None
         assert task.is_complete is True
     
-    def test_toggle_complete_to_incomplete(self) -> None:
+    def test_toggle_complete_to_incomplete(self, manager: TaskManager) -> None:
         """Complete task can be marked incomplete."""
-        manager = TaskManager()
         manager.add_task("Task")
         manager.toggle_complete(1)  # Now complete
         
@@ -232,41 +458,281 @@ class TestTaskManagerToggleComplete:
         assert task is not None
         assert task.is_complete is False
     
-    def test_toggle_task_not_found(self) -> None:
+    def test_toggle_task_not_found(self, manager: TaskManager) -> None:
         """Toggling non-existent task returns False."""
-        manager = TaskManager()
-        
         result = manager.toggle_complete(999)
         
         assert result is False
 
 
+class TestTaskManagerBatch:
+    """Tests for delete_tasks and toggle_tasks."""
+    
+    def test_delete_tasks_reports_each_id(self, manager: TaskManager) -> None:
+        """Found IDs are deleted; missing ones are reported as False."""
+        manager.add_tasks({"title": f"Task {n}"} for n in range(1, 11))
+        
+        results = manager.delete_tasks("2-4,9,42")
+        
+        assert results == {2: True, 3: True, 4: True, 9: True, 42: False}
+        assert [t.id for t in manager.get_all_tasks()] == [1, 5, 6, 7, 8, 10]
+        assert manager.get_task_count() == 6
+    
+    def test_delete_tasks_large_batch(self, manager: TaskManager) -> None:
+        """A batch larger than the in-place threshold keeps the order intact."""
+        manager.add_tasks({"title": f"Task {n}"} for n in range(1, 301))
+        
+        results = manager.delete_tasks(range(1, 300, 2))
+        
+        assert all(results.values())
+        assert [t.id for t in manager.iter_tasks(limit=3)] == [2, 4, 6]
+        assert manager.get_task_count() == 150
+    
+    def test_toggle_tasks_sets_one_state(self, manager: TaskManager) -> None:
+        """Every found task ends up in the requested state."""
+        manager.add_tasks({"title": f"Task {n}"} for n in range(1, 6))
+        manager.toggle_complete(2)
+        
+        assert manager.toggle_tasks([1, 2, 3, 8]) == {
+            1: True,
+            2: True,
+            3: True,
+            8: False,
+        }
+        assert manager.get_stats() == TaskStats(total=5, completed=3)
+        
+        manager.toggle_tasks("1-5", complete=False)
+        assert manager.get_completed_count() == 0
+    
+    def test_batch_ids_are_deduplicated(self, manager: TaskManager) -> None:
+        """An ID given twice is handled once."""
+        manager.add_task("Task")
+        
+        assert manager.delete_tasks([1, 1]) == {1: True}
+    
+    def test_delete_tasks_updates_search(self, manager: TaskManager) -> None:
+        """Tasks deleted in a batch no longer match searches."""
+        manager.add_tasks({"title": f"Report {n}"} for n in range(1, 5))
+        manager.search("report")
+        
+        manager.delete_tasks("1-2")
+        
+        assert [t.id for t in manager.search("report")] == [3, 4]
+    
+    def test_fallback_without_batch_methods(self) -> None:
+        """Storage without delete_many/update_many is handled per ID."""
+        class PerIdStorage(InMemoryStorage):
+            delete_many = None  # type: ignore[assignment]
+            update_many = None  # type: ignore[assignment]
+        
+        manager = TaskManager(PerIdStorage())
+        manager.add_tasks({"title": f"Task {n}"} for n in range(1, 4))
+        
+        assert manager.toggle_tasks("1,3") == {1: True, 3: True}
+        assert manager.get_stats() == TaskStats(total=3, completed=2)
+        assert manager.delete_tasks("2-5") == {2: True, 3: True, 4: False, 5: False}
+        assert [(t.id, t.is_complete) for t in manager.get_all_tasks()] == [(1, True)]
+        assert manager.get_stats() == TaskStats(total=1, completed=1)
+    
+    def test_fallback_saves_new_tasks(self) -> None:
+        """Without update_fields, the stored task object is not mutated."""
+        class SaveOnlyStorage(InMemoryStorage):
+            update_many = None  # type: ignore[assignment]
+            update_fields = None  # type: ignore[assignment]
+        
+        manager = TaskManager(SaveOnlyStorage())
+        manager.add_tasks({"title": f"Task {n}"} for n in range(1, 4))
+        stored = manager.get_task(2)
+        
+        assert manager.toggle_tasks("1-3") == {1: True, 2: True, 3: True}
+        
+        assert manager.get_stats() == TaskStats(total=3, completed=3)
+        assert stored is not None and stored.is_complete is False
+
+
+class TestTaskManagerHistory:
+    """Tests for undo and redo."""
+    
+    def test_undo_redo_add(self, manager: TaskManager) -> None:
+        """Undoing adds removes the tasks; redo brings them back."""
+        manager.enable_history()
+        manager.add_task("Single")
+        manager.add_tasks(({"title": f"Bulk {n}"} for n in range(5)), batch_size=2)
+        
+        assert manager.undo() == "add 5 tasks"
+        assert [t.id for t in manager.get_all_tasks()] == [1]
+        assert manager.undo() == "add task 1"
+        assert manager.get_task_count() == 0
+        assert manager.redo() == "add task 1"
+        assert manager.redo() == "add 5 tasks"
+        assert [t.title for t in manager.get_all_tasks()][-1] == "Bulk 4"
+        assert manager.redo() is None
+    
+    def test_undo_update_and_toggle(self, manager: TaskManager) -> None:
+        """Old field values and statuses are restored."""
+        manager.enable_history()
+        manager.add_task("Original", "Old notes")
+        manager.update_task(1, title="Renamed")
+        manager.toggle_complete(1)
+        
+        assert manager.undo() == "toggle task 1"
+        assert manager.undo() == "update task 1"
+        task = manager.get_task(1)
+        assert task is not None
+        assert (task.title, task.description, task.is_complete) == (
+            "Original", "Old notes", False
+        )
+        manager.redo()
+        manager.redo()
+        assert manager.get_task(1) == Task(
+            id=1, title="Renamed", description="Old notes", is_complete=True
+        )
+    
+    def test_undo_batch_delete_and_toggle(self, manager: TaskManager) -> None:
+        """Batches are reverted as a whole, leaving untouched tasks alone."""
+        manager.enable_history()
+        manager.add_tasks({"title": f"Task {n}"} for n in range(1, 11))
+        manager.toggle_complete(2)
+        manager.toggle_tasks("1-4")
+        manager.delete_tasks("3-6,42")
+        
+        assert manager.undo() == "delete 4 tasks"
+        assert manager.get_task_count() == 10
+        assert manager.undo() == "mark 3 tasks complete"
+        completed = [t.id for t in manager.iter_tasks(status="completed")]
+        assert completed == [2]
+        assert manager.redo() == "mark 3 tasks complete"
+        assert manager.redo() == "delete 4 tasks"
+        assert [t.id for t in manager.get_all_tasks()] == [1, 2, 7, 8, 9, 10]
+    
+    def test_undo_restores_search_index(self, manager: TaskManager) -> None:
+        """Undone deletes and renames are searchable again."""
+        manager.enable_history()
+        manager.add_tasks([{"title": "Buy milk"}, {"title": "Walk dog"}])
+        manager.search("milk")
+        manager.update_task(1, title="Buy bread")
+        manager.delete_task(2)
+        
+        manager.undo()
+        manager.undo()
+        
+        assert [t.id for t in manager.search("milk")] == [1]
+        assert manager.search("bread") == []
+        assert [t.id for t in manager.search("dog")] == [2]
+    
+    def test_depth_limits_undo(self, manager: TaskManager) -> None:
+        """Only the latest ``depth`` changes can be undone."""
+        manager.enable_history(depth=2)
+        for n in range(4):
+            manager.add_task(f"Task {n}")
+        
+        assert manager.undo() and manager.undo()
+        assert manager.undo() is None
+        assert manager.get_task_count() == 2
+    
+    def test_disabled_by_default(self, manager: TaskManager) -> None:
+        """Without enable_history nothing is logged."""
+        manager.add_task("Task")
+        
+        assert not manager.history_enabled
+        assert (manager.can_undo, manager.undo()) == (False, None)
+    
+    def test_bulk_delete_restored_in_one_call(self) -> None:
+        """Undoing a delete_tasks batch calls save_many once."""
+        class CountingStorage(InMemoryStorage):
+            save_many_calls = 0
+            
+            def save_many(self, tasks: Iterable[Task]) -> None:
+                self.save_many_calls += 1
+                super().save_many(tasks)
+        
+        storage = CountingStorage()
+        manager = TaskManager(storage)
+        manager.add_tasks({"title": f"Task {n}"} for n in range(1, 5001))
+        manager.enable_history()
+        manager.delete_tasks("1-5000")
+        calls = storage.save_many_calls
+        
+        manager.undo()
+        
+        assert storage.save_many_calls == calls + 1
+        assert manager.get_task_count() == 5000
+
+
+class TestParseIdRanges:
+    """Tests for the ID range syntax."""
+    
+    def test_ids_and_ranges(self) -> None:
+        """Single IDs and inclusive ranges keep their order."""
+        assert parse_id_ranges("7,1-3, 10 5-5") == [7, 1, 2, 3, 10, 5]
+    
+    def test_duplicates_are_dropped(self) -> None:
+        """Overlapping ranges yield each ID once."""
+        assert parse_id_ranges("1-3,2-4") == [1, 2, 3, 4]
+    
+    @pytest.mark.parametrize("text", ["", "abc", "0", "5-2", "1-", "-3", "1-2-3"])
+    def test_invalid_text_raises(self, text: str) -> None:
+        """Malformed items, zero and reversed ranges are rejected."""
+        with pytest.raises(ValueError):
+            parse_id_ranges(text)
+    
+    def test_huge_range_raises(self) -> None:
+        """A range beyond the batch cap fails without building the list."""
+        with pytest.raises(ValueError, match="at most"):
+            parse_id_ranges("1-10000000000")
+
+
+class TestTaskManagerSearch:
+    """Tests for full-text search."""
+    
+    def test_search_finds_title_and_description(self, manager: TaskManager) -> None:
+        """Search matches words in titles and descriptions."""
+        manager.add_task("Buy groceries", "Milk and eggs")
+        manager.add_task("Walk the dog")
+        
+        assert [t.id for t in manager.search("milk")] == [1]
+        assert [t.id for t in manager.search("DOG")] == [2]
+    
+    def test_search_follows_changes(self, manager: TaskManager) -> None:
+        """Adds, updates and deletes after the first search are reflected."""
+        manager.add_task("Buy groceries")
+        manager.search("anything")
+        
+        manager.add_task("Groom the cat")
+        manager.add_tasks([{"title": "Grocery list"}])
+        manager.update_task(1, title="Buy flowers")
+        manager.delete_task(2)
+        
+        assert [t.title for t in manager.search("gro")] == ["Grocery list"]
+        assert [t.id for t in manager.search("flowers")] == [1]
+    
+    def test_search_limit(self, manager: TaskManager) -> None:
+        """limit caps the number of results."""
+        manager.add_tasks({"title": f"Report {n}"} for n in range(5))
+        
+        assert [t.id for t in manager.search("report", limit=2)] == [1, 2]
+
+
 class TestTaskManagerCounts:
     """Tests for count methods."""
     
-    def test_task_count_empty(self) -> None:
+    def test_task_count_empty(self, manager: TaskManager) -> None:
         """Empty manager has 0 tasks."""
-        manager = TaskManager()
-        
         assert manager.get_task_count() == 0
     
-    def test_task_count(self) -> None:
+    def test_task_count(self, manager: TaskManager) -> None:
         """Task count reflects added tasks."""
-        manager = TaskManager()
         manager.add_task("Task 1")
         manager.add_task("Task 2")
         
         assert manager.get_task_count() == 2
     
-    def test_completed_count_empty(self) -> None:
+    def test_completed_count_empty(self, manager: TaskManager) -> None:
         """Empty manager has 0 completed tasks."""
-        manager = TaskManager()
-        
         assert manager.get_completed_count() == 0
     
-    def test_completed_count(self) -> None:
+    def test_completed_count(self, manager: TaskManager) -> None:
         """Completed count reflects completed tasks."""
-        manager = TaskManager()
         manager.add_task("Task 1")
         manager.add_task("Task 2")
         manager.add_task("Task 3")
@@ -274,6 +740,51 @@ class TestTaskManagerCounts:
         manager.toggle_complete(3)
         
         assert manager.get_completed_count() == 2
+    
+    def test_stats(self, manager: TaskManager) -> None:
+        """Stats report total, completed and pending counts."""
+        manager.add_task("Task 1")
+        manager.add_task("Task 2")
+        manager.add_task("Task 3")
+        manager.toggle_complete(2)
+        
+        stats = manager.get_stats()
+        
+        assert stats == TaskStats(total=3, completed=1)
+        assert stats.pending == 2
+    
+    def test_stats_track_toggle_and_delete(self, manager: TaskManager) -> None:
+        """Counters follow toggles back and forth and deletions."""
+        manager.add_task("Task 1")
+        manager.add_task("Task 2")
+        manager.toggle_complete(1)
+        manager.toggle_complete(2)
+        manager.toggle_complete(2)
+        manager.delete_task(1)
+        
+        assert manager.get_stats() == TaskStats(total=1, completed=0)
+    
+    def test_counts_fall_back_to_scan(self) -> None:
+        """Backends without count()/stats() are counted by scanning."""
+        
+        class ScanOnlyStorage:
+            def __init__(self) -> None:
+                self._inner = InMemoryStorage()
+                self.save = self._inner.save
+                self.delete = self._inner.delete
+                self.get_all = self._inner.get_all
+                self.get_by_id = self._inner.get_by_id
+        
+        manager = TaskManager(storage=ScanOnlyStorage())
+        manager.add_task("Task 1")
+        manager.add_task("Task 2")
+        manager.toggle_complete(1)
+        
+        assert manager.get_task_count() == 2
+        assert manager.get_completed_count() == 1
+        assert manager.get_stats().pending == 1
+        assert [t.id for t in manager.iter_tasks(start_id=2, limit=5)] == [2]
+        assert [t.id for t in manager.get_tasks(status="completed")] == [1]
 
 
 class TestInMemoryStorage:
@@ -290,6 +801,30 @@ class TestInMemoryStorage:
         assert retrieved is not None
         assert retrieved.title == "Test"
     
+    def test_save_many_merges_lower_ids(self) -> None:
+        """A batch of IDs below the maximum is merged into ID order."""
+        storage = InMemoryStorage()
+        storage.save_many(Task(id=n, title=f"T{n}") for n in range(0, 400, 2))
+        
+        storage.save_many(Task(id=n, title=f"T{n}") for n in range(399, 0, -2))
+        
+        assert [t.id for t in storage.iter_tasks()] == list(range(400))
+        assert storage.get_all()[1].title == "T1"
+    
+    def test_deep_page_does_not_walk_prefix(self) -> None:
+        """A page far into the index is read by position, not by iterating."""
+        class NoScanList(list):
+            def __iter__(self) -> Iterator[int]:
+                raise AssertionError("ID index was iterated from the start")
+        
+        storage = InMemoryStorage()
+        storage.save_many(Task(id=n, title=f"T{n}") for n in range(1, 1001))
+        storage._ids = NoScanList(storage._ids)
+        
+        tasks = storage.iter_tasks(start_id=990, limit=3)
+        
+        assert [t.id for t in tasks] == [990, 991, 992]
+    
     def test_delete(self) -> None:
         """Can delete tasks."""
         storage = InMemoryStorage()
@@ -311,3 +846,130 @@ class TestInMemoryStorage:
         tasks = storage.get_all()
         
         assert [t.id for t in tasks] == [1, 2, 3]
+    
+    def test_get_all_sorted_after_deletes(self) -> None:
+        """ID order is kept when tasks are deleted from the middle and end."""
+        storage = InMemoryStorage()
+        for task_id in (1, 2, 3, 4, 5):
+            storage.save(Task(id=task_id, title=f"Task {task_id}"))
+        
+        storage.delete(3)
+        storage.delete(5)
+        storage.save(Task(id=3, title="Back again"))
+        
+        assert [t.id for t in storage.get_all()] == [1, 2, 3, 4]
+    
+    def test_save_existing_id_replaces_task(self) -> None:
+        """Saving an existing ID replaces the task without duplicating it."""
+        storage = InMemoryStorage()
+        storage.save(Task(id=1, title="Old"))
+        storage.save(Task(id=1, title="New"))
+        
+        tasks = storage.get_all()
+        
+        assert len(tasks) == 1
+        assert tasks[0].title == "New"
+    
+    def test_iterate_in_id_order(self) -> None:
+        """Iterating the storage yields tasks in ID order."""
+        storage = InMemoryStorage()
+        storage.save(Task(id=2, title="Second"))
+        storage.save(Task(id=1, title="First"))
+        
+        assert [t.id for t in storage] == [1, 2]
+        assert len(storage) == 2
+    
+    def test_iter_tasks_sparse_and_dense_status(self) -> None:
+        """Small and large status sets give the same ordered results."""
+        storage = InMemoryStorage()
+        for task_id in range(1, 41):
+            storage.save(Task(id=task_id, title="Task", is_complete=task_id in (5, 30)))
+        
+        completed = storage.iter_tasks(is_complete=True, reverse=True)
+        pending = storage.iter_tasks(start_id=4, limit=3, is_complete=False)
+        
+        assert [t.id for t in completed] == [30, 5]
+        assert [t.id for t in pending] == [4, 6, 7]
+    
+    def test_sparse_status_list_tracks_changes_without_sorting(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A sparse status list is sorted once and then kept up to date."""
+        storage = InMemoryStorage()
+        for task_id in range(1, 101):
+            storage.save(Task(id=task_id, title="Task", is_complete=task_id % 20 == 0))
+        completed = storage.iter_tasks(is_complete=True)
+        assert [t.id for t in completed] == [20, 40, 60, 80, 100]
+        
+        def no_sort(*args: object, **kwargs: object) -> list[int]:
+            raise AssertionError("status pages must not sort")
+        
+        monkeypatch.setattr("builtins.sorted", no_sort)
+        storage.toggle(7)
+        storage.update_fields(40, is_complete=False)
+        storage.delete(100)
+        storage.save(Task(id=101, title="Task", is_complete=True))
+        
+        completed = storage.iter_tasks(is_complete=True)
+        assert [t.id for t in completed] == [7, 20, 60, 80, 101]
+        assert [t.id for t in storage.iter_tasks(60, 2, is_complete=True)] == [60, 80]
+    
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_delete_while_iterating(self, reverse: bool) -> None:
+        """Deleting each task as it is yielded visits every task once."""
+        manager = TaskManager()
+        manager.add_tasks({"title": f"Task {n}"} for n in range(100))
+        
+        walked = []
+        for task in manager.iter_tasks(reverse=reverse):
+            walked.append(task.id)
+            manager.delete_task(task.id)
+        
+        assert walked == sorted(range(1, 101), reverse=reverse)
+        assert manager.get_task_count() == 0
+    
+    def test_batch_delete_while_iterating(self) -> None:
+        """A large delete_many mid-iteration is seen by the iterator."""
+        storage = InMemoryStorage()
+        storage.save_many(Task(id=n, title="Task") for n in range(1, 201))
+        
+        walked = []
+        for task in storage.iter_tasks():
+            walked.append(task.id)
+            if task.id == 10:
+                storage.delete_many(range(11, 200))
+        
+        assert walked == [*range(1, 11), 200]
+    
+    def test_sparse_status_walk_survives_toggles(self) -> None:
+        """Completing tasks while walking the pending ones skips none."""
+        storage = InMemoryStorage()
+        for task_id in range(1, 101):
+            storage.save(Task(id=task_id, title="Task", is_complete=task_id > 5))
+        
+        walked = []
+        for task in storage.iter_tasks(is_complete=False):
+            walked.append(task.id)
+            storage.toggle(task.id)
+        
+        assert walked == [1, 2, 3, 4, 5]
+        assert storage.stats().completed == 100
+    
+    def test_update_fields_in_place(self) -> None:
+        """update_fields mutates the stored task and moves its status."""
+        storage = InMemoryStorage()
+        task = Task(id=1, title="Task")
+        storage.save(task)
+        
+        result = storage.update_fields(1, is_complete=True, description=" note ")
+        
+        assert result is True
+        assert storage.get_by_id(1) is task
+        assert task.is_complete is True
+        assert task.description == "note"
+        assert [t.id for t in storage.iter_tasks(is_complete=True)] == [1]
+        assert storage.stats() == TaskStats(total=1, completed=1)
+    
+    def test_update_fields_missing_task(self) -> None:
+        """update_fields returns False for an unknown ID."""
+        assert InMemoryStorage().update_fields(1, is_complete=True) is False